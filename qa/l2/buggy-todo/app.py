@@ -1,29 +1,190 @@
-from flask import Flask, render_template, request, redirect, url_for, jsonify
+import atexit
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from itertools import islice
+
+from flask import (Flask, Response, abort, get_template_attribute, render_template,
+                   request, redirect, url_for, jsonify)
+
+from store import TaskStore
 
 app = Flask(__name__)
 
-# == In-memory "DB" ==
-tasks = []
-_next_id = 1
+# == Заложенные баги (материал лабораторной) ==
+# Хранилище их не исправляет, а воспроизводит:
+#   /add            - принимает пустое название;
+#   /toggle/<id>    - id трактуется как индекс в списке задач (store.at),
+#                     а не как id: переключается не та задача, 404 для
+#                     больших id;
+#   /delete/<id>    - удаляет задачу с title == str(id), а не по id;
+#                     если ничего не нашлось, отвечает 200 вместо 404;
+#   /edit/<id>      - добавляет новую задачу вместо правки существующей;
+#   index.html      - удаление без подтверждения, <li> убирается при любом
+#                     ответе сервера.
+# test_store.py::test_seeded_bugs проверяет, что все они на месте.
+
+# == "DB" ==
+def make_store(kind=None):
+    """
+    Хранилище выбирается переменной TODO_STORE:
+      memory (по умолчанию) - в памяти процесса;
+      wal    - журнал + снимки в каталоге TODO_DATA_DIR (data);
+      sqlite - файл SQLite TODO_DB (todo.db).
+    TODO_DATA_DIR без TODO_STORE по-прежнему включает wal.
+    """
+    kind = kind or os.environ.get('TODO_STORE')
+    if kind is None:
+        kind = 'wal' if os.environ.get('TODO_DATA_DIR') else 'memory'
+    if kind == 'memory':
+        return TaskStore()
+    if kind == 'wal':
+        from wal_store import WalTaskStore
+        store = WalTaskStore(os.environ.get('TODO_DATA_DIR', 'data'))
+    elif kind == 'sqlite':
+        from sqlite_store import SqliteTaskStore
+        store = SqliteTaskStore(os.environ.get('TODO_DB', 'todo.db'))
+    else:
+        raise ValueError(f'unknown TODO_STORE: {kind}')
+    atexit.register(store.close)
+    return store
+
+store = make_store()
+
+# размер страницы на главной и во фрагментах
+PAGE_SIZE = 100
+
+# максимум операций в одном запросе /api/batch
+BATCH_LIMIT = 10000
+
+# ?status=... -> значение done для фильтра (None = без фильтра)
+STATUS_FILTERS = {'all': None, 'active': False, 'done': True}
+
+def _status_arg():
+    status = request.args.get('status', 'all')
+    if status not in STATUS_FILTERS:
+        abort(400, f'unknown status: {status}')
+    return status
+
+def _int_arg(name, minimum=0):
+    raw = request.args.get(name)
+    if raw is None or raw == '':
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        abort(400, f'{name} must be an integer')
+    if value < minimum:
+        abort(400, f'{name} must be >= {minimum}')
+    return value
+
+# == Conditional GET + кэш готовых ответов ==
+# ETag = "<id процесса>-<store.version>": id процесса нужен, чтобы после
+# перезапуска (version снова с нуля) старые ETag клиентов не совпали.
+BOOT_ID = uuid.uuid4().hex[:8]
+RESPONSE_CACHE_SIZE = 128
+# путь с query -> ((store, version), тело, заголовки); общий с asgi_app
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+def _conditional(build, cache=True):
+    """
+    Отдаёт 304, если у клиента актуальная версия (If-None-Match /
+    If-Modified-Since). Иначе берёт ответ из кэша, если он построен для
+    текущей версии хранилища, или строит его через build().
+    """
+    version, changed_at = store.version, store.changed_at
+    etag = f'{BOOT_ID}-{version}'
+    if etag in request.if_none_match:
+        resp = Response(status=304)
+        resp.set_etag(etag)
+        return resp
+
+    key = request.full_path
+    hit = cache_get(key, (store, version)) if cache else None
+    if hit is not None:
+        # каждый раз новый Response: make_conditional меняет объект ответа
+        _, body, headers = hit
+        resp = Response(body, headers=headers)
+    else:
+        # версия снята до построения: если данные успели измениться,
+        # запись просто устареет и будет перестроена следующим запросом
+        resp = build()
+        resp.set_etag(etag)
+        if changed_at is not None:
+            resp.last_modified = changed_at
+        resp.cache_control.no_cache = True  # кэшировать, но всегда сверяться
+        if cache:
+            headers = [(k, v) for k, v in resp.headers.items() if k.lower() != 'content-length']
+            entry = ((store, version), resp.get_data(), headers)
+            cache_put(key, entry)
+    return resp.make_conditional(request)
+
+def cache_get(key, tag):
+    """Запись кэша ответов, если она построена для tag=(store, version)."""
+    with _response_cache_lock:
+        hit = _response_cache.get(key)
+        if hit is None or hit[0] != tag:
+            return None
+        _response_cache.move_to_end(key)
+        return hit
 
-def _gen_id():
-    global _next_id
-    v = _next_id
-    _next_id += 1
-    return v
+def cache_put(key, entry):
+    with _response_cache_lock:
+        _response_cache[key] = entry
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+def _wants_fragment():
+    # JS на странице просит в ответ только изменённый <li>
+    return request.headers.get('X-Fragment') == '1'
+
+def _render_tasks(tasks):
+    return get_template_attribute('_task.html', 'task_items')(tasks)
+
+def _render_task(task):
+    return get_template_attribute('_task.html', 'task_item')(task)
+
+def _task_page():
+    status = _status_arg()
+    limit = _int_arg('limit', minimum=1) or PAGE_SIZE
+    tasks, next_cursor = store.page(_int_arg('cursor'), limit, STATUS_FILTERS[status])
+    return status, tasks, next_cursor
 
 @app.route('/')
 def index():
-    # Renders list of tasks
-    return render_template('index.html', tasks=tasks)
+    # Renders one page of tasks (server-side filter by ?status=)
+    def build():
+        status, tasks, next_cursor = _task_page()
+        return Response(render_template('index.html', tasks=tasks, status=status,
+                                        next_cursor=next_cursor), mimetype='text/html')
+    return _conditional(build)
+
+@app.route('/fragments/tasks', methods=['GET'])
+def fragment_tasks():
+    """Следующая страница задач как набор <li> (для подгрузки при прокрутке)."""
+    _, tasks, next_cursor = _task_page()
+    resp = Response(_render_tasks(tasks), mimetype='text/html')
+    if next_cursor is not None:
+        resp.headers['X-Next-Cursor'] = str(next_cursor)
+    return resp
+
+@app.route('/fragments/task/<int:task_id>', methods=['GET'])
+def fragment_task(task_id):
+    task = store.get(task_id)
+    if task is None:
+        return ('Not Found', 404)
+    return _render_task(task)
 
 @app.route('/add', methods=['POST'])
 def add():
     """Добавление задачи. (BUG: допускает пустые названия)"""
     title = request.form.get('title', '')
     # intentionally allow empty title (bug)
-    task = {'id': _gen_id(), 'title': title.strip(), 'done': False}
-    tasks.append(task)
+    store.add(title.strip())
     return redirect(url_for('index'))
 
 @app.route('/toggle/<int:task_id>', methods=['POST'])
@@ -32,12 +193,15 @@ def toggle(task_id):
     Toggle done. (BUG: uses list index instead of matching by 'id')
     Example bug outcome: toggling wrong task or 404 for large id.
     """
-    try:
-        # BUG: treat task_id as index into tasks list
-        tasks[task_id]['done'] = not tasks[task_id]['done']
-        return ('', 204)
-    except Exception:
+    # BUG: treat task_id as index into the task list
+    task = store.at(task_id)
+    if task is not None:
+        task = store.toggle(task['id'])
+    if task is None:
         return ('Not Found', 404)
+    if _wants_fragment():
+        return _render_task(task)
+    return ('', 204)
 
 @app.route('/delete/<int:task_id>', methods=['POST'])
 def delete(task_id):
@@ -45,11 +209,9 @@ def delete(task_id):
     Delete. (BUG: deletes by matching title == str(task_id) instead of id)
     Also returns 200 even if nothing deleted (should be 404).
     """
-    sid = str(task_id)
-    for t in tasks:
-        if t['title'] == sid:
-            tasks.remove(t)
-            return ('', 204)
+    # title index: O(1) instead of a linear scan
+    if store.remove_by_title(str(task_id)) is not None:
+        return ('', 204)
     # BUG: returns 200 instead of 404 -> client assumes success
     return ('', 200)
 
@@ -60,14 +222,58 @@ def edit(task_id):
     """
     title = request.form.get('title', '')
     # BUG: create new task instead of editing
-    task = {'id': _gen_id(), 'title': title.strip(), 'done': False}
-    tasks.append(task)
+    task = store.add(title.strip())
+    if _wants_fragment():
+        return _render_task(task)
     return redirect(url_for('index'))
 
 # Simple API endpoints (for debugging)
 @app.route('/api/tasks', methods=['GET'])
 def api_list():
-    return jsonify(tasks)
+    """
+    Список задач.
+    ?status=all|active|done  - фильтр по состоянию
+    ?limit=N&cursor=ID       - страница из N задач с id > ID;
+                               курсор следующей страницы в X-Next-Cursor
+    ?format=ndjson           - потоковая отдача, одна задача на строку
+    """
+    done = STATUS_FILTERS[_status_arg()]
+    cursor = _int_arg('cursor')
+    limit = _int_arg('limit', minimum=1)
+
+    if request.args.get('format') == 'ndjson':
+        # поток не кэшируем (в этом и смысл), но 304 отдаём
+        def stream():
+            tasks = islice(store.iter_tasks(cursor, done), limit)
+            return Response((json.dumps(t) + '\n' for t in tasks),
+                            mimetype='application/x-ndjson')
+        return _conditional(stream, cache=False)
+
+    def build():
+        if limit is None:
+            return jsonify(list(store.iter_tasks(cursor, done)))
+        items, next_cursor = store.page(cursor, limit, done)
+        resp = jsonify(items)
+        if next_cursor is not None:
+            resp.headers['X-Next-Cursor'] = str(next_cursor)
+        return resp
+    return _conditional(build)
+
+@app.route('/api/batch', methods=['POST'])
+def api_batch():
+    """
+    Пакет операций в одном запросе и одной транзакции хранилища.
+    Тело: [{"op": "add", "title": "..."}, {"op": "toggle", "id": 1}, ...]
+    (или {"ops": [...]}). Ответ: {"results": [...]} по одному на операцию,
+    без редиректа. Задачи адресуются по id (в т.ч. delete).
+    """
+    body = request.get_json(silent=True)
+    ops = body.get('ops') if isinstance(body, dict) else body
+    if not isinstance(ops, list):
+        return jsonify(error='expected a JSON list of operations'), 400
+    if len(ops) > BATCH_LIMIT:
+        return jsonify(error=f'too many operations (max {BATCH_LIMIT})'), 400
+    return jsonify(results=store.batch(ops))
 
 if __name__ == '__main__':
     # Run dev server
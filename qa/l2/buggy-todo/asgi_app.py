@@ -0,0 +1,387 @@
+"""ASGI-вариант Buggy TODO: те же маршруты, асинхронные обработчики.
+
+Работает поверх того же хранилища, что и Flask-приложение (``app.store``),
+и тех же шаблонов. Запуск под любым ASGI-сервером, например:
+
+    uvicorn asgi_app:app --port 5001
+
+Разбор запроса (query, формы, JSON, If-None-Match/If-Modified-Since)
+делает werkzeug, он и так приходит вместе с Flask. Вызовы хранилища,
+которое ходит на диск (``store.blocking_io``), уходят в поток, чтобы не
+блокировать цикл событий. ETag/304 и кэш готовых ответов — общие с
+Flask-приложением.
+"""
+import asyncio
+import json
+import re
+from datetime import datetime, timezone
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from werkzeug.http import http_date, is_resource_modified
+from werkzeug.wrappers import Request
+
+import app as todo
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Response:
+    def __init__(self, body=b'', status=200, content_type='text/html; charset=utf-8',
+                 headers=None):
+        self.body = body  # bytes или асинхронный итератор bytes
+        self.status = status
+        self.headers = list(headers or [])
+        if content_type is not None:
+            self.headers.insert(0, ('content-type', content_type))
+
+
+def json_response(data, status=200, headers=None):
+    return Response(json.dumps(data).encode(), status, 'application/json', headers)
+
+
+def redirect(location):
+    return Response(b'', 302, headers=[('location', location)])
+
+
+# сколько задач ndjson-поток читает из хранилища за один вызов
+STREAM_BATCH = 200
+
+
+async def call(fn, *args, **kwargs):
+    """Вызов метода хранилища: сразу, если он не ходит на диск, иначе в потоке."""
+    if todo.store.blocking_io:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+    return fn(*args, **kwargs)
+
+
+# --- разбор параметров (как _status_arg/_int_arg в app.py) ---
+
+def status_arg(req):
+    status = req.args.get('status', 'all')
+    if status not in todo.STATUS_FILTERS:
+        raise HTTPError(400, f'unknown status: {status}')
+    return status
+
+
+def int_arg(req, name, minimum=0):
+    raw = req.args.get(name)
+    if raw is None or raw == '':
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        raise HTTPError(400, f'{name} must be an integer')
+    if value < minimum:
+        raise HTTPError(400, f'{name} must be >= {minimum}')
+    return value
+
+
+def render(name, **context):
+    return todo.app.jinja_env.get_template(name).render(**context).encode()
+
+
+def render_macro(name, *args):
+    macro = getattr(todo.app.jinja_env.get_template('_task.html').module, name)
+    return str(macro(*args)).encode()
+
+
+def not_modified(req, etag, changed_at):
+    """304, если у клиента актуальная версия, — по тем же правилам, что
+    make_conditional во Flask: If-None-Match, а без него If-Modified-Since."""
+    last_modified = None
+    if changed_at is not None:
+        last_modified = datetime.fromtimestamp(changed_at, timezone.utc)
+    if is_resource_modified(req.environ, etag=etag, last_modified=last_modified):
+        return None
+    headers = [('etag', f'"{etag}"')]
+    if changed_at is not None:
+        headers.append(('last-modified', http_date(changed_at)))
+    return Response(b'', 304, content_type=None, headers=headers)
+
+
+def validators(etag, changed_at):
+    headers = [('etag', f'"{etag}"'), ('cache-control', 'no-cache')]
+    if changed_at is not None:
+        headers.append(('last-modified', http_date(changed_at)))
+    return headers
+
+
+async def conditional(req, build):
+    """Как app._conditional: 304 по If-None-Match/If-Modified-Since, иначе
+    ответ из общего кэша ответов Flask-приложения или свежепостроенный build()."""
+    store = todo.store
+    version, changed_at = store.version, store.changed_at
+    etag = f'{todo.BOOT_ID}-{version}'
+    resp = not_modified(req, etag, changed_at)
+    if resp is not None:
+        return resp
+
+    key = req.full_path
+    hit = todo.cache_get(key, (store, version))
+    if hit is not None:
+        _, body, headers = hit
+        return Response(body, content_type=None, headers=headers)
+    resp = await build()
+    resp.headers += validators(etag, changed_at)
+    todo.cache_put(key, ((store, version), resp.body, list(resp.headers)))
+    return resp
+
+
+async def task_page(req):
+    status = status_arg(req)
+    limit = int_arg(req, 'limit', minimum=1) or todo.PAGE_SIZE
+    cursor = int_arg(req, 'cursor')
+    tasks, next_cursor = await call(todo.store.page, cursor, limit, todo.STATUS_FILTERS[status])
+    return status, tasks, next_cursor
+
+
+# --- обработчики ---
+
+async def index(req):
+    async def build():
+        status, tasks, next_cursor = await task_page(req)
+        return Response(render('index.html', tasks=tasks, status=status,
+                               next_cursor=next_cursor))
+    return await conditional(req, build)
+
+
+async def fragment_tasks(req):
+    _, tasks, next_cursor = await task_page(req)
+    headers = [] if next_cursor is None else [('x-next-cursor', str(next_cursor))]
+    return Response(render_macro('task_items', tasks), headers=headers)
+
+
+async def fragment_task(req, task_id):
+    task = await call(todo.store.get, task_id)
+    if task is None:
+        return Response(b'Not Found', 404)
+    return Response(render_macro('task_item', task))
+
+
+async def add(req):
+    title = req.form.get('title', '')
+    # intentionally allow empty title (bug), как и во Flask-версии
+    await call(todo.store.add, title.strip())
+    return redirect('/')
+
+
+async def toggle(req, task_id):
+    # BUG (как во Flask-версии): task_id — индекс в списке задач, а не id
+    task = await call(todo.store.at, task_id)
+    if task is not None:
+        task = await call(todo.store.toggle, task['id'])
+    if task is None:
+        return Response(b'Not Found', 404)
+    if req.headers.get('X-Fragment') == '1':
+        return Response(render_macro('task_item', task))
+    return Response(b'', 204)
+
+
+async def delete(req, task_id):
+    # BUG (как во Flask-версии): удаляет по title == str(id), 200 если не нашлось
+    if await call(todo.store.remove_by_title, str(task_id)) is not None:
+        return Response(b'', 204)
+    return Response(b'', 200)
+
+
+async def edit(req, task_id):
+    title = req.form.get('title', '')
+    # BUG (как во Flask-версии): добавляет новую задачу вместо правки
+    task = await call(todo.store.add, title.strip())
+    if req.headers.get('X-Fragment') == '1':
+        return Response(render_macro('task_item', task))
+    return redirect('/')
+
+
+async def api_list(req):
+    done = todo.STATUS_FILTERS[status_arg(req)]
+    cursor = int_arg(req, 'cursor')
+    limit = int_arg(req, 'limit', minimum=1)
+
+    if req.args.get('format') == 'ndjson':
+        store = todo.store
+        changed_at = store.changed_at
+        etag = f'{todo.BOOT_ID}-{store.version}'
+        resp = not_modified(req, etag, changed_at)
+        if resp is not None:
+            return resp
+
+        async def stream():
+            # пачками по STREAM_BATCH через call(): чтение с диска идёт в потоке,
+            # а не в цикле событий; пачка уходит клиенту одним куском
+            after, left = cursor, limit
+            while left is None or left > 0:
+                size = STREAM_BATCH if left is None else min(STREAM_BATCH, left)
+                tasks, after = await call(store.page, after, size, done)
+                if tasks:
+                    yield ''.join(json.dumps(t) + '\n' for t in tasks).encode()
+                if left is not None:
+                    left -= len(tasks)
+                if after is None:
+                    return
+        return Response(stream(), content_type='application/x-ndjson',
+                        headers=validators(etag, changed_at))
+
+    async def build():
+        if limit is None:
+            return json_response(await call(lambda: list(todo.store.iter_tasks(cursor, done))))
+        items, next_cursor = await call(todo.store.page, cursor, limit, done)
+        headers = [] if next_cursor is None else [('x-next-cursor', str(next_cursor))]
+        return json_response(items, headers=headers)
+    return await conditional(req, build)
+
+
+async def api_batch(req):
+    body = req.get_json(silent=True)
+    ops = body.get('ops') if isinstance(body, dict) else body
+    if not isinstance(ops, list):
+        return json_response({'error': 'expected a JSON list of operations'}, 400)
+    if len(ops) > todo.BATCH_LIMIT:
+        return json_response({'error': f'too many operations (max {todo.BATCH_LIMIT})'}, 400)
+    return json_response({'results': await call(todo.store.batch, ops)})
+
+
+ROUTES = [
+    ('GET', r'/', index),
+    ('GET', r'/fragments/tasks', fragment_tasks),
+    ('GET', r'/fragments/task/(\d+)', fragment_task),
+    ('POST', r'/add', add),
+    ('POST', r'/toggle/(\d+)', toggle),
+    ('POST', r'/delete/(\d+)', delete),
+    ('POST', r'/edit/(\d+)', edit),
+    ('GET', r'/api/tasks', api_list),
+    ('POST', r'/api/batch', api_batch),
+]
+ROUTES = [(method, re.compile(pattern + '$'), handler) for method, pattern, handler in ROUTES]
+
+
+def dispatch(method, path):
+    allowed = False
+    for route_method, pattern, handler in ROUTES:
+        m = pattern.match(path)
+        if m:
+            if route_method == method or (route_method == 'GET' and method == 'HEAD'):
+                return handler, [int(g) for g in m.groups()]
+            allowed = True
+    raise HTTPError(405 if allowed else 404, 'Method Not Allowed' if allowed else 'Not Found')
+
+
+# --- ASGI ---
+
+def to_request(scope, body):
+    """Собирает werkzeug Request из ASGI scope — ради готового разбора форм."""
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', ''),
+        'PATH_INFO': scope['path'],
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': 'asgi',
+        'SERVER_PORT': '80',
+        'SERVER_PROTOCOL': 'HTTP/1.1',
+        'wsgi.input': BytesIO(body),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'CONTENT_LENGTH': str(len(body)),
+    }
+    for name, value in scope.get('headers', []):
+        key = name.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if key == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+        elif key != 'CONTENT_LENGTH':
+            environ['HTTP_' + key] = value
+    return Request(environ)
+
+
+async def read_body(receive):
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+
+async def lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await lifespan(receive, send)
+    if scope['type'] != 'http':
+        raise RuntimeError(f'unsupported scope: {scope["type"]}')
+
+    req = to_request(scope, await read_body(receive))
+    try:
+        handler, args = dispatch(scope['method'], scope['path'])
+        resp = await handler(req, *args)
+    except HTTPError as e:
+        resp = Response(e.message.encode(), e.status, 'text/plain; charset=utf-8')
+
+    streaming = not isinstance(resp.body, bytes)
+    headers = list(resp.headers)
+    if not streaming:
+        headers.append(('content-length', str(len(resp.body))))
+    await send({
+        'type': 'http.response.start',
+        'status': resp.status,
+        'headers': [(k.lower().encode('latin-1'), v.encode('latin-1')) for k, v in headers],
+    })
+    if scope['method'] == 'HEAD':
+        await send({'type': 'http.response.body', 'body': b''})
+    elif streaming:
+        async for chunk in resp.body:
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    else:
+        await send({'type': 'http.response.body', 'body': resp.body})
+
+
+class AsgiClient:
+    """Вызывает ASGI-приложение напрямую, без сервера (тесты, bench_async)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def request(self, method, url, body=b'', headers=()):
+        parts = urlsplit(url)
+        scope = {
+            'type': 'http',
+            'method': method,
+            'path': parts.path,
+            'query_string': parts.query.encode(),
+            'headers': [(k.lower().encode(), v.encode()) for k, v in headers],
+        }
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if sent:
+                return {'type': 'http.disconnect'}
+            sent = True
+            return {'type': 'http.request', 'body': body, 'more_body': False}
+
+        status, chunks, resp_headers = None, [], {}
+
+        async def send(message):
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+                resp_headers.update((k.decode(), v.decode()) for k, v in message['headers'])
+            else:
+                chunks.append(message.get('body', b''))
+
+        await self.app(scope, receive, send)
+        return status, b''.join(chunks), resp_headers
@@ -0,0 +1,140 @@
+"""Асинхронный генератор нагрузки: WSGI (Flask) vs ASGI, в одном процессе.
+
+На каждый маршрут запускается CONCURRENCY корутин, которые без пауз шлют
+запросы, пока не наберётся REQUESTS штук. Отчёт: p50/p95/p99 задержки
+и запросы в секунду по каждому маршруту и варианту приложения.
+
+WSGI-приложение вызывается в пуле потоков (как его гонял бы threaded
+сервер), ASGI — прямо в цикле событий. Сеть не участвует, так что
+сравниваются именно накладные расходы обработчиков.
+
+    python bench_async.py                    # 10 параллельно, 2000 запросов
+    python bench_async.py --concurrency 50 --requests 5000 --tasks 10000
+"""
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from werkzeug.test import EnvironBuilder
+
+import app as todo
+import asgi_app
+from asgi_app import AsgiClient
+
+
+class WsgiClient:
+    """Вызывает WSGI-приложение в пуле потоков."""
+
+    def __init__(self, app, threads):
+        self.app = app
+        self.pool = ThreadPoolExecutor(threads)
+
+    def _call(self, method, url, body, headers):
+        parts = urlsplit(url)
+        environ = EnvironBuilder(path=parts.path, query_string=parts.query, method=method,
+                                 data=body, headers=list(headers)).get_environ()
+        result = {}
+
+        def start_response(status, resp_headers, exc_info=None):
+            result['status'] = int(status.split()[0])
+            result['headers'] = {k.lower(): v for k, v in resp_headers}
+
+        it = self.app(environ, start_response)
+        try:
+            data = b''.join(it)
+        finally:
+            if hasattr(it, 'close'):
+                it.close()
+        return result['status'], data, result['headers']
+
+    async def request(self, method, url, body=b'', headers=()):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, self._call, method, url, body, headers)
+
+    def close(self):
+        self.pool.shutdown()
+
+
+FORM = [('Content-Type', 'application/x-www-form-urlencoded')]
+JSON = [('Content-Type', 'application/json')]
+
+
+def routes(n_tasks):
+    """(имя, фабрика запроса по номеру) — id берутся из уже созданных задач."""
+    return [
+        ('GET /', lambda i: ('GET', '/', b'', ())),
+        ('GET /api/tasks?limit=50', lambda i: ('GET', f'/api/tasks?limit=50&cursor={i % n_tasks}', b'', ())),
+        ('POST /toggle/<id>', lambda i: ('POST', f'/toggle/{i % n_tasks}', b'', ())),
+        ('POST /add', lambda i: ('POST', '/add', f'title=load{i}'.encode(), FORM)),
+        ('POST /api/batch x10', lambda i: ('POST', '/api/batch', json.dumps(
+            [{'op': 'toggle', 'id': (i * 10 + k) % n_tasks + 1} for k in range(10)]).encode(), JSON)),
+    ]
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[k]
+
+
+async def drive(client, make_request, concurrency, total):
+    """Держит concurrency запросов в полёте, пока не отправит total штук."""
+    latencies = []
+    counter = iter(range(total))
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            method, url, body, headers = make_request(i)
+            start = time.perf_counter()
+            status, _, _ = await client.request(method, url, body, headers)
+            latencies.append(time.perf_counter() - start)
+            if status >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'p50': percentile(latencies, 50) * 1e3,
+        'p95': percentile(latencies, 95) * 1e3,
+        'p99': percentile(latencies, 99) * 1e3,
+        'rps': total / elapsed,
+        'errors': errors,
+    }
+
+
+async def run(args):
+    todo.store.clear()
+    todo.store.batch([{'op': 'add', 'title': f'task {i}'} for i in range(args.tasks)])
+
+    wsgi = WsgiClient(todo.app.wsgi_app, args.concurrency)
+    asgi = AsgiClient(asgi_app.app)
+    print(f'{args.tasks} tasks, concurrency {args.concurrency}, {args.requests} requests per route')
+    print(f"{'route':<24} {'app':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'req/s':>9} {'err':>4}")
+    try:
+        for name, make_request in routes(args.tasks):
+            for label, client in (('wsgi', wsgi), ('asgi', asgi)):
+                r = await drive(client, make_request, args.concurrency, args.requests)
+                print(f"{name:<24} {label:>5} {r['p50']:>8.2f} {r['p95']:>8.2f} "
+                      f"{r['p99']:>8.2f} {r['rps']:>9.0f} {r['errors']:>4}")
+    finally:
+        wsgi.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--tasks', type=int, default=1000)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
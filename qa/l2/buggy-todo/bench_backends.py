@@ -0,0 +1,91 @@
+"""Сравнение хранилищ: list (как было) vs dict (TaskStore) vs SQLite.
+
+    python bench_backends.py                 # 1k, 10k, 100k задач
+    python bench_backends.py 1000 50000
+
+add — среднее на одно добавление при наполнении, toggle/delete — среднее
+по OPS случайным id, list-all — одно чтение всех задач.
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from sqlite_store import SqliteTaskStore
+from store import TaskStore
+
+OPS = 500
+
+
+class ListStore:
+    """Старая схема из app.py: список и линейный поиск по id."""
+
+    def __init__(self):
+        self.tasks = []
+        self._next_id = 1
+
+    def add(self, title):
+        self.tasks.append({'id': self._next_id, 'title': title, 'done': False})
+        self._next_id += 1
+
+    def _find(self, task_id):
+        for t in self.tasks:
+            if t['id'] == task_id:
+                return t
+
+    def toggle(self, task_id):
+        t = self._find(task_id)
+        t['done'] = not t['done']
+
+    def remove(self, task_id):
+        self.tasks.remove(self._find(task_id))
+
+    def all(self):
+        return list(self.tasks)
+
+
+def us_per_op(fn, args):
+    start = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - start) / len(args) * 1e6
+
+
+def bench(store, size):
+    add = us_per_op(store.add, [f'task {i}' for i in range(size)])
+    ids = random.Random(size).sample(range(1, size + 1), min(OPS, size))
+    toggle = us_per_op(store.toggle, ids)
+    delete = us_per_op(store.remove, ids)
+    start = time.perf_counter()
+    store.all()
+    list_all = (time.perf_counter() - start) * 1e3
+    return add, toggle, delete, list_all
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    tmp = tempfile.mkdtemp(prefix='todo-bench-')
+    print(f"{'size':>8} {'backend':>8} {'add us':>8} {'toggle us':>10} "
+          f"{'delete us':>10} {'list-all ms':>12}")
+    try:
+        for size in sizes:
+            backends = [
+                ('list', ListStore),
+                ('dict', TaskStore),
+                ('sqlite', lambda: SqliteTaskStore(os.path.join(tmp, f'{size}.db'))),
+            ]
+            for name, factory in backends:
+                store = factory()
+                add, toggle, delete, list_all = bench(store, size)
+                print(f'{size:>8} {name:>8} {add:>8.2f} {toggle:>10.2f} '
+                      f'{delete:>10.2f} {list_all:>12.2f}')
+                if hasattr(store, 'close'):
+                    store.close()
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Наполнение и изменение задач: запрос на операцию vs один /api/batch.
+
+Запросы идут через Flask test client, так что сеть не учитывается —
+реальная разница с браузером/HTTP будет только больше.
+
+    python bench_batch.py          # 1000 задач
+    python bench_batch.py 10000
+"""
+import sys
+import time
+
+import app as todo
+
+
+def per_request(client, n):
+    # как в браузере: /add отвечает редиректом, за ним идёт GET /
+    for i in range(n):
+        client.post('/add', data={'title': f'task {i}'}, follow_redirects=True)
+    for index in range(n):  # /toggle берёт индекс в списке, не id
+        client.post(f'/toggle/{index}')
+    return 3 * n  # HTTP-запросов
+
+
+def batched(client, n):
+    client.post('/api/batch', json=[{'op': 'add', 'title': f'task {i}'} for i in range(n)])
+    client.post('/api/batch', json=[{'op': 'toggle', 'id': i} for i in range(1, n + 1)])
+    return 2
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    client = todo.app.test_client()
+    print(f'{n} adds + {n} toggles')
+    print(f"{'mode':>12} {'requests':>9} {'seconds':>8}")
+    for name, fn in (('per-request', per_request), ('batch', batched)):
+        todo.store.clear()
+        start = time.perf_counter()
+        requests = fn(client, n)
+        elapsed = time.perf_counter() - start
+        assert todo.store.count(done=True) == n
+        print(f'{name:>12} {requests:>9} {elapsed:>8.3f}')
+
+
+if __name__ == '__main__':
+    main()
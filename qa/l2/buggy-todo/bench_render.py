@@ -0,0 +1,48 @@
+"""Сколько байт и времени уходит на ответ: вся страница vs страница vs фрагмент.
+
+"full" — главная со всеми задачами (как было до пагинации),
+"page" — главная с одной страницей, "toggle"/"edit" — ответ-фрагмент <li>.
+
+    python bench_render.py          # 10k задач
+    python bench_render.py 50000
+"""
+import sys
+import time
+
+import app as todo
+
+REPEAT = 20
+
+
+def measure(client, method, url, **kwargs):
+    size = 0
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        resp = getattr(client, method)(url, **kwargs)
+        size = len(resp.get_data())
+    return size, (time.perf_counter() - start) / REPEAT * 1000  # мс
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    todo.store.clear()
+    for i in range(n):
+        todo.store.add(f'task {i}')
+    client = todo.app.test_client()
+    fragment = {'X-Fragment': '1'}
+
+    cases = [
+        ('full', 'get', f'/?limit={n}', {}),
+        ('page', 'get', '/', {}),
+        ('toggle', 'post', f'/toggle/{n // 2}', {'headers': fragment}),
+        ('edit', 'post', f'/edit/{n // 2}', {'headers': fragment, 'data': {'title': 'x'}}),
+    ]
+    print(f'{n} tasks, page size {todo.PAGE_SIZE}')
+    print(f"{'case':>8} {'bytes':>10} {'ms':>8}")
+    for name, method, url, kwargs in cases:
+        size, ms = measure(client, method, url, **kwargs)
+        print(f'{name:>8} {size:>10} {ms:>8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""Микробенчмарк TaskStore: toggle/edit/delete при большом числе задач.
+
+Для сравнения рядом гоняется старая схема (список + линейный поиск).
+
+    python bench_store.py            # 10k, 100k, 1M
+    python bench_store.py 1000000    # только 1M
+"""
+import sys
+import time
+
+from store import TaskStore
+
+OPS = 1000
+
+
+def _timeit(fn, n=OPS):
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6  # мкс на операцию
+
+
+def bench_list(size):
+    tasks = [{'id': i, 'title': str(i), 'done': False} for i in range(1, size + 1)]
+    # worst case: цель в конце списка
+    targets = list(range(size, size - OPS, -1))
+
+    def find(task_id):
+        for t in tasks:
+            if t['id'] == task_id:
+                return t
+
+    def toggle(i):
+        t = find(targets[i])
+        t['done'] = not t['done']
+
+    def edit(i):
+        find(targets[i])['title'] = str(targets[i])
+
+    def delete(i):
+        sid = str(targets[i])
+        for t in tasks:
+            if t['title'] == sid:
+                tasks.remove(t)
+                break
+
+    # на больших размерах список слишком медленный — берём меньше операций
+    n = OPS if size <= 100_000 else 20
+    return _timeit(toggle, n), _timeit(edit, n), _timeit(delete, n)
+
+
+def bench_store(size):
+    store = TaskStore()
+    for i in range(1, size + 1):
+        store.add(str(i))
+    targets = list(range(size, size - OPS, -1))
+
+    def toggle(i):
+        store.toggle(targets[i])
+
+    def edit(i):
+        store.update(targets[i], title=str(targets[i]))
+
+    def delete(i):
+        store.remove_by_title(str(targets[i]))
+
+    return _timeit(toggle), _timeit(edit), _timeit(delete)
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    print(f"{'size':>10} {'backend':>8} {'toggle us':>10} {'edit us':>10} {'delete us':>10}")
+    for size in sizes:
+        for name, bench in (('list', bench_list), ('store', bench_store)):
+            toggle, edit, delete = bench(size)
+            print(f"{size:>10} {name:>8} {toggle:>10.2f} {edit:>10.2f} {delete:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""Пропускная способность и время перезапуска WalTaskStore.
+
+    python bench_wal.py            # 1M задач
+    python bench_wal.py 200000
+
+Меряется: добавление N задач (групповой fsync), N переключений,
+снятие снимка, старт только с журналом и старт со снимком + хвостом.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from wal_store import WalTaskStore
+
+
+def timed(label, fn, ops=None):
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    rate = f'{ops / elapsed:>12,.0f} ops/s' if ops else ''
+    print(f'{label:<34} {elapsed:>8.2f} s {rate}')
+    return result
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tail = n // 100
+    path = tempfile.mkdtemp(prefix='todo-wal-')
+    # снимки только вручную, чтобы отдельно измерить оба варианта старта
+    opts = {'snapshot_every': 10 ** 12}
+    try:
+        store = WalTaskStore(path, **opts)
+        timed(f'add x{n}', lambda: [store.add(f'task {i}') for i in range(n)], n)
+        timed(f'toggle x{n}', lambda: [store.toggle(i) for i in range(1, n + 1)], n)
+        timed(f'batch add x{n}', lambda: store.batch(
+            [{'op': 'add', 'title': f'b{i}'} for i in range(n)]), n)
+        store.close()
+        size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        print(f'{"log size":<34} {size / 2 ** 20:>8.1f} MiB')
+
+        store = timed('restart: replay whole log', lambda: WalTaskStore(path, **opts))
+        timed('snapshot', store.snapshot)
+        for i in range(1, tail + 1):
+            store.toggle(i)
+        store.close()
+        store = timed(f'restart: snapshot + {tail} tail', lambda: WalTaskStore(path, **opts))
+        assert len(store) == 2 * n
+        store.close()
+    finally:
+        shutil.rmtree(path)
+
+
+if __name__ == '__main__':
+    main()
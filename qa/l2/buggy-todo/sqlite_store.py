@@ -0,0 +1,241 @@
+"""Хранилище задач в SQLite.
+
+* WAL-режим: читатели не блокируют писателя и друг друга;
+* ограниченный пул соединений: поток берёт соединение на время операции
+  и возвращает его, поэтому потоки сервера (threaded WSGI заводит поток на
+  каждый запрос) не копят открытые соединения, а новое не открывается
+  на каждый запрос;
+* SQL-тексты — константы, поэтому sqlite3 берёт уже подготовленные
+  запросы из кэша соединения (``cached_statements``);
+* индексы: id (INTEGER PRIMARY KEY), done, title;
+* version растёт только если транзакция изменила строки (total_changes).
+"""
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from store import BaseTaskStore
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS tasks (
+    id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT    NOT NULL,
+    done  INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS tasks_done ON tasks (done, id);
+CREATE INDEX IF NOT EXISTS tasks_title ON tasks (title, id);
+'''
+
+COLUMNS = 'SELECT id, title, done FROM tasks'
+SQL_GET = COLUMNS + ' WHERE id = ?'
+SQL_BY_TITLE = COLUMNS + ' WHERE title = ? ORDER BY id LIMIT 1'
+SQL_AT = COLUMNS + ' ORDER BY id LIMIT 1 OFFSET ?'
+SQL_ALL = COLUMNS + ' ORDER BY id'
+SQL_BY_DONE = COLUMNS + ' WHERE done = ? ORDER BY id'
+SQL_AFTER = COLUMNS + ' WHERE id > ? ORDER BY id LIMIT ?'
+SQL_AFTER_DONE = COLUMNS + ' WHERE done = ? AND id > ? ORDER BY id LIMIT ?'
+SQL_COUNT = 'SELECT count(*) FROM tasks'
+SQL_COUNT_DONE = 'SELECT count(*) FROM tasks WHERE done = ?'
+SQL_INSERT = 'INSERT INTO tasks (title, done) VALUES (?, ?)'
+SQL_SET_TITLE = 'UPDATE tasks SET title = ? WHERE id = ? AND title <> ?'
+SQL_SET_DONE = 'UPDATE tasks SET done = ? WHERE id = ? AND done <> ?'
+SQL_TOGGLE = 'UPDATE tasks SET done = 1 - done WHERE id = ?'
+SQL_DELETE = 'DELETE FROM tasks WHERE id = ?'
+
+# сколько строк читать за раз при потоковом обходе
+CHUNK = 500
+# больше соединений не открывается, лишние потоки ждут свободного
+POOL_SIZE = 8
+
+
+def _row(row):
+    return {'id': row[0], 'title': row[1], 'done': bool(row[2])}
+
+
+class SqliteTaskStore(BaseTaskStore):
+    """TaskStore поверх файла SQLite."""
+
+    blocking_io = True
+
+    def __init__(self, path, cached_statements=128, pool_size=POOL_SIZE):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.pool_size = pool_size
+        self._local = threading.local()
+        self._idle = queue.LifoQueue()
+        self._conns = []
+        self._conns_lock = threading.Lock()
+        self._version_lock = threading.Lock()
+        with self._db() as db:
+            db.executescript(SCHEMA)
+
+    # --- пул соединений ---
+
+    def _connect(self):
+        # check_same_thread=False: соединение переходит между потоками через
+        # пул, но в каждый момент им пользуется только один поток
+        db = sqlite3.connect(self.path, isolation_level=None,
+                             cached_statements=self.cached_statements,
+                             check_same_thread=False, timeout=30)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        return db
+
+    def _checkout(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._conns_lock:
+            if len(self._conns) < self.pool_size:
+                db = self._connect()
+                self._conns.append(db)
+                return db
+        return self._idle.get(timeout=30)
+
+    @contextmanager
+    def _db(self):
+        # вложенные вызовы (batch -> add -> get) получают то же соединение,
+        # в пул оно возвращается после внешнего
+        local = self._local
+        db = getattr(local, 'db', None)
+        if db is not None:
+            local.users += 1
+            try:
+                yield db
+            finally:
+                local.users -= 1
+            return
+        db = self._checkout()
+        local.db, local.users, local.depth = db, 1, 0
+        try:
+            yield db
+        finally:
+            local.db = None
+            self._idle.put(db)
+
+    @contextmanager
+    def _tx(self):
+        # вложенные вызовы (batch -> add) идут в одной транзакции
+        with self._db() as db:
+            local = self._local
+            if local.depth == 0:
+                db.execute('BEGIN IMMEDIATE')
+                local.changes = db.total_changes
+            local.depth += 1
+            try:
+                yield db
+            except BaseException:
+                local.depth -= 1
+                if local.depth == 0:
+                    db.execute('ROLLBACK')
+                raise
+            local.depth -= 1
+            if local.depth == 0:
+                db.execute('COMMIT')
+                # версия видна только этому процессу: другие процессы,
+                # пишущие в тот же файл, кэш ответов не сбросят
+                if db.total_changes != local.changes:
+                    with self._version_lock:
+                        self._bump()
+
+    def transaction(self):
+        return self._tx()
+
+    def close(self):
+        with self._conns_lock:
+            for db in self._conns:
+                db.close()
+            self._conns.clear()
+        self._idle = queue.LifoQueue()
+        self._local = threading.local()
+
+    # --- чтение ---
+
+    def get(self, task_id):
+        with self._db() as db:
+            row = db.execute(SQL_GET, (task_id,)).fetchone()
+        return _row(row) if row else None
+
+    def find_by_title(self, title):
+        with self._db() as db:
+            row = db.execute(SQL_BY_TITLE, (title,)).fetchone()
+        return _row(row) if row else None
+
+    def at(self, position):
+        # OFFSET пропускает position строк по первичному ключу: O(position)
+        with self._db() as db:
+            row = db.execute(SQL_AT, (position,)).fetchone()
+        return _row(row) if row else None
+
+    def all(self):
+        with self._db() as db:
+            return [_row(r) for r in db.execute(SQL_ALL)]
+
+    def filter(self, done):
+        with self._db() as db:
+            return [_row(r) for r in db.execute(SQL_BY_DONE, (int(bool(done)),))]
+
+    def iter_tasks(self, after=None, done=None):
+        # кусками по CHUNK, каждый кусок — отдельный запрос по ключу:
+        # между кусками не держим ни курсор, ни соединение из пула
+        after = 0 if after is None else after
+        while True:
+            with self._db() as db:
+                if done is None:
+                    rows = db.execute(SQL_AFTER, (after, CHUNK)).fetchall()
+                else:
+                    rows = db.execute(SQL_AFTER_DONE, (int(done), after, CHUNK)).fetchall()
+            for row in rows:
+                yield _row(row)
+            if len(rows) < CHUNK:
+                return
+            after = rows[-1][0]
+
+    def count(self, done=None):
+        with self._db() as db:
+            if done is None:
+                return db.execute(SQL_COUNT).fetchone()[0]
+            return db.execute(SQL_COUNT_DONE, (int(bool(done)),)).fetchone()[0]
+
+    # --- изменение ---
+
+    def add(self, title, done=False):
+        with self._tx() as db:
+            cur = db.execute(SQL_INSERT, (title, int(bool(done))))
+        return {'id': cur.lastrowid, 'title': title, 'done': bool(done)}
+
+    def update(self, task_id, **fields):
+        with self._tx() as db:
+            if 'title' in fields:
+                db.execute(SQL_SET_TITLE, (fields['title'], task_id, fields['title']))
+            if 'done' in fields:
+                done = int(bool(fields['done']))
+                db.execute(SQL_SET_DONE, (done, task_id, done))
+            return self.get(task_id)
+
+    def toggle(self, task_id):
+        with self._tx() as db:
+            if db.execute(SQL_TOGGLE, (task_id,)).rowcount == 0:
+                return None
+            return self.get(task_id)
+
+    def remove(self, task_id):
+        with self._tx() as db:
+            task = self.get(task_id)
+            if task is not None:
+                db.execute(SQL_DELETE, (task_id,))
+            return task
+
+    def remove_by_title(self, title):
+        with self._tx() as db:
+            task = self.find_by_title(title)
+            if task is not None:
+                db.execute(SQL_DELETE, (task['id'],))
+            return task
+
+    def clear(self):
+        with self._tx() as db:
+            db.execute('DELETE FROM tasks')
+            db.execute("DELETE FROM sqlite_sequence WHERE name = 'tasks'")
@@ -0,0 +1,339 @@
+"""Хранилище задач для Buggy TODO.
+
+Задачи лежат в словаре id -> задача (порядок вставки сохраняется),
+плюс вторичные индексы по состоянию ``done`` и по названию. Все
+операции над одной задачей — O(1), без прохода по всему списку.
+
+Потокобезопасность (для threaded WSGI):
+  * id выдаются из ``itertools.count`` под общим локом индексов, поэтому
+    не повторяются и идут по возрастанию;
+  * изменения одной задачи сериализуются полосатыми (striped) локами по id,
+    общие индексы меняются под коротким ``_index_lock`` (порядок захвата
+    всегда: полоса -> индексы);
+  * задача при изменении заменяется новой копией (copy-on-write), так что
+    читатель без локов всегда видит целостный dict;
+  * ``transaction()`` берёт все локи сразу — пакет операций выполняется
+    без вмешательства других потоков (локи реентерабельные).
+"""
+import itertools
+import threading
+import time
+from bisect import bisect_right
+from contextlib import contextmanager
+
+# число полос для локов по id
+STRIPES = 64
+
+
+class BaseTaskStore:
+    """Общий интерфейс хранилищ задач (память, WAL, SQLite).
+
+    Задача — dict {'id', 'title', 'done'}. Методы, возвращающие задачу,
+    при отсутствии id возвращают None. Реализация обязана определить
+    add/get/update/toggle/remove/remove_by_title/find_by_title/all/
+    filter/iter_tasks/count/clear и transaction().
+
+    ``version`` растёт при каждом изменении, ``changed_at`` — время
+    последнего изменения (time.time()); по ним строятся ETag и
+    Last-Modified и сбрасывается кэш ответов.
+    """
+
+    version = 0
+    changed_at = None
+    # методы ходят на диск — асинхронный код зовёт их через поток (asgi_app)
+    blocking_io = False
+
+    def _bump(self):
+        # вызывается реализацией под её локом записи
+        self.version += 1
+        self.changed_at = time.time()
+
+    def __len__(self):
+        return self.count()
+
+    def __iter__(self):
+        return iter(self.all())
+
+    def __contains__(self, task_id):
+        return self.get(task_id) is not None
+
+    def transaction(self):
+        raise NotImplementedError
+
+    def at(self, position):
+        """Задача на позиции position в порядке добавления (как tasks[i]
+        в старом списке) или None. Нужна для заложенного бага /toggle."""
+        return next(itertools.islice(self.iter_tasks(), position, None), None)
+
+    def page(self, after=None, limit=50, done=None):
+        """Страница задач и курсор следующей (None, если дальше пусто)."""
+        items = []
+        it = self.iter_tasks(after, done)
+        for task in it:
+            items.append(task)
+            if len(items) == limit:
+                break
+        next_cursor = None
+        if len(items) == limit and next(it, None) is not None:
+            next_cursor = items[-1]['id']
+        return items, next_cursor
+
+    def batch(self, ops):
+        """Применяет список операций в одной транзакции.
+
+        Операция — dict вида {'op': 'add', 'title': ...},
+        {'op': 'toggle', 'id': ...}, {'op': 'edit', 'id': ..., 'title': ...}
+        или {'op': 'delete', 'id': ...}. Возвращает по результату на
+        операцию: {'ok': True, 'task': ...} или {'ok': False, 'error': ...}.
+        """
+        with self.transaction():
+            return [self._apply_op(op) for op in ops]
+
+    def _apply_op(self, op):
+        if not isinstance(op, dict):
+            return {'ok': False, 'error': 'operation must be an object'}
+        kind = op.get('op')
+        if kind == 'add':
+            title = op.get('title', '')
+            if not isinstance(title, str):
+                return {'ok': False, 'error': 'title must be a string'}
+            return {'ok': True, 'task': self.add(title.strip(), op.get('done', False))}
+        if kind not in ('toggle', 'edit', 'delete'):
+            return {'ok': False, 'error': f'unknown op: {kind!r}'}
+        task_id = op.get('id')
+        if not isinstance(task_id, int) or isinstance(task_id, bool):
+            return {'ok': False, 'error': 'id must be an integer'}
+        if kind == 'toggle':
+            task = self.toggle(task_id)
+        elif kind == 'edit':
+            title = op.get('title', '')
+            if not isinstance(title, str):
+                return {'ok': False, 'error': 'title must be a string'}
+            task = self.update(task_id, title=title.strip())
+        else:
+            task = self.remove(task_id)
+        if task is None:
+            return {'ok': False, 'error': 'not found'}
+        return {'ok': True, 'task': task}
+
+
+class TaskStore(BaseTaskStore):
+    """In-memory хранилище задач с индексами по id, done и title."""
+
+    def __init__(self):
+        self._tasks = {}
+        # dict используется как упорядоченное множество id
+        self._by_done = {False: {}, True: {}}
+        self._by_title = {}
+        # id в порядке добавления (по возрастанию) — для курсорной пагинации.
+        # Удалённые id остаются "надгробиями" до очередного уплотнения.
+        self._order = []
+        self._dead = 0
+        self._ids = itertools.count(1)
+        self._index_lock = threading.RLock()
+        self._stripes = [threading.RLock() for _ in range(STRIPES)]
+
+    def _stripe(self, task_id):
+        return self._stripes[hash(task_id) % STRIPES]
+
+    # --- индексы ---
+
+    def _index(self, task):
+        self._by_done[task['done']][task['id']] = None
+        self._by_title.setdefault(task['title'], {})[task['id']] = None
+
+    def _unindex(self, task):
+        del self._by_done[task['done']][task['id']]
+        ids = self._by_title[task['title']]
+        del ids[task['id']]
+        if not ids:
+            del self._by_title[task['title']]
+
+    # --- чтение ---
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __contains__(self, task_id):
+        return task_id in self._tasks
+
+    def all(self):
+        """Снимок всех задач в порядке добавления."""
+        with self._index_lock:
+            return list(self._tasks.values())
+
+    def get(self, task_id):
+        """Задача по id или None."""
+        return self._tasks.get(task_id)
+
+    def at(self, position):
+        """Задача на позиции position в порядке добавления или None.
+
+        O(1): после удалений список id сперва уплотняется (один раз,
+        следующие вызовы снова берут элемент по индексу).
+        """
+        with self._index_lock:
+            if self._dead:
+                self._compact()
+            if position >= len(self._order):
+                return None
+            return self._tasks[self._order[position]]
+
+    def find_by_title(self, title):
+        """Первая (самая старая) задача с таким названием или None."""
+        with self._index_lock:
+            ids = self._by_title.get(title)
+            if not ids:
+                return None
+            return self._tasks[next(iter(ids))]
+
+    def filter(self, done):
+        """Снимок задач с заданным состоянием done."""
+        with self._index_lock:
+            return [self._tasks[i] for i in self._by_done[bool(done)]]
+
+    def iter_tasks(self, after=None, done=None):
+        """Ленивый обход задач с id > after, опционально только с нужным done.
+
+        Переживает изменения хранилища во время обхода (нужно для
+        потоковой отдачи): удалённые задачи просто пропускаются.
+        """
+        order = self._order
+        i = 0 if after is None else bisect_right(order, after)
+        while i < len(order):
+            task_id = order[i]
+            task = self._tasks.get(task_id)
+            if self._order is not order:
+                # было уплотнение — перепозиционируемся в новом списке
+                order = self._order
+                i = bisect_right(order, task_id)
+            else:
+                i += 1
+            if task is None:
+                continue
+            if done is not None and task['done'] != done:
+                continue
+            yield task
+
+    def count(self, done=None):
+        if done is None:
+            return len(self._tasks)
+        return len(self._by_done[bool(done)])
+
+    # --- изменение ---
+
+    def add(self, title, done=False):
+        with self._index_lock:
+            task = {'id': next(self._ids), 'title': title, 'done': bool(done)}
+            self._insert(task)
+            self._bump()
+            self._log('add', task)
+        return task
+
+    def _insert(self, task):
+        # вызывается под _index_lock; id должен быть больше всех имеющихся
+        self._tasks[task['id']] = task
+        self._order.append(task['id'])
+        self._index(task)
+
+    def update(self, task_id, **fields):
+        """Обновляет title/done задачи. Возвращает задачу или None."""
+        with self._stripe(task_id):
+            return self._update(task_id, fields)
+
+    def _update(self, task_id, fields):
+        # вызывается под локом полосы task_id
+        old = self._tasks.get(task_id)
+        if old is None:
+            return None
+        task = dict(old)
+        if 'title' in fields:
+            task['title'] = fields['title']
+        if 'done' in fields:
+            task['done'] = bool(fields['done'])
+        with self._index_lock:
+            if self._tasks.get(task_id) is not old:
+                return None  # удалена или заменена clear()
+            self._replace(old, task)
+            self._bump()
+            self._log('update', task)
+        return task
+
+    def _replace(self, old, task):
+        # вызывается под _index_lock
+        self._unindex(old)
+        self._tasks[task['id']] = task
+        self._index(task)
+
+    def toggle(self, task_id):
+        with self._stripe(task_id):
+            task = self._tasks.get(task_id)
+            if task is None:
+                return None
+            return self._update(task_id, {'done': not task['done']})
+
+    def remove(self, task_id):
+        """Удаляет задачу по id. Возвращает удалённую задачу или None."""
+        with self._stripe(task_id), self._index_lock:
+            return self._remove(task_id)
+
+    def remove_by_title(self, title):
+        """Атомарно удаляет самую старую задачу с таким названием."""
+        while True:
+            task = self.find_by_title(title)
+            if task is None:
+                return None
+            with self._stripe(task['id']), self._index_lock:
+                ids = self._by_title.get(title)
+                if ids and next(iter(ids)) == task['id']:
+                    return self._remove(task['id'])
+            # пока брали локи, задачу изменили/удалили — ищем заново
+
+    def _remove(self, task_id):
+        # вызывается под локом полосы и _index_lock
+        task = self._tasks.pop(task_id, None)
+        if task is not None:
+            self._unindex(task)
+            self._bump()
+            self._log('remove', task)
+            self._dead += 1
+            if self._dead > len(self._order) // 2:
+                self._compact()
+        return task
+
+    def _compact(self):
+        # новый список, а не правка на месте: идущие обходы видят старый
+        self._order = [i for i in self._order if i in self._tasks]
+        self._dead = 0
+
+    @contextmanager
+    def transaction(self):
+        """Эксклюзивный доступ к хранилищу на время блока.
+
+        Отката нет: это изоляция, а не атомарность — уже выполненные
+        операции пакета остаются, даже если следующая не удалась.
+        """
+        # тот же порядок захвата, что и в одиночных операциях: полосы -> индексы
+        for lock in self._stripes:
+            lock.acquire()
+        try:
+            with self._index_lock:
+                yield self
+        finally:
+            for lock in reversed(self._stripes):
+                lock.release()
+
+    def clear(self):
+        with self._index_lock:
+            self._tasks = {}
+            self._by_done = {False: {}, True: {}}
+            self._by_title = {}
+            self._order = []
+            self._dead = 0
+            self._ids = itertools.count(1)
+            self._bump()
+            self._log('clear', None)
+
+    def _log(self, op, task):
+        """Хук для журналирования изменений (см. wal_store). Вызывается
+        под _index_lock сразу после применения изменения."""
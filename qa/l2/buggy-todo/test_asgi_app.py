@@ -0,0 +1,102 @@
+import asyncio
+import json
+
+import pytest
+
+import app as todo
+from asgi_app import AsgiClient, app as asgi
+
+FORM = [('Content-Type', 'application/x-www-form-urlencoded')]
+
+
+@pytest.fixture
+def request_():
+    todo.store.clear()
+    client = AsgiClient(asgi)
+
+    def call(method, url, body=b'', headers=()):
+        return asyncio.run(client.request(method, url, body, headers))
+    return call
+
+
+def test_add_toggle_edit_delete(request_):
+    status, _, headers = request_('POST', '/add', b'title=42', FORM)
+    assert status == 302 and headers['location'] == '/'
+    request_('POST', '/add', b'title=second', FORM)
+
+    # toggle и edit с багами Flask-версии: индекс вместо id, новая задача вместо правки
+    assert request_('POST', '/toggle/1')[0] == 204
+    assert request_('POST', '/toggle/9')[0] == 404
+    status, body, _ = request_('POST', '/edit/2', b'title=renamed', FORM + [('X-Fragment', '1')])
+    assert status == 200 and b'data-id="3"' in body and b'renamed' in body
+    # delete сохраняет поведение Flask-версии: ищет по названию
+    assert request_('POST', '/delete/42')[0] == 204
+    assert request_('POST', '/delete/42')[0] == 200
+
+    _, body, _ = request_('GET', '/api/tasks')
+    assert json.loads(body) == [{'id': 2, 'title': 'second', 'done': True},
+                                {'id': 3, 'title': 'renamed', 'done': False}]
+
+
+def test_pagination_etag_and_stream(request_):
+    todo.store.batch([{'op': 'add', 'title': t} for t in 'abc'])
+    status, body, headers = request_('GET', '/api/tasks?limit=2')
+    assert [t['id'] for t in json.loads(body)] == [1, 2]
+    assert headers['x-next-cursor'] == '2'
+
+    etag = headers['etag']
+    assert request_('GET', '/api/tasks?limit=2', headers=[('If-None-Match', etag)])[0] == 304
+
+    _, body, headers = request_('GET', '/api/tasks?format=ndjson&status=active')
+    assert headers['content-type'] == 'application/x-ndjson'
+    assert [json.loads(line)['title'] for line in body.splitlines()] == ['a', 'b', 'c']
+
+
+def test_shares_store_with_flask(request_):
+    todo.app.test_client().post('/add', data={'title': 'from flask'})
+    status, body, _ = request_('GET', '/')
+    assert status == 200 and b'from flask' in body
+
+
+def test_batch_and_errors(request_):
+    body = json.dumps([{'op': 'add', 'title': 'x'}, {'op': 'toggle', 'id': 5}]).encode()
+    _, resp, _ = request_('POST', '/api/batch', body, [('Content-Type', 'application/json')])
+    assert [r['ok'] for r in json.loads(resp)['results']] == [True, False]
+    assert request_('GET', '/nope')[0] == 404
+    assert request_('GET', '/add')[0] == 405
+    assert request_('GET', '/api/tasks?limit=x')[0] == 400
+
+
+def test_if_modified_since(request_):
+    todo.store.add('a')
+    _, _, headers = request_('GET', '/api/tasks')
+    since = [('If-Modified-Since', headers['last-modified'])]
+    assert request_('GET', '/api/tasks', headers=since)[0] == 304
+    assert request_('GET', '/api/tasks?format=ndjson', headers=since)[0] == 304
+    # If-None-Match главнее: чужой ETag — полный ответ, как во Flask
+    assert request_('GET', '/api/tasks', headers=since + [('If-None-Match', '"old"')])[0] == 200
+    assert request_('GET', '/api/tasks', headers=[
+        ('If-Modified-Since', 'Thu, 01 Jan 1970 00:00:00 GMT')])[0] == 200
+
+
+def test_stream_reads_store_off_the_event_loop(request_, tmp_path, monkeypatch):
+    import threading
+
+    from sqlite_store import SqliteTaskStore
+
+    store = SqliteTaskStore(str(tmp_path / 'todo.db'))
+    store.batch([{'op': 'add', 'title': str(i)} for i in range(5)])
+    threads = []
+    page = store.page
+
+    def spy(*args):
+        threads.append(threading.current_thread())
+        return page(*args)
+
+    monkeypatch.setattr(store, 'page', spy)
+    monkeypatch.setattr(todo, 'store', store)
+    monkeypatch.setattr('asgi_app.STREAM_BATCH', 2)
+    _, body, _ = request_('GET', '/api/tasks?format=ndjson&limit=4')
+    store.close()
+    assert [json.loads(line)['title'] for line in body.splitlines()] == ['0', '1', '2', '3']
+    assert len(threads) == 2 and threading.main_thread() not in threads
@@ -0,0 +1,104 @@
+import threading
+
+import pytest
+
+import app as todo
+from sqlite_store import SqliteTaskStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = SqliteTaskStore(str(tmp_path / 'todo.db'))
+    for title in ('a', 'b', 'c'):
+        s.add(title)
+    yield s
+    s.close()
+
+
+def test_crud(store):
+    assert [t['title'] for t in store] == ['a', 'b', 'c']
+    assert store.toggle(2) == {'id': 2, 'title': 'b', 'done': True}
+    assert store.update(1, title='A')['title'] == 'A'
+    assert store.remove(3)['title'] == 'c'
+    assert store.remove(3) is None
+    assert store.toggle(42) is None
+    assert store.count() == 2 and store.count(done=True) == 1
+    assert [t['id'] for t in store.filter(done=False)] == [1]
+
+
+def test_at_is_list_position(store):
+    store.remove(1)
+    assert [store.at(i)['id'] for i in range(2)] == [2, 3]
+    assert store.at(2) is None
+
+
+def test_title_lookup_and_removal(store):
+    store.add('a')
+    assert store.find_by_title('a')['id'] == 1
+    assert store.remove_by_title('a')['id'] == 1
+    assert store.find_by_title('a')['id'] == 4
+
+
+def test_page_and_iter(store, monkeypatch):
+    monkeypatch.setattr('sqlite_store.CHUNK', 2)
+    store.toggle(2)
+    assert [t['id'] for t in store.iter_tasks()] == [1, 2, 3]
+    assert [t['id'] for t in store.iter_tasks(after=1, done=False)] == [3]
+    items, cursor = store.page(limit=2)
+    assert [t['id'] for t in items] == [1, 2] and cursor == 2
+
+
+def test_batch_rolls_into_one_transaction(store):
+    results = store.batch([{'op': 'add', 'title': 'd'}, {'op': 'delete', 'id': 9}])
+    assert [r['ok'] for r in results] == [True, False]
+    assert len(store) == 4
+
+
+def test_clear_restarts_ids(store):
+    store.clear()
+    assert store.add('x')['id'] == 1
+
+
+def test_connection_pool_is_bounded(store):
+    def worker():
+        for i in range(50):
+            store.toggle(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert store.get(1)['done'] is False
+    assert len(store._conns) <= 4
+
+    # поток на запрос, как у threaded WSGI: соединения не копятся
+    for _ in range(3):
+        threads = [threading.Thread(target=store.get, args=(1,)) for _ in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    assert len(store._conns) <= store.pool_size
+
+
+def test_version_bumps_only_on_changes(store):
+    version = store.version
+    assert store.toggle(42) is None
+    assert store.update(42, title='x') is None
+    assert store.remove(42) is None
+    store.update(1, title='a', done=False)  # те же значения
+    assert store.batch([{'op': 'delete', 'id': 9}])[0]['ok'] is False
+    assert store.version == version
+    store.toggle(1)
+    assert store.version == version + 1
+
+
+def test_routes_on_sqlite(store, monkeypatch):
+    monkeypatch.setattr(todo, 'store', store)
+    client = todo.app.test_client()
+    client.post('/add', data={'title': 'd'})
+    assert client.post('/toggle/3').status_code == 204  # индекс 3 — задача 'd'
+    assert client.post('/delete/9').status_code == 200
+    done = client.get('/api/tasks?status=done').get_json()
+    assert [t['title'] for t in done] == ['d']
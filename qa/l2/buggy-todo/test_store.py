@@ -0,0 +1,245 @@
+import json
+
+import pytest
+
+import app as todo
+from store import TaskStore
+
+
+@pytest.fixture
+def store():
+    s = TaskStore()
+    for title in ('a', 'b', 'c'):
+        s.add(title)
+    return s
+
+
+@pytest.fixture
+def client():
+    todo.store.clear()
+    return todo.app.test_client()
+
+
+def test_add_keeps_insertion_order(store):
+    assert [t['title'] for t in store] == ['a', 'b', 'c']
+    assert [t['id'] for t in store.all()] == [1, 2, 3]
+
+
+def test_toggle_updates_done_index(store):
+    store.toggle(2)
+    assert store.get(2)['done'] is True
+    assert [t['id'] for t in store.filter(done=True)] == [2]
+    assert store.count(done=False) == 2
+    store.toggle(2)
+    assert store.count(done=True) == 0
+
+
+def test_update_moves_title_index(store):
+    store.update(1, title='z')
+    assert store.find_by_title('a') is None
+    assert store.find_by_title('z')['id'] == 1
+
+
+def test_find_by_title_returns_oldest(store):
+    store.add('a')
+    assert store.find_by_title('a')['id'] == 1
+
+
+def test_remove(store):
+    assert store.remove(2)['title'] == 'b'
+    assert store.remove(2) is None
+    assert 2 not in store
+    assert len(store) == 2
+
+
+def test_missing_id(store):
+    assert store.get(42) is None
+    assert store.toggle(42) is None
+    assert store.update(42, title='x') is None
+
+
+def test_routes_use_store(client):
+    client.post('/add', data={'title': 'first'})
+    client.post('/add', data={'title': 'second'})
+    assert client.post('/toggle/1').status_code == 204  # индекс 1 — задача 2
+    assert client.post('/toggle/99').status_code == 404
+    client.post('/edit/1', data={'title': 'renamed'})
+    tasks = client.get('/api/tasks').get_json()
+    assert [(t['id'], t['title'], t['done']) for t in tasks] == [
+        (1, 'first', False),
+        (2, 'second', True),
+        (3, 'renamed', False),
+    ]
+
+
+def test_seeded_bugs(client):
+    # баги лабораторной (список в начале app.py) — на месте
+    client.post('/add', data={'title': '   '})
+    client.post('/add', data={'title': '1'})
+    assert client.get('/api/tasks').get_json()[0]['title'] == ''
+    assert client.post('/delete/1').status_code == 204  # удалил задачу 2 с title '1'
+    assert [t['id'] for t in client.get('/api/tasks').get_json()] == [1]
+    assert client.post('/delete/1').status_code == 200  # не нашлось, а не 404
+    client.post('/add', data={'title': 'b'})
+    # toggle: id — индекс в списке, /toggle/1 переключает вторую задачу
+    assert client.post('/toggle/1').status_code == 204
+    assert [t['done'] for t in client.get('/api/tasks').get_json()] == [False, True]
+    assert client.post('/toggle/2').status_code == 404
+    # edit: новая задача вместо правки, даже для несуществующего id
+    assert client.post('/edit/9', data={'title': 'x'}).status_code == 302
+    assert [t['title'] for t in client.get('/api/tasks').get_json()] == ['', 'b', 'x']
+
+
+def test_page_and_cursor(store):
+    store.add('d')
+    items, cursor = store.page(limit=2)
+    assert [t['id'] for t in items] == [1, 2] and cursor == 2
+    items, cursor = store.page(after=cursor, limit=2)
+    assert [t['id'] for t in items] == [3, 4] and cursor is None
+
+
+def test_iter_tasks_survives_removal(store):
+    it = store.iter_tasks()
+    assert next(it)['id'] == 1
+    store.remove(2)
+    store.remove(3)  # triggers compaction
+    store.add('d')
+    assert [t['id'] for t in it] == [4]
+
+
+def test_api_filter_and_pagination(client):
+    for title in ('a', 'b', 'c', 'd'):
+        client.post('/add', data={'title': title})
+    client.post('/toggle/1')  # по индексу: задачи 2 и 3
+    client.post('/toggle/2')
+
+    done = client.get('/api/tasks?status=done').get_json()
+    assert [t['id'] for t in done] == [2, 3]
+
+    resp = client.get('/api/tasks?status=active&limit=1')
+    assert [t['id'] for t in resp.get_json()] == [1]
+    cursor = resp.headers['X-Next-Cursor']
+    resp = client.get(f'/api/tasks?status=active&limit=1&cursor={cursor}')
+    assert [t['id'] for t in resp.get_json()] == [4]
+    assert 'X-Next-Cursor' not in resp.headers
+
+    assert client.get('/api/tasks?status=bogus').status_code == 400
+    assert client.get('/api/tasks?limit=0').status_code == 400
+
+
+def test_api_ndjson_stream(client):
+    for title in ('a', 'b', 'c'):
+        client.post('/add', data={'title': title})
+    resp = client.get('/api/tasks?format=ndjson&limit=2')
+    assert resp.mimetype == 'application/x-ndjson'
+    lines = resp.get_data(as_text=True).splitlines()
+    assert [json.loads(line)['title'] for line in lines] == ['a', 'b']
+
+
+def test_index_filters_server_side(client):
+    client.post('/add', data={'title': 'open-task'})
+    client.post('/add', data={'title': 'closed-task'})
+    client.post('/toggle/1')
+    html = client.get('/?status=active').get_data(as_text=True)
+    assert 'open-task' in html and 'closed-task' not in html
+
+
+def test_index_is_paginated(client, monkeypatch):
+    monkeypatch.setattr(todo, 'PAGE_SIZE', 2)
+    for title in ('t1', 't2', 't3'):
+        client.post('/add', data={'title': title})
+    html = client.get('/').get_data(as_text=True)
+    assert 't2' in html and 't3' not in html
+    assert 'data-cursor="2"' in html
+
+    resp = client.get('/fragments/tasks?cursor=2')
+    assert 't3' in resp.get_data(as_text=True)
+    assert 'X-Next-Cursor' not in resp.headers
+
+
+def test_toggle_and_edit_return_fragment(client):
+    client.post('/add', data={'title': 'a'})
+    headers = {'X-Fragment': '1'}
+
+    html = client.post('/toggle/0', headers=headers).get_data(as_text=True)
+    assert html.startswith('<li data-id="1" class="done">')
+
+    # edit отдаёт <li> добавленной (по ошибке) задачи
+    resp = client.post('/edit/1', data={'title': 'b'}, headers=headers)
+    assert resp.status_code == 200
+    html = resp.get_data(as_text=True)
+    assert html.startswith('<li data-id="2"') and '<span class="title">b</span>' in html
+
+    assert client.get('/fragments/task/1').get_data(as_text=True).count('<li') == 1
+    assert client.get('/fragments/task/9').status_code == 404
+
+
+def test_batch_results_per_operation(store):
+    results = store.batch([
+        {'op': 'add', 'title': ' d '},
+        {'op': 'toggle', 'id': 1},
+        {'op': 'edit', 'id': 2, 'title': 'B'},
+        {'op': 'delete', 'id': 3},
+        {'op': 'delete', 'id': 3},
+        {'op': 'explode'},
+        {'op': 'toggle', 'id': '1'},
+    ])
+    assert [r['ok'] for r in results] == [True, True, True, True, False, False, False]
+    assert results[0]['task'] == {'id': 4, 'title': 'd', 'done': False}
+    assert results[4]['error'] == 'not found'
+    assert [(t['title'], t['done']) for t in store] == [('a', True), ('B', False), ('d', False)]
+
+
+def test_api_batch(client):
+    resp = client.post('/api/batch', json={'ops': [
+        {'op': 'add', 'title': 'x'},
+        {'op': 'add', 'title': 'y'},
+        {'op': 'toggle', 'id': 2},
+    ]})
+    assert resp.status_code == 200
+    assert [r['ok'] for r in resp.get_json()['results']] == [True, True, True]
+    assert todo.store.count(done=True) == 1
+
+    assert client.post('/api/batch', data='nope').status_code == 400
+    assert client.post('/api/batch', json={'op': 'add'}).status_code == 400
+
+
+def test_conditional_get(client):
+    client.post('/add', data={'title': 'a'})
+    first = client.get('/api/tasks')
+    etag = first.headers['ETag']
+    assert first.headers['Last-Modified']
+
+    again = client.get('/api/tasks', headers={'If-None-Match': etag})
+    assert again.status_code == 304 and again.get_data() == b''
+    # страница и API версионируются одним счётчиком
+    assert client.get('/', headers={'If-None-Match': etag}).status_code == 304
+
+    client.post('/toggle/0')
+    changed = client.get('/api/tasks', headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+    assert changed.get_json()[0]['done'] is True
+
+
+def test_responses_are_cached_until_version_changes(client, monkeypatch):
+    client.post('/add', data={'title': 'a'})
+    calls = []
+    page = todo.store.page
+    monkeypatch.setattr(todo.store, 'page', lambda *a: calls.append(a) or page(*a))
+
+    for _ in range(3):
+        assert client.get('/api/tasks?limit=5').get_json()[0]['title'] == 'a'
+    assert len(calls) == 1
+
+    client.post('/edit/1', data={'title': 'b'})
+    assert [t['title'] for t in client.get('/api/tasks?limit=5').get_json()] == ['a', 'b']
+    assert len(calls) == 2
+
+
+def test_at_is_list_position(store):
+    assert [store.at(i)['title'] for i in range(3)] == ['a', 'b', 'c']
+    assert store.at(3) is None
+    store.remove(1)
+    # как tasks[i] после tasks.remove: позиции сдвигаются
+    assert store.at(0)['title'] == 'b' and store.at(2) is None
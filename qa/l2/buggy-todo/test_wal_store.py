@@ -0,0 +1,142 @@
+import os
+
+import pytest
+
+from wal_store import WalCorruptedError, WalTaskStore
+
+
+@pytest.fixture
+def reopen(tmp_path):
+    opened = []
+
+    def _open(**kwargs):
+        if opened:
+            opened[-1].close()
+        store = WalTaskStore(str(tmp_path), **kwargs)
+        opened.append(store)
+        return store
+
+    yield _open
+    opened[-1].close()
+
+
+def state(store):
+    return [(t['id'], t['title'], t['done']) for t in store]
+
+
+def test_replays_log_after_restart(reopen):
+    store = reopen()
+    store.add('a')
+    store.add('b')
+    store.add('c')
+    store.toggle(1)
+    store.update(2, title='B')
+    store.remove(3)
+    before = state(store)
+
+    store = reopen()
+    assert state(store) == before
+    # id удалённой задачи не выдаётся повторно
+    assert store.add('d')['id'] == 4
+
+
+def test_snapshot_then_tail(reopen, tmp_path):
+    store = reopen(snapshot_every=10)
+    for i in range(25):
+        store.add(str(i))
+    store.toggle(5)
+    store.snapshot()
+    store.remove_by_title('7')
+    before = state(store)
+    assert os.path.exists(tmp_path / 'snapshot.json')
+    # в журнале остались только записи после снимка
+    assert len(os.listdir(tmp_path)) == 2
+
+    store = reopen(snapshot_every=10)
+    assert state(store) == before
+    assert store.count(done=True) == 1
+    assert store.find_by_title('7') is None
+
+
+def test_torn_last_record_is_ignored(reopen, tmp_path):
+    store = reopen()
+    store.add('a')
+    store.add('b')
+    store.close()
+    segment = sorted(n for n in os.listdir(tmp_path) if n.startswith('wal-'))[-1]
+    with open(tmp_path / segment, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 3, "op": "ad')
+
+    store = reopen()
+    assert state(store) == [(1, 'a', False), (2, 'b', False)]
+
+
+def segments(tmp_path):
+    return sorted(n for n in os.listdir(tmp_path) if n.startswith('wal-'))
+
+
+def test_torn_record_in_middle_segment_is_an_error(reopen, tmp_path):
+    store = reopen()
+    store.add('a')
+    store = reopen()
+    store.add('b')
+    store.close()
+    first, *later = segments(tmp_path)
+    assert later == ['wal-000000000002.log']
+    with open(tmp_path / first, 'r+b') as f:
+        f.truncate(os.path.getsize(tmp_path / first) - 1)  # запись без \n
+
+    with pytest.raises(WalCorruptedError, match=first):
+        reopen()
+    # журнал не тронут: ни обрезки, ни новых сегментов
+    assert segments(tmp_path) == [first, *later]
+
+
+def test_torn_record_followed_by_empty_segments(reopen, tmp_path):
+    store = reopen()
+    store.add('a')
+    store.add('b')
+    store.close()
+    first = segments(tmp_path)[0]
+    with open(tmp_path / first, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 3, "op": "ad')
+    open(tmp_path / 'wal-000000000004.log', 'w').close()
+
+    store = reopen()
+    assert segments(tmp_path) == [first, 'wal-000000000003.log']
+    store.add('c')
+    store = reopen()
+    assert state(store) == [(1, 'a', False), (2, 'b', False), (3, 'c', False)]
+
+
+def test_append_after_crash_survives_next_recovery(reopen, tmp_path):
+    store = reopen()
+    store.add('a')
+    reopen().close()
+    # сбой на первой записи нового сегмента: при открытии он же и дописывается
+    segment = sorted(n for n in os.listdir(tmp_path) if n.startswith('wal-'))[-1]
+    assert os.path.getsize(tmp_path / segment) == 0
+    with open(tmp_path / segment, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "op": "ad')
+
+    store = reopen()
+    store.add('b')
+    store.add('c')
+    store = reopen()
+    assert state(store) == [(1, 'a', False), (2, 'b', False), (3, 'c', False)]
+
+
+def test_batch_is_one_group(reopen):
+    store = reopen(sync_every=10_000, sync_interval=60)
+    store.batch([{'op': 'add', 'title': str(i)} for i in range(100)])
+    # transaction() сбрасывает журнал сам, не дожидаясь sync_every
+    assert store._pending == 0
+    assert len(reopen()) == 100
+
+
+def test_clear_is_logged(reopen):
+    store = reopen()
+    store.add('a')
+    store.clear()
+    store.add('b')
+    assert state(reopen()) == [(1, 'b', False)]
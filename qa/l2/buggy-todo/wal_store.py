@@ -0,0 +1,246 @@
+"""Хранилище задач на диске: журнал упреждающей записи (WAL) + снимки.
+
+Каталог данных:
+    snapshot.json          - последний снимок: seq, next_id и все задачи
+    wal-<first_seq>.log    - сегменты журнала, одна JSON-запись на строку
+
+Каждое изменение дописывается в текущий сегмент журнала. fsync делается
+группами: как только накопилось ``sync_every`` записей, либо фоновым
+потоком раз в ``sync_interval`` секунд, либо в конце transaction()/batch().
+После ``snapshot_every`` записей под локом снимается копия задач (задачи
+неизменяемы, так что это просто список ссылок) и журнал переключается
+на новый сегмент; сам снимок пишется в фоне, после чего старые сегменты
+удаляются. При старте грузится снимок и проигрываются только записи
+журнала с seq больше, чем у снимка; недописанная при сбое последняя
+запись обрезается, чтобы новые записи не склеились с ней в одну строку.
+Обрезается только хвост журнала: битая запись, за которой в следующих
+сегментах есть ещё записи, — это повреждение, а не сбой, и открытие
+падает с WalCorruptedError.
+"""
+import json
+import os
+import threading
+import itertools
+from contextlib import contextmanager
+
+from store import TaskStore
+
+SNAPSHOT = 'snapshot.json'
+
+
+class WalCorruptedError(RuntimeError):
+    """Битая запись в середине журнала: дальнейшие записи не проиграть."""
+
+
+class WalTaskStore(TaskStore):
+    """TaskStore, переживающий перезапуск процесса."""
+
+    blocking_io = True
+
+    def __init__(self, path, sync_every=256, sync_interval=0.05, snapshot_every=100_000):
+        super().__init__()
+        self.path = path
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.snapshot_every = snapshot_every
+        os.makedirs(path, exist_ok=True)
+
+        self._wal_lock = threading.Lock()
+        self._wal = None
+        self._seq = 0
+        self._last_id = 0
+        self._pending = 0
+        self._since_snapshot = 0
+        self._snapshot_thread = None
+
+        self._recover()
+        self._open_segment(self._seq + 1)
+
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    # --- восстановление ---
+
+    def _segments(self):
+        names = [n for n in os.listdir(self.path) if n.startswith('wal-') and n.endswith('.log')]
+        return sorted(names, key=lambda n: int(n[4:-4]))
+
+    def _recover(self):
+        next_id = 1
+        snapshot = os.path.join(self.path, SNAPSHOT)
+        if os.path.exists(snapshot):
+            with open(snapshot, encoding='utf-8') as f:
+                data = json.load(f)
+            self._seq = data['seq']
+            next_id = data['next_id']
+            for task_id, title, done in data['tasks']:
+                self._insert({'id': task_id, 'title': title, 'done': done})
+
+        torn = None
+        segments = [os.path.join(self.path, n) for n in self._segments()]
+        for i, segment in enumerate(segments):
+            with open(segment, 'rb') as f:
+                offset = 0
+                for line in f:
+                    try:
+                        # запись без \n тоже недописана: следующая приклеилась бы к ней
+                        if not line.endswith(b'\n'):
+                            raise ValueError(line)
+                        rec = json.loads(line)
+                    except ValueError:
+                        torn = segment, offset
+                        break
+                    offset += len(line)
+                    if rec['seq'] <= self._seq:
+                        continue
+                    self._replay(rec)
+                    self._seq = rec['seq']
+                    if rec['op'] == 'add':
+                        next_id = max(next_id, rec['task']['id'] + 1)
+                    elif rec['op'] == 'clear':
+                        next_id = 1
+            if torn:
+                self._drop_tail(segments[i + 1:], *torn)
+                break
+
+        self._ids = itertools.count(next_id)
+        self._last_id = next_id - 1
+
+    @staticmethod
+    def _drop_tail(later, segment, size):
+        # недописанная последняя строка после сбоя; за ней могут быть только
+        # пустые сегменты, иначе seq новых записей разошёлся бы с журналом
+        if any(os.path.getsize(name) for name in later):
+            raise WalCorruptedError(
+                f'битая запись в {segment} (смещение {size}), '
+                f'но за ней есть записи в {", ".join(later)}')
+        for name in later:
+            os.remove(name)
+        with open(segment, 'r+b') as f:
+            f.truncate(size)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _replay(self, rec):
+        op, task = rec['op'], rec.get('task')
+        if op == 'add':
+            self._insert(task)
+        elif op == 'update':
+            self._replace(self._tasks[task['id']], task)
+        elif op == 'remove':
+            # как _remove, но без записи в журнал
+            self._unindex(self._tasks.pop(task['id']))
+            self._dead += 1
+            if self._dead > len(self._order) // 2:
+                self._compact()
+        elif op == 'clear':
+            self._tasks = {}
+            self._by_done = {False: {}, True: {}}
+            self._by_title = {}
+            self._order = []
+            self._dead = 0
+
+    # --- журнал ---
+
+    def _open_segment(self, first_seq):
+        name = os.path.join(self.path, f'wal-{first_seq:012d}.log')
+        self._wal = open(name, 'a', encoding='utf-8')
+
+    def _log(self, op, task):
+        # под _index_lock: порядок seq совпадает с порядком изменений
+        self._seq += 1
+        if op == 'add':
+            self._last_id = task['id']
+        elif op == 'clear':
+            self._last_id = 0
+        rec = {'seq': self._seq, 'op': op}
+        if task is not None:
+            rec['task'] = task
+        with self._wal_lock:
+            self._wal.write(json.dumps(rec, ensure_ascii=False) + '\n')
+            self._pending += 1
+            if self._pending >= self.sync_every:
+                self._sync_locked()
+        self._since_snapshot += 1
+        if self._since_snapshot >= self.snapshot_every:
+            self._start_snapshot()
+
+    def _sync_locked(self):
+        self._wal.flush()
+        os.fsync(self._wal.fileno())
+        self._pending = 0
+
+    def sync(self):
+        """Принудительно сбросить журнал на диск."""
+        with self._wal_lock:
+            if self._pending:
+                self._sync_locked()
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.sync_interval):
+            self.sync()
+
+    @contextmanager
+    def transaction(self):
+        with super().transaction() as store:
+            yield store
+        # групповой коммит: весь пакет — один fsync
+        self.sync()
+
+    # --- снимки ---
+
+    def _start_snapshot(self):
+        # под _index_lock: копия списка задач + переключение сегмента
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return  # прошлый снимок ещё пишется — снимем позже
+        self._since_snapshot = 0
+        tasks = list(self._tasks.values())
+        seq, next_id = self._seq, self._last_id + 1
+        with self._wal_lock:
+            self._sync_locked()
+            self._wal.close()
+            self._open_segment(seq + 1)
+        self._snapshot_thread = threading.Thread(
+            target=self._write_snapshot, args=(tasks, seq, next_id), daemon=True)
+        self._snapshot_thread.start()
+
+    def _write_snapshot(self, tasks, seq, next_id):
+        data = {
+            'seq': seq,
+            'next_id': next_id,
+            'tasks': [[t['id'], t['title'], t['done']] for t in tasks],
+        }
+        final = os.path.join(self.path, SNAPSHOT)
+        tmp = final + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            # dumps, а не dump: dump пишет по кусочкам и в разы медленнее
+            f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, final)
+        # всё, что <= seq, уже в снимке
+        for name in self._segments():
+            if int(name[4:-4]) <= seq:
+                os.remove(os.path.join(self.path, name))
+
+    def snapshot(self):
+        """Снять снимок сейчас и дождаться его записи."""
+        with self._index_lock:
+            self._wait_snapshot()
+            self._start_snapshot()
+        self._wait_snapshot()
+
+    def _wait_snapshot(self):
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+
+    def close(self):
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._flusher.join()
+        self._wait_snapshot()
+        with self._wal_lock:
+            self._sync_locked()
+            self._wal.close()
@@ -0,0 +1,34 @@
+# conftest.py
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from selenium_common.driver_pool import chromedriver_path
+
+# --drivers/--headless, фикстуры driver_pool и driver, шардинг под xdist,
+# сводка пула и кэша элементов
+pytest_plugins = ["selenium_common.plugin"]
+
+
+def make_driver(headless=False):
+    options = Options()
+    # Для CI/виртуального сервера (и всегда под pytest-xdist) — headless
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    # Опции для исправления проблемы с data: URL на macOS
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option('useAutomationExtension', False)
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+
+    service = ChromeService(chromedriver_path())
+    return webdriver.Chrome(service=service, options=options)
+
+
+@pytest.fixture(scope="session")
+def driver_factory():
+    return make_driver
+
@@ -3,6 +3,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from selenium_common.element_cache import ElementCache
+
 class LoginPage:
     URL = "https://the-internet.herokuapp.com/login"
     USER = (By.ID, "username")
@@ -12,14 +14,19 @@ class LoginPage:
 
     def __init__(self, driver):
         self.driver = driver
+        self.cache = ElementCache()
 
     def open(self):
+        self.cache.clear()
         self.driver.get(self.URL)
 
+    def _find(self, locator):
+        return self.driver.find_element(*locator)
+
     def login(self, username, password):
-        self.driver.find_element(*self.USER).send_keys(username)
-        self.driver.find_element(*self.PASS).send_keys(password)
-        self.driver.find_element(*self.SUBMIT).click()
+        self.cache.use(self.USER, self._find, lambda e: e.send_keys(username))
+        self.cache.use(self.PASS, self._find, lambda e: e.send_keys(password))
+        self.cache.use(self.SUBMIT, self._find, lambda e: e.click())
 
     def wait_for_logout(self, timeout=10):
         wait = WebDriverWait(self.driver, timeout)
@@ -1,11 +1,6 @@
 # tests/test_login.py
 import os
-import pytest
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -13,24 +8,8 @@ LOGIN_URL = "https://the-internet.herokuapp.com/login"
 VALID_USER = os.getenv("TEST_USERNAME", "tomsmith")
 VALID_PASS = os.getenv("TEST_PASSWORD", "SuperSecretPassword!")
 
-@pytest.fixture(scope="function")
-def driver():
-    options = Options()
-    # Для CI/виртуального сервера можно включить headless:
-    # options.add_argument("--headless=new")  # или "--headless"
-    options.add_argument("--window-size=1920,1080")
-    # Опции для исправления проблемы с data: URL на macOS
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    
-    service = ChromeService(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    yield driver
-    driver.quit()
 
+# driver — из conftest.py: браузер из общего на сессию пула
 def test_login_valid_shows_logout(driver):
     driver.get(LOGIN_URL)
 
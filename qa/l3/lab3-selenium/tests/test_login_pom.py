@@ -1,26 +1,5 @@
-import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
 from pages.login_page import LoginPage
 
-@pytest.fixture(scope="function")
-def driver():
-    options = Options()
-    options.add_argument("--window-size=1920,1080")
-    # Опции для исправления проблемы с data: URL на macOS
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    options.add_experimental_option('useAutomationExtension', False)
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--no-sandbox")
-    
-    service = ChromeService(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    yield driver
-    driver.quit()
-
 def test_login_pom(driver):
     page = LoginPage(driver)
     page.open()
@@ -1,13 +1,78 @@
 # conftest.py
+from collections import defaultdict
+
 import pytest
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
-@pytest.fixture
-def driver():
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service)
-    driver.maximize_window()
-    yield driver
-    driver.quit()
+
+from selenium_common.driver_pool import chromedriver_path
+from selenium_common.sharding import is_xdist_worker
+from pages.base_page import TIMER
+
+# --drivers/--headless, фикстуры driver_pool и driver, шардинг под xdist,
+# сводка пула и кэша элементов
+pytest_plugins = ["selenium_common.plugin"]
+
+TIMINGS_KEY = pytest.StashKey[dict]()
+
+
+def make_driver(headless=False):
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    service = Service(chromedriver_path())
+    driver = webdriver.Chrome(service=service, options=options)
+    if not headless:
+        driver.maximize_window()
+    return driver
+
+
+@pytest.fixture(scope="session")
+def driver_factory():
+    return make_driver
+
+
+@pytest.fixture(autouse=True)
+def page_timings(request):
+    """Длительности действий страниц: в user_properties теста (попадают
+    в junitxml/html-отчёт) и в общую сводку в конце прогона."""
+    TIMER.take()
+    yield
+    records = TIMER.take()
+    if not records:
+        return
+    request.node.user_properties.append(
+        ("page_actions", "; ".join(f"{a} {t} {s:.3f}s" for a, t, s in records)))
+    totals = request.config.stash.setdefault(TIMINGS_KEY, defaultdict(list))
+    for action, _, seconds in records:
+        totals[action].append(seconds)
+
+
+# --- сводка page actions; пул и кэш элементов сводит selenium_common.plugin ---
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if is_xdist_worker(config):
+        config.workeroutput["page_timings"] = dict(config.stash.get(TIMINGS_KEY, {}))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    totals = node.config.stash.setdefault(TIMINGS_KEY, defaultdict(list))
+    for action, values in output.get("page_timings", {}).items():
+        totals[action].extend(values)
+
+
+@pytest.hookimpl(trylast=True)  # после сводки пула и кэша
+def pytest_terminal_summary(terminalreporter, config):
+    totals = config.stash.get(TIMINGS_KEY, None)
+    if totals:
+        terminalreporter.write_sep("-", "page actions")
+        terminalreporter.write_line(f"{'action':<14} {'count':>6} {'total s':>8} {'avg s':>7} {'max s':>7}")
+        for action, values in sorted(totals.items(), key=lambda kv: -sum(kv[1])):
+            terminalreporter.write_line(
+                f"{action:<14} {len(values):>6} {sum(values):>8.2f} "
+                f"{sum(values) / len(values):>7.3f} {max(values):>7.3f}")
@@ -1,38 +1,167 @@
+import functools
+import time
+
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
+
+from selenium_common.element_cache import ElementCache
+
+DEFAULT_TIMEOUT = 15   # общий дедлайн ожидания, с
+DEFAULT_POLL = 0.05    # как часто проверять условие, с
+
+SCROLL_JS = "arguments[0].scrollIntoView({block: 'center'});"
+
+# Положение элемента в окне; null — элемент за пределами окна
+# (элемент выше окна целиком не поместится, так что хватает пересечения)
+RECT_IN_VIEWPORT_JS = """
+const r = arguments[0].getBoundingClientRect();
+const h = window.innerHeight || document.documentElement.clientHeight;
+const w = window.innerWidth || document.documentElement.clientWidth;
+const visible = r.bottom > 0 && r.right > 0 && r.top < h && r.left < w;
+return visible ? [r.top, r.left] : null;
+"""
+
+# Заполнение нескольких полей за один вызов execute_script.
+# arguments[0] — список [by, value, text]; text === null означает клик.
+# Значение ставится сеттером прототипа, а не el.value = ...: иначе
+# React (demoqa) не заметит изменения; затем input/change, как при вводе.
+FILL_FIELDS_JS = """
+const find = (by, what) => {
+    switch (by) {
+        case 'id': return document.getElementById(what);
+        case 'css selector': return document.querySelector(what);
+        case 'name': return document.getElementsByName(what)[0] || null;
+        case 'xpath': return document.evaluate(what, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return null;
+};
+const missing = [];
+arguments[0].forEach(([by, what, text], i) => {
+    const el = find(by, what);
+    if (!el) { missing.push(i); return; }
+    if (text === null) { el.click(); return; }
+    el.focus();
+    Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set.call(el, text);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    el.blur();
+});
+return missing;
+"""
+
+
+class scrolled_into_view:
+    """Условие ожидания: элемент в окне и прокрутка закончилась
+    (положение не изменилось с прошлой проверки)."""
+
+    def __init__(self, element):
+        self.element = element
+        self.last = None
+
+    def __call__(self, driver):
+        rect = driver.execute_script(RECT_IN_VIEWPORT_JS, self.element)
+        stable = rect is not None and rect == self.last
+        self.last = rect
+        return self.element if stable else False
+
+
+class ActionTimer:
+    """Копит длительности действий страниц, conftest выводит их в отчёт."""
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, action, target, seconds):
+        self.records.append((action, target, seconds))
+
+    def take(self):
+        records, self.records = self.records, []
+        return records
+
+
+TIMER = ActionTimer()
+
+
+def timed(method):
+    """Замер действия страницы: (имя метода, локатор/URL, секунды) в TIMER."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            target = args[0] if args else ""
+            TIMER.record(method.__name__, str(target), time.perf_counter() - start)
+    return wrapper
+
 
 class BasePage:
-    def __init__(self, driver):
+    def __init__(self, driver, timeout=DEFAULT_TIMEOUT, poll=DEFAULT_POLL):
         self.driver = driver
-        self.timeout = 15
+        self.timeout = timeout
+        self.poll = poll
+        self.cache = ElementCache()
+
+    def wait(self, condition, timeout=None):
+        """Ждать condition с опросом раз в self.poll, не дольше timeout."""
+        return WebDriverWait(
+            self.driver, self.timeout if timeout is None else timeout,
+            poll_frequency=self.poll,
+        ).until(condition)
 
+    @timed
     def open(self, url):
+        self.cache.clear()
         self.driver.get(url)
 
+    def locate(self, locator):
+        """Поиск в браузере с ожиданием, мимо кэша."""
+        return self.wait(EC.presence_of_element_located(locator))
+
     def find(self, locator):
-        return WebDriverWait(self.driver, self.timeout).until(
-            EC.presence_of_element_located(locator)
-        )
+        return self.cache.get(locator, self.locate)
 
-    def click(self, locator):
-        element = self.find(locator)
-        # Прокручиваем к элементу, чтобы он был видимым
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        # Ждем немного, чтобы прокрутка завершилась
-        import time
-        time.sleep(0.5)
+    def scroll_to(self, element):
+        # Прокручиваем к элементу и ждём, пока он встанет в окне
+        self.driver.execute_script(SCROLL_JS, element)
+        return self.wait(scrolled_into_view(element))
+
+    def _click(self, element):
+        self.scroll_to(element)
+        self.wait(EC.element_to_be_clickable(element))
         # Используем JavaScript клик для надежности
         self.driver.execute_script("arguments[0].click();", element)
 
+    @timed
+    def click(self, locator):
+        self.cache.use(locator, self.locate, self._click)
+
+    @timed
     def type(self, locator, text):
-        field = self.find(locator)
-        # Прокручиваем к полю, чтобы оно было видимым
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", field)
-        import time
-        time.sleep(0.3)
-        field.clear()
-        field.send_keys(text)
+        def type_into(field):
+            self.scroll_to(field)
+            field.clear()
+            field.send_keys(text)
+        self.cache.use(locator, self.locate, type_into)
+
+    @timed
+    def fill_fields(self, fields):
+        """Заполнить поля одним round trip: fields — [(локатор, текст)],
+        текст None — клик по элементу. Поля, которых на странице (ещё)
+        нет, заполняются по одному обычными type/click с ожиданием."""
+        batch = [[by, what, text] for (by, what), text in fields]
+        missing = self.driver.execute_script(FILL_FIELDS_JS, batch) if batch else []
+        for i in missing:
+            locator, text = fields[i]
+            if text is None:
+                self.click(locator)
+            else:
+                self.type(locator, text)
+
+    @timed
+    def wait_visible(self, locator, timeout=None):
+        return self.wait(EC.visibility_of_element_located(locator), timeout)
 
     def get_text(self, locator):
-        return self.find(locator).text
+        return self.cache.use(locator, self.locate, lambda element: element.text)
@@ -1,6 +1,6 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
-import time
 
 class ContactPage(BasePage):
     URL = "https://demoqa.com/automation-practice-form"
@@ -13,34 +13,49 @@ class ContactPage(BasePage):
     SUCCESS_MODAL = (By.CSS_SELECTOR, ".modal-content")
     EMAIL_ERROR = (By.CSS_SELECTOR, "input#userEmail[aria-invalid='true']")  # правильный селектор ошибки
 
+    # Поля, которым нужны настоящие нажатия клавиш (автодополнение,
+    # маски ввода и т.п.) — их fill_form всегда набирает через send_keys.
+    # На этой форме среди заполняемых таких нет.
+    KEY_EVENT_FIELDS = ()
+
     def open_page(self):
         self.open(self.URL)
 
-    def fill_form(self, firstname, lastname, email, gender="Male", mobile="1234567890"):
-        self.type(self.FIRST_NAME, firstname)
-        self.type(self.LAST_NAME, lastname)
+    def fill_form(self, firstname, lastname, email, gender="Male", mobile="1234567890", fast=True):
+        """fast=True — все поля одним execute_script (см. BasePage.fill_fields),
+        fast=False — по старинке, поле за полем через send_keys."""
+        fields = [(self.FIRST_NAME, firstname), (self.LAST_NAME, lastname)]
         if email:  # заполняем email только если он не пустой
-            self.type(self.EMAIL, email)
-
+            fields.append((self.EMAIL, email))
         # Выбор пола
         if gender:
-            gender_locator = (By.XPATH, f"//label[text()='{gender}']")
-            self.click(gender_locator)
-
+            fields.append(((By.XPATH, f"//label[text()='{gender}']"), None))
         # Мобильный телефон
         if mobile:
-            self.type(self.MOBILE, mobile)
-
+            fields.append((self.MOBILE, mobile))
+
+        if fast:
+            self.find(self.FIRST_NAME)  # форма отрисована
+            keyed = [f for f in fields if f[0] in self.KEY_EVENT_FIELDS]
+            self.fill_fields([f for f in fields if f[0] not in self.KEY_EVENT_FIELDS])
+        else:
+            keyed = fields
+        for locator, text in keyed:
+            if text is None:
+                self.click(locator)
+            else:
+                self.type(locator, text)
 
     def submit_form(self):
+        # появление модального окна ждёт success_message_visible
         self.click(self.SUBMIT)
-        time.sleep(2)  # ждем появления модального окна
 
-    def success_message_visible(self):
+    def success_message_visible(self, timeout=None):
         try:
-            return self.find(self.SUCCESS_MODAL)
-        except:
+            return self.wait_visible(self.SUCCESS_MODAL, timeout)
+        except TimeoutException:
             return None
 
     def email_error_visible(self):
-        return self.find(self.EMAIL_ERROR)
+        # состояние поля меняется, поэтому каждый раз ищем заново, мимо кэша
+        return self.locate(self.EMAIL_ERROR)
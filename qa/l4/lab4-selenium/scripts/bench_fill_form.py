@@ -0,0 +1,68 @@
+# scripts/bench_fill_form.py
+"""Round trips и время ContactPage.fill_form: поле за полем vs одним JS.
+
+    .venv/bin/python scripts/bench_fill_form.py              # 5 повторов
+    .venv/bin/python scripts/bench_fill_form.py --repeat 20 --headless
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+LAB = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [LAB, os.path.dirname(os.path.dirname(LAB))]  # лаба и qa/ (selenium_common)
+
+from selenium_common.driver_pool import chromedriver_path  # noqa: E402
+from pages.contact_page import ContactPage  # noqa: E402
+
+
+def count_round_trips(driver):
+    """Обернуть driver.execute: через него идёт каждая команда WebDriver."""
+    counter = {"n": 0}
+    execute = driver.execute
+
+    def counting(*args, **kwargs):
+        counter["n"] += 1
+        return execute(*args, **kwargs)
+
+    driver.execute = counting
+    return counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    options = Options()
+    if args.headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    driver = webdriver.Chrome(service=ChromeService(chromedriver_path()), options=options)
+    counter = count_round_trips(driver)
+    page = ContactPage(driver)
+    try:
+        print(f"{'mode':<6} {'round trips':>11} {'median s':>9} {'min s':>7}")
+        for label, fast in (("slow", False), ("fast", True)):
+            times, trips = [], []
+            for _ in range(args.repeat):
+                page.open_page()
+                counter["n"] = 0
+                start = time.perf_counter()
+                page.fill_form("Alex", "Markov", "alex@example.com", "Male", "1234567890", fast=fast)
+                times.append(time.perf_counter() - start)
+                trips.append(counter["n"])
+            print(f"{label:<6} {statistics.median(trips):>11.0f} "
+                  f"{statistics.median(times):>9.3f} {min(times):>7.3f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == "__main__":
+    main()
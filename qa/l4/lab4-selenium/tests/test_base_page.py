@@ -0,0 +1,48 @@
+"""Ожидания и замеры BasePage на фейковом драйвере — без Chrome."""
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from pages.base_page import TIMER, BasePage, scrolled_into_view
+
+
+class ScrollingDriver:
+    """Элемент «доезжает» до окна за несколько вызовов JS."""
+
+    def __init__(self, positions):
+        self.positions = list(positions)
+        self.scripts = []
+
+    def execute_script(self, script, *args):
+        self.scripts.append(script)
+        if "getBoundingClientRect" in script:
+            return self.positions.pop(0) if len(self.positions) > 1 else self.positions[0]
+        return None
+
+    def get(self, url):
+        pass
+
+
+def test_scrolled_into_view_waits_until_position_is_stable():
+    driver = ScrollingDriver([None, [400, 0], [120, 0], [100, 0], [100, 0]])
+    condition = scrolled_into_view("element")
+    results = [condition(driver) for _ in range(5)]
+    assert results == [False, False, False, False, "element"]
+
+
+def test_scroll_to_polls_instead_of_sleeping():
+    driver = ScrollingDriver([[300, 0], [50, 0], [50, 0]])
+    page = BasePage(driver, timeout=1, poll=0.001)
+    assert page.scroll_to("element") == "element"
+
+
+def test_wait_has_total_deadline():
+    page = BasePage(ScrollingDriver([None]), timeout=0.05, poll=0.01)
+    with pytest.raises(TimeoutException):
+        page.scroll_to("element")
+
+
+def test_actions_are_timed():
+    TIMER.take()
+    BasePage(ScrollingDriver([None])).open("https://demoqa.com")
+    [(action, target, seconds)] = TIMER.take()
+    assert (action, target) == ("open", "https://demoqa.com") and seconds >= 0
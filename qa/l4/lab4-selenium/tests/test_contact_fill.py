@@ -0,0 +1,88 @@
+"""ContactPage.fill_form: быстрый режим — один execute_script на все поля."""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.base_page import FILL_FIELDS_JS
+from pages.contact_page import ContactPage
+
+
+class FakeElement(WebElement):
+    # наследник WebElement: element_to_be_clickable отличает элемент от локатора
+    def __init__(self, driver, locator):
+        self.driver = driver
+        self.locator = locator
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def clear(self):
+        self.driver.calls.append(("clear", self.locator))
+
+    def send_keys(self, text):
+        self.driver.calls.append(("send_keys", self.locator, text))
+
+
+class FakeDriver:
+    """Считает обращения к WebDriver — каждое было бы HTTP round trip."""
+
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = list(missing)
+
+    def find_element(self, by, what):
+        self.calls.append(("find_element", (by, what)))
+        return FakeElement(self, (by, what))
+
+    def execute_script(self, script, *args):
+        self.calls.append(("execute_script", script, args))
+        if script == FILL_FIELDS_JS:
+            return self.missing
+        if "getBoundingClientRect" in script:
+            return [100, 0]  # элемент уже в окне и не двигается
+        return None
+
+
+def test_fast_fill_is_one_script_call():
+    driver = FakeDriver()
+    ContactPage(driver).fill_form("Alex", "Markov", "alex@example.com", "Male", "1234567890")
+    scripts = [c for c in driver.calls if c[0] == "execute_script"]
+    assert len(scripts) == 1 and scripts[0][1] == FILL_FIELDS_JS
+    assert scripts[0][2][0] == [
+        ["id", "firstName", "Alex"],
+        ["id", "lastName", "Markov"],
+        ["id", "userEmail", "alex@example.com"],
+        ["xpath", "//label[text()='Male']", None],
+        ["id", "userNumber", "1234567890"],
+    ]
+    assert len(driver.calls) == 2  # find (форма на месте) + скрипт
+
+
+def test_slow_fill_types_field_by_field():
+    driver = FakeDriver()
+    ContactPage(driver).fill_form("Alex", "Markov", "", "Male", "1234567890", fast=False)
+    typed = [c[1:] for c in driver.calls if c[0] == "send_keys"]
+    assert typed == [((By.ID, "firstName"), "Alex"), ((By.ID, "lastName"), "Markov"),
+                     ((By.ID, "userNumber"), "1234567890")]
+    assert len(driver.calls) > 10
+
+
+def test_missing_fields_fall_back_to_typing():
+    driver = FakeDriver(missing=[2])
+    ContactPage(driver).fill_form("Alex", "Markov", "alex@example.com", gender=None, mobile=None)
+    assert [c[1:] for c in driver.calls if c[0] == "send_keys"] == [
+        ((By.ID, "userEmail"), "alex@example.com")]
+
+
+def test_key_event_fields_are_typed():
+    class KeyedPage(ContactPage):
+        KEY_EVENT_FIELDS = (ContactPage.MOBILE,)
+
+    driver = FakeDriver()
+    KeyedPage(driver).fill_form("Alex", "Markov", None, gender=None)
+    batch = [c for c in driver.calls if c[0] == "execute_script" and c[1] == FILL_FIELDS_JS][0][2][0]
+    assert [f[1] for f in batch] == ["firstName", "lastName"]
+    assert [c[1:] for c in driver.calls if c[0] == "send_keys"] == [
+        ((By.ID, "userNumber"), "1234567890")]
@@ -0,0 +1,106 @@
+"""Пул браузеров на фейковых драйверах — без Chrome."""
+import queue
+
+import pytest
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from selenium_common.driver_pool import DriverPool
+
+
+class FakeAlert:
+    def dismiss(self):
+        raise NoAlertPresentException()
+
+
+class FakeSwitchTo:
+    alert = FakeAlert()
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    def __init__(self):
+        self.crashed = False
+        self.window_handles = ["main"]
+        self.cookies = {"session": "1"}
+        self.url = "https://example.com"
+        self.switch_to = FakeSwitchTo(self)
+        self.quit_called = False
+
+    @property
+    def current_window_handle(self):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+        return "main"
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def pool():
+    pool = DriverPool(FakeDriver, size=2)
+    yield pool
+    pool.close()
+
+
+def test_reuses_and_resets(pool):
+    first = pool.acquire()
+    first.window_handles.append("popup")
+    pool.release(first)
+    assert first.window_handles == ["main"]
+    assert first.cookies == {} and first.url == "about:blank"
+    assert pool.acquire() is first
+    assert pool.stats["started"] == 1 and pool.stats["reused"] == 1
+
+
+def test_starts_up_to_size(pool):
+    a, b = pool.acquire(), pool.acquire()
+    assert a is not b
+    with pytest.raises(queue.Empty):
+        pool.acquire(timeout=0.01)  # пул полон, все заняты
+    pool.release(a)
+    assert pool.acquire() is a
+
+
+def test_restarts_crashed_browser(pool):
+    driver = pool.acquire()
+    pool.release(driver)
+    driver.crashed = True
+    fresh = pool.acquire()
+    assert fresh is not driver and driver.quit_called
+    assert pool.stats["restarted"] == 1 and pool.stats["started"] == 2
+
+
+def test_crash_during_test_is_dropped_on_release(pool):
+    driver = pool.acquire()
+    driver.crashed = True
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.acquire() is not driver
+
+
+def test_no_reuse_mode():
+    pool = DriverPool(FakeDriver, size=1, reuse=False)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert driver.quit_called
+    assert pool.acquire() is not driver
+    assert pool.stats["started"] == 2
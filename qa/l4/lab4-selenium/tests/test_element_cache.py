@@ -0,0 +1,78 @@
+"""Кэш элементов страницы — на фейковом драйвере, без Chrome."""
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from selenium_common.element_cache import ElementCache
+
+LOCATOR = (By.ID, "firstName")
+
+
+class FakeElement:
+    def __init__(self, generation):
+        self.generation = generation
+        self.stale = False
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("element is not attached to the page document")
+        return f"gen{self.generation}"
+
+
+class FakeDriver:
+    def __init__(self):
+        self.lookups = 0
+        self.current = None
+        self.urls = []
+
+    def find_element(self, by, what):
+        self.lookups += 1
+        self.current = FakeElement(self.lookups)
+        return self.current
+
+    def get(self, url):
+        self.urls.append(url)
+
+
+def test_repeated_find_hits_cache():
+    driver = FakeDriver()
+    page = BasePage(driver)
+    assert page.find(LOCATOR) is page.find(LOCATOR)
+    assert driver.lookups == 1
+    assert page.cache.stats == {"hits": 1, "misses": 1, "reresolves": 0}
+
+
+def test_stale_element_is_resolved_again():
+    driver = FakeDriver()
+    page = BasePage(driver)
+    assert page.get_text(LOCATOR) == "gen1"
+    driver.current.stale = True  # перерисовка страницы
+    assert page.get_text(LOCATOR) == "gen2"
+    assert page.get_text(LOCATOR) == "gen2"
+    assert driver.lookups == 2
+    assert page.cache.stats == {"hits": 2, "misses": 1, "reresolves": 1}
+
+
+def test_open_clears_cache():
+    driver = FakeDriver()
+    page = BasePage(driver)
+    first = page.find(LOCATOR)
+    page.open("https://demoqa.com")
+    assert page.find(LOCATOR) is not first
+    assert driver.lookups == 2
+
+
+def test_use_retries_only_once():
+    cache = ElementCache()
+    calls = []
+
+    def always_stale(element):
+        calls.append(element)
+        raise StaleElementReferenceException()
+
+    try:
+        cache.use(LOCATOR, lambda locator: object(), always_stale)
+    except StaleElementReferenceException:
+        pass
+    assert len(calls) == 2 and cache.stats["reresolves"] == 1
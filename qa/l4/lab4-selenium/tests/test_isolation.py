@@ -0,0 +1,45 @@
+"""Изоляция состояния браузера между тестами и воркерами xdist.
+
+Под `pytest -n N --dist loadgroup` эти тесты попадают в разные шарды и
+идут одновременно в разных браузерах; без xdist — подряд в одном
+браузере из пула. В обоих случаях тест не должен видеть cookies и
+storage, оставленные другими (см. selenium_common: sharding.py, driver_pool.reset).
+"""
+import os
+
+import pytest
+
+URL = "https://demoqa.com/text-box"
+WORKER = os.getenv("PYTEST_XDIST_WORKER", "main")
+PREFIX = "isolation-"
+
+OWN_STORAGE_JS = """
+const keys = Object.keys(localStorage).concat(Object.keys(sessionStorage));
+return keys.filter(k => k.startsWith(arguments[0])).sort();
+"""
+
+
+def own_cookies(driver):
+    return sorted(c["name"] for c in driver.get_cookies() if c["name"].startswith(PREFIX))
+
+
+@pytest.mark.parametrize("n", range(4))
+def test_no_state_from_other_tests_or_workers(driver, n):
+    driver.get(URL)
+    assert own_cookies(driver) == []
+    assert driver.execute_script(OWN_STORAGE_JS, PREFIX) == []
+
+    mine = f"{PREFIX}{WORKER}-{n}"
+    driver.add_cookie({"name": mine, "value": "1"})
+    driver.execute_script(
+        "localStorage.setItem(arguments[0], '1'); sessionStorage.setItem(arguments[0] + '-s', '1');",
+        mine)
+    driver.refresh()
+    assert own_cookies(driver) == [mine]
+    assert driver.execute_script(OWN_STORAGE_JS, PREFIX) == [mine, mine + "-s"]
+
+
+def test_workers_run_headless(driver, request):
+    if WORKER == "main" and not request.config.getoption("--headless"):
+        pytest.skip("только под xdist или с --headless")
+    assert "Headless" in driver.execute_script("return navigator.userAgent")
@@ -0,0 +1,65 @@
+"""Раскладка тестов по шардам и запись длительностей — без браузера."""
+from types import SimpleNamespace
+
+from selenium_common.sharding import DurationRecorder, assign_shards, load_durations
+
+
+def loads(shards, durations, default=0):
+    result = {}
+    for nodeid, shard in shards.items():
+        result[shard] = result.get(shard, 0) + durations.get(nodeid, default)
+    return result
+
+
+def test_long_tests_are_spread_evenly():
+    durations = {"a": 10, "b": 9, "c": 6, "d": 5, "e": 4, "f": 3, "g": 2, "h": 1}
+    shards = assign_shards(list(durations), durations, 2)
+    assert set(shards.values()) == {0, 1}
+    assert sorted(loads(shards, durations).values()) == [20, 20]
+
+
+def test_unknown_tests_get_median_duration():
+    durations = {"slow": 30, "x": 1, "y": 2, "z": 3}
+    shards = assign_shards(["slow", "x", "y", "z", "new1", "new2"], durations, 2)
+    # медиана известных — 2.5: slow один на своём шарде, остальные 11 с — на другом
+    assert list(shards.values()).count(shards["slow"]) == 1
+
+
+def test_assignment_is_deterministic():
+    nodeids = [f"t{i}" for i in range(20)]
+    assert assign_shards(nodeids, {}, 3) == assign_shards(list(reversed(nodeids)), {}, 3)
+
+
+class FakeCache:
+    """config.cache: get/set по ключу"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key, default):
+        return self.data.get(key, default)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+
+def report(nodeid, when, duration, outcome="passed"):
+    return SimpleNamespace(nodeid=nodeid, when=when, duration=duration,
+                           passed=outcome == "passed")
+
+
+def test_recorder_keeps_passed_calls_only():
+    cache = FakeCache()
+    recorder = DurationRecorder(cache)
+    for when, d in (("setup", 1.0), ("call", 2.0), ("teardown", 0.5)):
+        recorder.add(report("tests/test_a.py::test_x@shard1", when, d))
+    recorder.add(report("tests/test_a.py::test_skip", "setup", 0.1, "skipped"))
+    recorder.add(report("tests/test_a.py::test_fail", "call", 0.3, "failed"))
+    recorder.save()
+    assert load_durations(cache) == {"tests/test_a.py::test_x": 2.0}
+
+    again = DurationRecorder(cache)
+    again.add(report("tests/test_b.py::test_y", "call", 1.0))
+    again.save()
+    assert load_durations(cache) == {"tests/test_a.py::test_x": 2.0, "tests/test_b.py::test_y": 1.0}
+    assert load_durations(None) == {}  # без cacheprovider истории нет
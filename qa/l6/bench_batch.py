@@ -0,0 +1,56 @@
+"""Цикл по скалярным методам Calculator vs пакетные *_many на numpy.
+
+    python bench_batch.py              # 1M строк
+    python bench_batch.py 200000
+"""
+import sys
+import time
+
+import numpy as np
+
+from calculator import Calculator
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def scalar_divide(calc, a, b):
+    out = []
+    for x, y in zip(a, b):
+        try:
+            out.append(calc.divide(x, y))
+        except ZeroDivisionError:
+            out.append(None)
+    return out
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    a = rng.integers(-10 ** 6, 10 ** 6, rows)
+    b = rng.integers(0, 100, rows)  # ~1% нулей
+    n = rng.integers(0, 1 << 22, rows)
+    a_list, b_list, n_list = a.tolist(), b.tolist(), n.tolist()
+
+    calc = Calculator()
+    calc.primes.bitmap  # решето строим заранее
+    cases = [
+        ('add', lambda: [calc.add(x, y) for x, y in zip(a_list, b_list)],
+         lambda: calc.add_many(a, b)),
+        ('divide', lambda: scalar_divide(calc, a_list, b_list),
+         lambda: calc.divide_many(a, b)),
+        ('is_prime', lambda: [calc.is_prime_number(v) for v in n_list],
+         lambda: calc.is_prime_many(n)),
+    ]
+    print(f'{rows} rows')
+    print(f"{'op':<10} {'loop s':>9} {'batch s':>9} {'speedup':>8}")
+    for name, loop, batch in cases:
+        t_loop, t_batch = timed(loop), timed(batch)
+        print(f'{name:<10} {t_loop:>9.3f} {t_batch:>9.3f} {t_loop / t_batch:>7.0f}x')
+
+
+if __name__ == '__main__':
+    main()
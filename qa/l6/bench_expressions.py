@@ -0,0 +1,59 @@
+"""Формула ``a / b + c`` по строкам: методы Calculator vs ExpressionEngine.
+
+  calculator  - calc.add(calc.divide(a, b), c) на каждую строку;
+  eval        - eval() текста на каждую строку (разбор каждый раз);
+  evaluate    - engine.evaluate(text, ...) — разбор из кэша, вызов по именам;
+  compiled    - формула скомпилирована один раз, formula(a, b, c);
+  vectorized  - formula.vectorized над numpy-массивами целиком.
+
+    python bench_expressions.py
+    python bench_expressions.py 1000000
+"""
+import random
+import sys
+import time
+
+from calculator import Calculator
+from expressions import ExpressionEngine
+
+SOURCE = 'a / b + c'
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    rnd = random.Random(0)
+    rows = [(rnd.random() * 100, rnd.randrange(1, 100), rnd.random()) for _ in range(n)]
+    calc = Calculator()
+    engine = ExpressionEngine(calc)
+    formula = engine.compile(SOURCE)
+
+    cases = [
+        ('calculator', lambda: [calc.add(calc.divide(a, b), c) for a, b, c in rows]),
+        ('eval', lambda: [eval(SOURCE, {}, {'a': a, 'b': b, 'c': c}) for a, b, c in rows]),
+        ('evaluate', lambda: [engine.evaluate(SOURCE, a=a, b=b, c=c) for a, b, c in rows]),
+        ('compiled', lambda: [formula(a, b, c) for a, b, c in rows]),
+    ]
+    try:
+        import numpy as np
+        cols = [np.array(col) for col in zip(*rows)]
+        cases.append(('vectorized', lambda: formula.vectorized(*cols)))
+    except ImportError:
+        print('numpy not installed, skipping vectorized')
+
+    print(f'{SOURCE!r}, {n} rows')
+    print(f"{'way':<11} {'s':>8} {'ns/row':>8} {'vs calc':>8}")
+    base = None
+    for name, fn in cases:
+        elapsed = timed(fn)
+        base = base or elapsed
+        print(f'{name:<11} {elapsed:>8.3f} {elapsed / n * 1e9:>8.0f} {base / elapsed:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""Цена режимов арифметики Calculator относительно float.
+
+Для каждого режима — add и divide на целых (быстрый путь), на float
+и на «денежных» строках (только точные режимы), наносекунд на вызов.
+
+    python bench_modes.py
+    python bench_modes.py 1000000
+"""
+import random
+import sys
+import time
+
+from calculator import Calculator
+
+
+def per_call(fn, pairs):
+    start = time.perf_counter()
+    for a, b in pairs:
+        fn(a, b)
+    return (time.perf_counter() - start) / len(pairs) * 1e9
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rnd = random.Random(0)
+    inputs = {
+        'int': [(rnd.randrange(1, 10 ** 6), rnd.randrange(1, 1000)) for _ in range(n)],
+        'float': [(rnd.random() * 1000, rnd.random() * 100 + 1) for _ in range(n)],
+        'str': [(f'{rnd.randrange(10 ** 6) / 100:.2f}', f'{rnd.randrange(1, 10 ** 4) / 100:.2f}')
+                for _ in range(n)],
+    }
+    print(f'{n} calls per cell, ns per call')
+    print(f"{'mode':<9} {'op':<7} {'int':>8} {'float':>8} {'str':>8}")
+    for mode in ('float', 'fraction', 'decimal'):
+        calc = Calculator(mode=mode)
+        for op in ('add', 'divide'):
+            fn = getattr(calc, op)
+            cells = []
+            for kind, pairs in inputs.items():
+                if kind == 'str' and mode == 'float':
+                    cells.append(f"{'-':>8}")
+                else:
+                    cells.append(f'{per_call(fn, pairs):>8.0f}')
+            print(f"{mode:<9} {op:<7} {' '.join(cells)}")
+
+
+if __name__ == '__main__':
+    main()
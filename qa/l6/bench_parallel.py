@@ -0,0 +1,45 @@
+"""Масштабирование is_prime_parallel по числу процессов.
+
+Кандидаты — случайные нечётные < 2**62 (проверяются Миллером–Рабином,
+это и есть дорогая часть). Для каждого числа процессов пул сначала
+прогревается (запуск процессов, решето в каждом), потом замеряется.
+
+    python bench_parallel.py                     # 1..cpu_count процессов, 500k чисел
+    python bench_parallel.py --size 2000000 --workers 8
+"""
+import argparse
+import os
+import random
+import time
+
+from calculator import Calculator
+from parallel import ParallelPrimes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=500_000)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    values = [rnd.randrange(2 ** 62) | 1 for _ in range(args.size)]
+    warmup = [rnd.randrange(2 ** 62) | 1 for _ in range(10_000)]
+
+    print(f'{args.size} values, cpu_count {os.cpu_count()}')
+    print(f"{'workers':>7} {'s':>8} {'speedup':>8} {'per worker':>11}")
+    base = None
+    # workers=1 — это обычный цикл в текущем процессе, без пула
+    for workers in range(1, args.workers + 1):
+        with ParallelPrimes(workers=workers, threshold=0) as parallel:
+            calc = Calculator(parallel=parallel)
+            calc.is_prime_parallel(warmup)
+            start = time.perf_counter()
+            calc.is_prime_parallel(values)
+            elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(f'{workers:>7} {elapsed:>8.3f} {base / elapsed:>7.2f}x {base / elapsed / workers:>10.0%}')
+
+
+if __name__ == '__main__':
+    main()
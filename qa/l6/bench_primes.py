@@ -0,0 +1,50 @@
+"""Старый перебор делителей vs PrimeEngine в is_prime_number.
+
+    python bench_primes.py
+"""
+import random
+import time
+
+from calculator import Calculator
+from primes import PrimeEngine
+
+
+def trial_division(n):
+    if n <= 1:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def timed(fn, values):
+    start = time.perf_counter()
+    for n in values:
+        fn(n)
+    return time.perf_counter() - start
+
+
+def main():
+    rnd = random.Random(0)
+    cases = [
+        ('1..1e6, 1M values', list(range(1, 1_000_001)), True),
+        ('random < 1e12, 2000', [rnd.randrange(10 ** 12) | 1 for _ in range(2000)], True),
+        ('random < 2^62, 100k', [rnd.randrange(2 ** 62) | 1 for _ in range(100_000)], False),
+    ]
+    print(f"{'case':<24} {'trial s':>9} {'engine s':>9} {'again s':>9}")
+    for name, values, run_trial in cases:
+        calc = Calculator(prime_engine=PrimeEngine())
+        calc.primes.bitmap  # решето строим заранее, его время — отдельно
+        trial = f'{timed(trial_division, values):>9.3f}' if run_trial else f"{'-':>9}"
+        first = timed(calc.is_prime_number, values)
+        again = timed(calc.is_prime_number, values)
+        print(f'{name:<24} {trial} {first:>9.3f} {again:>9.3f}')
+
+    start = time.perf_counter()
+    PrimeEngine().bitmap
+    print(f'sieve build (< 2^22): {time.perf_counter() - start:.3f} s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Время и память запросов к SegmentedSieve по десятичным порядкам.
+
+Для каждого n = 10**6 ... --max:
+  cold   - count_primes(n) на пустом кэше в каталоге на диске;
+  warm   - то же после переоткрытия каталога (как новый прогон тестов);
+  window - primes_in_range(n - 10**6, n) на тёплом кэше;
+  nth    - nth_prime(pi(n)) на тёплом кэше.
+RSS — резидентная память процесса после шага, peak — максимум за прогон.
+
+    python bench_sieve.py                  # до 10**10 (холодный шаг ~1.5 мин)
+    python bench_sieve.py --max 1000000000
+"""
+import argparse
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from sieve import SegmentedSieve
+
+
+def rss_mb():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        return float('nan')  # не Linux — остаётся только peak
+
+
+def peak_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--max', type=float, default=1e10)
+    max_n = int(parser.parse_args().max)
+
+    print(f"{'n':>12} {'pi(n)':>11} {'cold s':>8} {'warm s':>8} {'window s':>9} "
+          f"{'nth s':>8} {'RSS MB':>7} {'peak MB':>8} {'disk MB':>8}")
+    n = 10 ** 6
+    while n <= max_n:
+        with tempfile.TemporaryDirectory() as path:
+            cold = SegmentedSieve(path)
+            pi, t_cold = timed(cold.count_primes, n)
+            cold.close()
+
+            warm = SegmentedSieve(path)
+            _, t_warm = timed(warm.count_primes, n)
+            _, t_window = timed(warm.primes_in_range, n - 10 ** 6, n)
+            _, t_nth = timed(warm.nth_prime, pi)
+            rss = rss_mb()
+            warm.close()
+            disk = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+        print(f'{n:>12} {pi:>11} {t_cold:>8.3f} {t_warm:>8.3f} {t_window:>9.3f} '
+              f'{t_nth:>8.3f} {rss:>7.0f} {peak_mb():>8.0f} {disk / 2 ** 20:>8.1f}')
+        n *= 10
+
+
+if __name__ == '__main__':
+    main()
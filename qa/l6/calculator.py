@@ -1,23 +1,215 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Integral
+
+from parallel import ParallelPrimes
+from primes import default_engine
+from sieve import default_sieve
+
+ZERO_DIVISION_MESSAGE = "Деление на ноль запрещено."
+
+# режимы арифметики add/divide:
+#   float    - как всегда, обычные операторы (divide даёт float);
+#   fraction - точные дроби fractions.Fraction;
+#   decimal  - decimal.Decimal с точностью текущего decimal-контекста.
+# В точных режимах float и строки переводятся через десятичную запись
+# (0.1 -> 1/10, а не двоичное приближение), целые — как есть.
+# Результат всегда типа режима (Fraction / Decimal), даже для целых.
+MODES = ('float', 'fraction', 'decimal')
+
+_mode = ContextVar('calculator_mode', default='float')
+
+
+def _check_mode(mode):
+    if mode not in MODES:
+        raise ValueError(f"Неизвестный режим арифметики: {mode!r}, допустимы {MODES}")
+    return mode
+
+
+@contextmanager
+def arithmetic(mode):
+    """Режим для всех Calculator без собственного mode внутри блока with.
+
+    Значение живёт в contextvars, так что у каждого потока и каждой
+    задачи asyncio оно своё.
+    """
+    token = _mode.set(_check_mode(mode))
+    try:
+        yield
+    finally:
+        _mode.reset(token)
+
+
+def _to_fraction(x):
+    if isinstance(x, Fraction):
+        return x
+    if isinstance(x, float):
+        # Fraction(repr(x)) разбирает строку регуляркой — в разы медленнее
+        return Fraction(*Decimal(repr(x)).as_integer_ratio())
+    return Fraction(x)  # int, Decimal, str
+
+
+def _to_decimal(x):
+    if isinstance(x, Decimal):
+        return x
+    if isinstance(x, Fraction):
+        return Decimal(x.numerator) / Decimal(x.denominator)
+    if isinstance(x, float):
+        return Decimal(repr(x))
+    return Decimal(x)  # int, str
+
+
+def _int_decimal_div(a, b):
+    # нацело делящиеся целые — без раунд-трипа через decimal-контекст
+    if a % b == 0:
+        return Decimal(a // b)
+    return Decimal(a) / Decimal(b)
+
+
+def _numpy():
+    # numpy нужен только пакетным методам, скалярные работают без него
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("Пакетные методы Calculator требуют numpy: pip install numpy")
+    return numpy
+
+
 class Calculator:
     """Простой калькулятор с базовой бизнес-логикой."""
 
+    def __init__(self, prime_engine=None, sieve=None, parallel=None, mode=None):
+        self._mode = None if mode is None else _check_mode(mode)
+        self.primes = prime_engine or default_engine()
+        self.sieve = sieve or default_sieve()
+        self._parallel = parallel
+
+    @property
+    def parallel(self):
+        """Пул процессов для is_prime_parallel, создаётся при первом вызове."""
+        if self._parallel is None:
+            self._parallel = ParallelPrimes()
+        return self._parallel
+
+    @property
+    def mode(self):
+        """Режим арифметики: заданный экземпляру, иначе из arithmetic()."""
+        return self._mode or _mode.get()
+
+    @mode.setter
+    def mode(self, mode):
+        self._mode = None if mode is None else _check_mode(mode)
+
     def add(self, a, b):
         """Сложение двух чисел."""
+        mode = self.mode
+        if type(a) is int and type(b) is int:
+            # целые точны: складываем как есть и один раз приводим к типу режима
+            if mode == 'fraction':
+                return Fraction(a + b)
+            if mode == 'decimal':
+                return Decimal(a + b)
+            return a + b
+        if mode == 'fraction':
+            return _to_fraction(a) + _to_fraction(b)
+        if mode == 'decimal':
+            return _to_decimal(a) + _to_decimal(b)
         return a + b
 
     def divide(self, a, b):
         """Деление одного числа на другое.
         Вызывает исключение ZeroDivisionError при делении на ноль.
         """
-        if b == 0:
-            raise ZeroDivisionError("Деление на ноль запрещено.")
+        mode = self.mode
+        if mode == 'float':
+            if b == 0:
+                raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
+            return a / b
+        if type(a) is int and type(b) is int:
+            # быстрый путь: без Decimal и без разбора строк
+            if b == 0:
+                raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
+            if mode == 'fraction':
+                return Fraction(a, b)
+            return _int_decimal_div(a, b)
+        convert = _to_fraction if mode == 'fraction' else _to_decimal
+        a, b = convert(a), convert(b)
+        if b == 0:  # в т.ч. "0" и Decimal('0.00')
+            raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
         return a / b
 
     def is_prime_number(self, n):
         """Проверка, является ли число простым."""
         if n <= 1:
             return False
+        if isinstance(n, Integral):
+            return self.primes.is_prime(int(n))
+        # нецелые (float и пр.) — как раньше, перебором делителей
         for i in range(2, int(n ** 0.5) + 1):
             if n % i == 0:
                 return False
         return True
+
+    def is_prime_parallel(self, values):
+        """is_prime_number для большого списка в нескольких процессах,
+        результат — список bool в порядке входа."""
+        return self.parallel.is_prime(values, fallback=self.is_prime_number)
+
+    def primes_in_range(self, lo, hi):
+        """Список простых из полуинтервала [lo, hi)."""
+        return self.sieve.primes_in_range(lo, hi)
+
+    def count_primes(self, n):
+        """Количество простых, не превосходящих n."""
+        return self.sieve.count_primes(n)
+
+    def nth_prime(self, k):
+        """k-е по счёту простое число (nth_prime(1) == 2)."""
+        return self.sieve.nth_prime(k)
+
+    # --- пакетные версии: последовательности или numpy-массивы на входе,
+    # numpy-массивы на выходе ---
+
+    def add_many(self, a, b):
+        """Поэлементное сложение (с broadcasting, как в numpy)."""
+        np = _numpy()
+        return np.add(np.asarray(a), np.asarray(b))
+
+    def divide_many(self, a, b, strict=False):
+        """Поэлементное деление.
+
+        По умолчанию деление на ноль не прерывает пакет: результат —
+        numpy.ma.MaskedArray, где такие элементы замаскированы.
+        strict=True — ZeroDivisionError, как у divide(), если в b есть ноль.
+        """
+        np = _numpy()
+        a, b = np.broadcast_arrays(np.asarray(a), np.asarray(b))
+        zero = b == 0
+        if strict and zero.any():
+            raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
+        out = np.zeros(a.shape, dtype=np.result_type(a, b, float))
+        np.divide(a, b, out=out, where=~zero)
+        if strict:
+            return out
+        return np.ma.masked_array(out, mask=zero)
+
+    def is_prime_many(self, values):
+        """Поэлементный is_prime_number, результат — массив bool."""
+        np = _numpy()
+        if not isinstance(values, np.ndarray):
+            values = list(values)
+            if all(isinstance(v, Integral) for v in values):
+                # без явного dtype numpy молча превратит int > 2**63 во float
+                try:
+                    values = np.array(values, dtype=np.int64)
+                except OverflowError:
+                    values = np.array(values, dtype=object)
+            else:
+                values = np.array(values)
+        if values.dtype.kind in 'iu':
+            return self.primes.is_prime_array(values)
+        # нецелые или object-массивы (большие int) — по одному, с той же семантикой
+        flat = [self.is_prime_number(v.item() if hasattr(v, 'item') else v) for v in values.ravel()]
+        return np.array(flat, dtype=bool).reshape(values.shape)
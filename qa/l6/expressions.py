@@ -0,0 +1,188 @@
+"""Формулы поверх Calculator: ``a / b + c`` разбирается один раз и
+компилируется в обычную функцию Python.
+
+* допустимы числа, имена переменных, + - * / и унарные + -;
+* деление на ноль — ZeroDivisionError с тем же текстом, что у
+  Calculator.divide;
+* в режимах fraction/decimal аргументы и дробные константы переводятся
+  так же, как в Calculator.add/divide, а деление целых идёт по тому же
+  быстрому пути;
+* formula.vectorized(...) — та же формула над numpy-массивами (всегда
+  в float, как add_many/divide_many);
+* скомпилированные формулы лежат в LRU-кэше движка по (текст, режим).
+"""
+import ast
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+
+from calculator import (ZERO_DIVISION_MESSAGE, Calculator, _int_decimal_div, _numpy,
+                        _to_decimal, _to_fraction)
+
+CACHE_SIZE = 1024
+
+_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+_UNARYOPS = (ast.UAdd, ast.USub)
+
+
+class ExpressionError(ValueError):
+    """Формула не разбирается или содержит что-то кроме арифметики."""
+
+
+# как в Calculator.divide: деление целых без разбора строк, но результат
+# всегда типа режима
+
+def _fraction_div(a, b):
+    if b == 0:
+        raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
+    if type(a) is int and type(b) is int:
+        return Fraction(a, b)
+    return a / b
+
+
+def _decimal_div(a, b):
+    if b == 0:
+        raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
+    if type(a) is int and type(b) is int:
+        return _int_decimal_div(a, b)
+    return a / b
+
+
+def _keep_int(convert):
+    # целые в точных режимах остаются int: + - * над ними и так точны
+    return lambda x: x if type(x) is int else convert(x)
+
+
+def _as_type(cls):
+    # итог формулы только из целых (без деления) приводим к типу режима
+    return lambda x: cls(x) if type(x) is int else x
+
+
+_EXACT = {
+    'fraction': (_keep_int(_to_fraction), _fraction_div, _as_type(Fraction)),
+    'decimal': (_keep_int(_to_decimal), _decimal_div, _as_type(Decimal)),
+}
+
+
+def _array_div(a, b):
+    np = _numpy()
+    b = np.asarray(b)
+    if (b == 0).any():
+        raise ZeroDivisionError(ZERO_DIVISION_MESSAGE)
+    return np.true_divide(a, b)
+
+
+def _parse(source):
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ExpressionError(f"Не удалось разобрать формулу {source!r}: {e.msg}") from None
+    first_seen = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            if node.id.startswith('_'):
+                raise ExpressionError(f"Недопустимое имя переменной: {node.id}")
+            pos = (node.lineno, node.col_offset)
+            first_seen[node.id] = min(pos, first_seen.get(node.id, pos))
+        elif isinstance(node, ast.Constant):
+            if type(node.value) not in (int, float):
+                raise ExpressionError(f"Недопустимая константа: {node.value!r}")
+        elif isinstance(node, ast.BinOp):
+            if not isinstance(node.op, _BINOPS):
+                raise ExpressionError(f"Недопустимая операция: {type(node.op).__name__}")
+        elif isinstance(node, ast.UnaryOp):
+            if not isinstance(node.op, _UNARYOPS):
+                raise ExpressionError(f"Недопустимая операция: {type(node.op).__name__}")
+        elif not isinstance(node, (ast.Expression, ast.Load, *_BINOPS, *_UNARYOPS)):
+            raise ExpressionError(f"Недопустимый элемент формулы: {type(node).__name__}")
+    # аргументы функции — в порядке появления в тексте
+    return tree, sorted(first_seen, key=first_seen.get)
+
+
+class _Rewrite(ast.NodeTransformer):
+    """a / b -> _div(a, b); дробные константы -> заранее переведённые _k0, _k1..."""
+
+    def __init__(self, convert=None):
+        self.convert = convert
+        self.constants = {}
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Div):
+            return ast.Call(ast.Name('_div', ast.Load()), [node.left, node.right], [])
+        return node
+
+    def visit_Constant(self, node):
+        if self.convert is None or type(node.value) is int:
+            return node
+        name = f'_k{len(self.constants)}'
+        self.constants[name] = self.convert(node.value)
+        return ast.Name(name, ast.Load())
+
+
+def _build(tree, names, body, namespace):
+    """def _f(<names>): <body с выражением tree> -> функция."""
+    expr = ast.unparse(tree.body)
+    args = ', '.join(names)
+    code = f'def _f({args}):\n' + body.format(expr=expr)
+    exec(compile(code, '<formula>', 'exec'), namespace)
+    return namespace['_f']
+
+
+class Formula:
+    """Скомпилированная формула: formula(a, b, c) или formula(a=.., b=.., c=..)."""
+
+    def __init__(self, source, mode='float'):
+        self.source = source
+        self.mode = mode
+        tree, self.variables = _parse(source)
+
+        if mode == 'float':
+            # операторы Python как есть; ZeroDivisionError лишь переименовываем
+            self.fn = _build(tree, self.variables, (
+                '    try:\n'
+                '        return {expr}\n'
+                '    except ZeroDivisionError:\n'
+                '        raise ZeroDivisionError(_MESSAGE) from None\n'),
+                {'_MESSAGE': ZERO_DIVISION_MESSAGE})
+        else:
+            convert, div, result = _EXACT[mode]
+            rewrite = _Rewrite(convert)
+            exact = rewrite.visit(ast.parse(source.strip(), mode='eval'))
+            prologue = ''.join(f'    {n} = _conv({n})\n' for n in self.variables)
+            self.fn = _build(exact, self.variables, prologue + '    return _result({expr})\n',
+                             {'_conv': convert, '_div': div, '_result': result,
+                              **rewrite.constants})
+
+        vector = _Rewrite().visit(ast.parse(source.strip(), mode='eval'))
+        self._vector = _build(vector, self.variables, '    return {expr}\n', {'_div': _array_div})
+
+    def __call__(self, *args, **kwargs):
+        return self.fn(*args, **kwargs)
+
+    def vectorized(self, *args, **kwargs):
+        """Та же формула над numpy-массивами (broadcasting как в numpy)."""
+        np = _numpy()
+        args = [np.asarray(a) for a in args]
+        kwargs = {k: np.asarray(v) for k, v in kwargs.items()}
+        return self._vector(*args, **kwargs)
+
+    def __repr__(self):
+        return f'Formula({self.source!r}, mode={self.mode!r})'
+
+
+class ExpressionEngine:
+    """Компилирует формулы в режиме своего Calculator и кэширует их."""
+
+    def __init__(self, calculator=None, cache_size=CACHE_SIZE):
+        self.calculator = calculator or Calculator()
+        self._compile = lru_cache(maxsize=cache_size)(Formula)
+
+    def compile(self, source):
+        return self._compile(source, self.calculator.mode)
+
+    def evaluate(self, source, **values):
+        return self.compile(source).fn(**values)
+
+    def cache_info(self):
+        return self._compile.cache_info()
@@ -0,0 +1,106 @@
+"""Проверка простоты больших списков в нескольких процессах.
+
+Вход копируется один раз в разделяемую память (int64), каждый процесс
+пула берёт свой кусок [start, stop), проверяет его своим PrimeEngine и
+пишет ответы (по байту на число) в общий выходной буфер. Обратно через
+pickle едет только номер куска, а не тысячи bool, и порядок ответов
+совпадает с порядком входа сам собой.
+
+Числа, которые в int64 не влезают, и нецелые проверяются в родительском
+процессе. Маленькие списки (< threshold) — тоже: пул там только мешает.
+"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from numbers import Integral
+
+from primes import default_engine
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+THRESHOLD = 50_000
+MIN_CHUNK = 10_000
+
+
+def _check_chunk(in_name, out_name, start, stop):
+    # resource_tracker у процессов пула общий с родителем, так что
+    # unlink в родителе снимает и их регистрацию — «утечек» при выходе нет
+    src = shared_memory.SharedMemory(name=in_name)
+    dst = shared_memory.SharedMemory(name=out_name)
+    values = src.buf.cast('q')
+    try:
+        out = dst.buf
+        is_prime = default_engine().is_prime
+        for i in range(start, stop):
+            out[i] = is_prime(values[i])
+    finally:
+        values.release()
+        src.close()
+        dst.close()
+    return start
+
+
+class ParallelPrimes:
+    """Пул процессов для пакетной проверки простоты."""
+
+    def __init__(self, workers=None, threshold=THRESHOLD, min_chunk=MIN_CHUNK):
+        self.workers = workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self.min_chunk = min_chunk
+        self._pool = None
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _chunks(self, n):
+        # по нескольку кусков на процесс — чтобы быстрые не ждали медленных
+        size = max(self.min_chunk, -(-n // (self.workers * 4)))
+        return [(start, min(start + size, n)) for start in range(0, n, size)]
+
+    def is_prime(self, values, fallback=None):
+        """Список bool в порядке values.
+
+        fallback(v) проверяет то, что в int64 не влезает (по умолчанию
+        default_engine().is_prime для int и False для прочего).
+        """
+        values = list(values)
+        if fallback is None:
+            engine = default_engine()
+            fallback = lambda v: isinstance(v, Integral) and engine.is_prime(int(v))
+        if len(values) < self.threshold or self.workers == 1:
+            return [fallback(v) for v in values]
+
+        packed = array('q', bytes(8 * len(values)))
+        outliers = []
+        for i, v in enumerate(values):
+            if isinstance(v, Integral) and INT64_MIN <= v <= INT64_MAX:
+                packed[i] = v
+            else:
+                outliers.append(i)  # на их месте 0, ответ перезапишем ниже
+
+        src = shared_memory.SharedMemory(create=True, size=max(1, 8 * len(values)))
+        dst = shared_memory.SharedMemory(create=True, size=max(1, len(values)))
+        try:
+            src.buf[:8 * len(values)] = memoryview(packed).cast('B')
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(self.workers)
+            futures = [self._pool.submit(_check_chunk, src.name, dst.name, start, stop)
+                       for start, stop in self._chunks(len(values))]
+            for f in futures:
+                f.result()
+            result = [bool(b) for b in dst.buf[:len(values)]]
+        finally:
+            for shm in (src, dst):
+                shm.close()
+                shm.unlink()
+        for i in outliers:
+            result[i] = fallback(values[i])
+        return result
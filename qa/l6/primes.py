@@ -0,0 +1,204 @@
+"""Проверка простоты для Calculator.is_prime_number.
+
+* n < sieve_limit — поиск в битовой карте решета (только нечётные числа,
+  bytearray), решето строится сегментами по SEGMENT чисел;
+* больше — Миллер–Рабин по первым 12 простым основаниям: для
+  n < MR_EXACT_LIMIT (~3.2 * 10**23, а значит и для 2**64) ответ точный;
+* n >= MR_EXACT_LIMIT дополнительно проходят сильный тест Люка
+  (вместе с основанием 2 это тест BPSW): контрпримеров к нему не
+  известно, а числа, обманывающие Миллера–Рабина по 12 основаниям,
+  он отсеивает;
+* последние результаты держит LRU-кэш.
+"""
+from functools import lru_cache
+from math import isqrt
+
+SEGMENT = 1 << 16
+
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+# наименьшее составное, сильно псевдопростое по всем MR_BASES (psi_12):
+# ниже него Миллер–Рабин по MR_BASES точен
+MR_EXACT_LIMIT = 318665857834031151167461
+
+
+def _small_primes(limit):
+    """Простые < limit обычным решетом Эратосфена (для базовых простых)."""
+    if limit < 3:
+        return []
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b'\x00\x00'
+    for p in range(2, isqrt(limit - 1) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return [i for i in range(limit) if sieve[i]]
+
+
+def odd_sieve(lo, hi, base_primes):
+    """Битовая карта нечётных чисел из [lo, hi): байт i отвечает за lo + 2*i.
+
+    lo должно быть нечётным; base_primes — нечётные простые до isqrt(hi).
+    """
+    size = (hi - lo + 1) // 2
+    seg = bytearray([1]) * size
+    for p in base_primes:
+        if p * p >= hi:
+            break
+        # первое нечётное кратное p, не меньшее max(p*p, lo)
+        start = max(p * p, (lo + p - 1) // p * p)
+        if start % 2 == 0:
+            start += p
+        if start >= hi:
+            continue
+        first = (start - lo) // 2
+        seg[first::p] = bytes(len(range(first, size, p)))
+    return seg
+
+
+def miller_rabin(n):
+    """Тест Миллера–Рабина по MR_BASES (n нечётное > 37).
+
+    Точен для n < MR_EXACT_LIMIT; для больших n True значит лишь
+    «сильно псевдопростое по MR_BASES».
+    """
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _jacobi(a, n):
+    """Символ Якоби (a/n) для нечётного n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def strong_lucas(n):
+    """Сильный тест Люка с параметрами Селфриджа (n нечётное > 37).
+
+    D — первое из 5, -7, 9, -11, ... с (D/n) = -1, P = 1, Q = (1 - D) / 4.
+    """
+    if isqrt(n) ** 2 == n:  # для квадратов подходящего D нет
+        return False
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0:
+            return False  # общий делитель с D
+        D = -D - 2 if D > 0 else -D + 2
+    Q = (1 - D) // 4
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    # U_k, V_k, Q^k по битам d: удвоение k -> 2k, затем при единичном бите 2k -> 2k + 1
+    half = (n + 1) // 2  # 1/2 по модулю n
+    U, V, Qk = 1, 1, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == '1':
+            U, V = (U + V) * half % n, (D * U + V) * half % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
+class PrimeEngine:
+    """Решето для малых n + Миллер–Рабин для больших + LRU кэш."""
+
+    def __init__(self, sieve_limit=1 << 22, cache_size=65536):
+        self.sieve_limit = sieve_limit | 1  # нечётная граница
+        self._bitmap = None
+        self.is_prime = lru_cache(maxsize=cache_size)(self._is_prime)
+
+    @property
+    def bitmap(self):
+        """Битовая карта нечётных чисел [1, sieve_limit), строится при первом обращении."""
+        if self._bitmap is None:
+            base = _small_primes(isqrt(self.sieve_limit) + 1)[1:]
+            bitmap = bytearray()
+            for lo in range(1, self.sieve_limit, 2 * SEGMENT):
+                hi = min(lo + 2 * SEGMENT, self.sieve_limit)
+                bitmap += odd_sieve(lo, hi, base)
+            bitmap[0] = 0  # 1 не простое
+            self._bitmap = bitmap
+        return self._bitmap
+
+    def _is_prime(self, n):
+        if n < 2:
+            return False
+        if n < 4:
+            return True
+        if n % 2 == 0:
+            return False
+        if n < self.sieve_limit:
+            return bool(self.bitmap[n >> 1])
+        for p in MR_BASES:
+            if n % p == 0:
+                return n == p
+        if not miller_rabin(n):
+            return False
+        return n < MR_EXACT_LIMIT or strong_lucas(n)
+
+    def cache_info(self):
+        return self.is_prime.cache_info()
+
+    def is_prime_array(self, values):
+        """is_prime для целочисленного numpy-массива, результат — массив bool.
+
+        Значения меньше sieve_limit берутся из решета одной векторной
+        выборкой, остальные проверяются по одному через is_prime.
+        """
+        import numpy as np
+
+        values = np.asarray(values)
+        result = np.zeros(values.shape, dtype=bool)
+        bitmap = np.frombuffer(self.bitmap, dtype=np.uint8)
+        small = (values >= 0) & (values < self.sieve_limit)
+        odd = small & (values % 2 == 1)
+        result[odd] = bitmap[values[odd] >> 1].astype(bool)
+        result[values == 2] = True
+        big = ~small & (values > 0)
+        if big.any():
+            result[big] = [self.is_prime(int(v)) for v in values[big]]
+        return result
+
+
+_default = None
+
+
+def default_engine():
+    """Общий на процесс движок (решето строится один раз)."""
+    global _default
+    if _default is None:
+        _default = PrimeEngine()
+    return _default
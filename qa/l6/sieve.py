@@ -0,0 +1,293 @@
+"""Сегментированное решето для запросов по диапазонам: primes_in_range,
+count_primes, nth_prime.
+
+Числовая ось делится на сегменты по ``segment`` нечётных чисел (сегмент k
+покрывает [k*span, (k+1)*span), span = 2*segment). Сегменты, посчитанные
+подряд от нуля, запоминаются:
+
+* счётчики простых по сегментам (uint32 на сегмент) — всегда, это копейки;
+* сами сегменты, упакованные по биту на нечётное число, — пока они ниже
+  ``bits_limit``.
+
+С ``path`` всё это лежит в каталоге на диске (sieve.counts, sieve.bits),
+биты читаются через mmap, так что повторный запуск стартует «тёплым»:
+ничего не пересеивается и в память не грузится сверх нужного. Дописывание
+файлов идёт под flock на sieve.lock: несколько процессов с одним каталогом
+не дублируют сегменты, а подхватывают досчитанное соседом. Без
+``path`` — то же самое в памяти процесса. Сегменты далеко за
+запомненным префиксом (например, окно около 10**10) просеиваются
+на лету и не сохраняются.
+"""
+import itertools
+import json
+import mmap
+import os
+import threading
+from array import array
+from contextlib import contextmanager
+from math import isqrt
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировки между процессами нет
+    fcntl = None
+
+from primes import _small_primes, odd_sieve
+
+SIEVE_SEGMENT = 1 << 20  # нечётных чисел в сегменте, кратно 8
+BITS_LIMIT = 10 ** 9     # до этой границы сегменты хранятся целиком (62.5 МБ)
+
+COUNTS = 'sieve.counts'
+BITS = 'sieve.bits'
+META = 'sieve.json'
+LOCK = 'sieve.lock'
+
+_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_FROM_ASCII = bytes.maketrans(b'01', b'\x00\x01')
+
+
+def pack(seg):
+    """bytearray из 0/1 (по байту на число) -> биты, младший бит первым."""
+    return int(seg[::-1].translate(_TO_ASCII), 2).to_bytes(len(seg) // 8, 'little')
+
+
+def unpack(data, size):
+    """Обратно к pack: size байтов 0/1."""
+    bits = format(int.from_bytes(data, 'little'), f'0{size}b').encode()
+    return bytearray(bits[::-1].translate(_FROM_ASCII))
+
+
+class SegmentedSieve:
+    """Решето с кэшем сегментов в памяти или в файлах каталога ``path``."""
+
+    def __init__(self, path=None, segment=SIEVE_SEGMENT, bits_limit=BITS_LIMIT):
+        if segment % 8:
+            raise ValueError("segment должен быть кратен 8")
+        self.path = path
+        self.segment = segment
+        self.span = 2 * segment
+        self.bits_limit = bits_limit
+        self.sieved = 0  # сколько сегментов реально просеяно (для тестов и бенчмарка)
+        self._lock = threading.RLock()
+        self._base = []
+        self._base_limit = 0
+        self._counts = array('I')
+        self._bits = bytearray()  # в памяти; для файлов — mmap, см. _bits_view
+        self._nbits = 0
+        self._map = None
+        self._files = None
+        self._lockfile = None
+        if path is not None:
+            self._open()
+
+    # --- хранение ---
+
+    def _open(self):
+        os.makedirs(self.path, exist_ok=True)
+        self._lockfile = open(os.path.join(self.path, LOCK), 'a+b')
+        with self._flock():
+            self._open_files()
+
+    @contextmanager
+    def _flock(self):
+        """Эксклюзивно между процессами, работающими с тем же каталогом."""
+        if fcntl is None or self._lockfile is None:
+            yield
+            return
+        fcntl.flock(self._lockfile.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(self._lockfile.fileno(), fcntl.LOCK_UN)
+
+    def _open_files(self):
+        meta_path = os.path.join(self.path, META)
+        meta = {'segment': self.segment}
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding='utf-8') as f:
+                if json.load(f) != meta:
+                    # другой размер сегмента — старый кэш не годится
+                    for name in (COUNTS, BITS):
+                        if os.path.exists(os.path.join(self.path, name)):
+                            os.remove(os.path.join(self.path, name))
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+        counts = open(os.path.join(self.path, COUNTS), 'a+b')
+        bits = open(os.path.join(self.path, BITS), 'a+b')
+        self._files = counts, bits
+        self._reload()
+        # недописанный после сбоя хвост отрезаем
+        bits.truncate(self._nbits * (self.segment // 8))
+        counts.truncate(len(self._counts) * self._counts.itemsize)
+
+    def _reload(self):
+        """Подхватить сегменты, дописанные в файлы другим процессом."""
+        counts, bits = self._files
+        counts.seek(len(self._counts) * self._counts.itemsize)
+        data = counts.read()
+        # после сбоя файл может оборваться посреди счётчика
+        self._counts.frombytes(data[:len(data) - len(data) % self._counts.itemsize])
+        seg_bytes = self.segment // 8
+        self._nbits = min(os.fstat(bits.fileno()).st_size // seg_bytes, len(self._counts))
+
+    @contextmanager
+    def _extending(self):
+        """Дописывание сегментов: под flock и с учётом досчитанного соседями."""
+        if self._files is None:
+            yield
+            return
+        with self._flock():
+            self._reload()
+            try:
+                yield
+            finally:
+                self.flush()
+
+    def _bits_view(self, k):
+        """Упакованный сегмент k (k < _nbits)."""
+        seg_bytes = self.segment // 8
+        if self._files is None:
+            return self._bits[k * seg_bytes:(k + 1) * seg_bytes]
+        if self._map is None or len(self._map) < (k + 1) * seg_bytes:
+            # файл вырос — переотображаем
+            if self._map is not None:
+                self._map.close()
+            bits = self._files[1]
+            bits.flush()
+            self._map = mmap.mmap(bits.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[k * seg_bytes:(k + 1) * seg_bytes]
+
+    def _append(self, k, seg):
+        # k == len(self._counts): продолжаем сохранённый префикс
+        count = seg.count(1)
+        self._counts.append(count)
+        keep_bits = k == self._nbits and (k + 1) * self.span <= self.bits_limit
+        if self._files is None:
+            if keep_bits:
+                self._bits += pack(seg)
+                self._nbits += 1
+            return
+        counts, bits = self._files
+        if keep_bits:
+            bits.write(pack(seg))
+            self._nbits += 1
+        counts.write(array('I', [count]).tobytes())
+
+    def flush(self):
+        if self._files is not None:
+            for f in self._files:
+                f.flush()
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._files is not None:
+                for f in self._files:
+                    f.close()
+                self._files = None
+            if self._lockfile is not None:
+                self._lockfile.close()
+                self._lockfile = None
+
+    # --- сегменты ---
+
+    def _base_primes(self, hi):
+        limit = isqrt(hi) + 1
+        if limit > self._base_limit:
+            self._base_limit = max(limit, 2 * self._base_limit)
+            self._base = _small_primes(self._base_limit + 1)[1:]
+        return self._base
+
+    def _sieve(self, k):
+        lo = k * self.span + 1
+        hi = lo + self.span
+        seg = odd_sieve(lo, hi, self._base_primes(hi))
+        if k == 0:
+            seg[0] = 0  # 1 не простое
+        self.sieved += 1
+        return seg
+
+    def _segment(self, k):
+        """Сегмент k: байт i = 1, если k*span + 2*i + 1 простое."""
+        with self._lock:
+            if k < self._nbits:
+                return unpack(self._bits_view(k), self.segment)
+            seg = self._sieve(k)
+            if k == len(self._counts):
+                with self._extending():
+                    if k == len(self._counts):
+                        self._append(k, seg)
+            return seg
+
+    def _extend(self, n_segments):
+        """Досчитать счётчики для сегментов [0, n_segments)."""
+        with self._lock, self._extending():
+            for k in range(len(self._counts), n_segments):
+                self._append(k, self._sieve(k))
+
+    # --- запросы ---
+
+    def primes_in_range(self, lo, hi):
+        """Простые p, lo <= p < hi, по возрастанию."""
+        lo = max(lo, 0)
+        result = [2] if lo <= 2 < hi else []
+        if hi <= 3:
+            return result
+        lo = max(lo, 3) | 1  # первое нечётное >= lo
+        for k in range(lo // self.span, (hi - 2) // self.span + 1):
+            base = k * self.span + 1
+            first = max(lo, base)
+            last = min(hi, base + self.span)
+            if first >= last:
+                continue
+            seg = self._segment(k)
+            i, j = (first - base) // 2, (last - base + 1) // 2
+            result.extend(itertools.compress(range(base + 2 * i, base + 2 * j, 2), seg[i:j]))
+        return result
+
+    def count_primes(self, n):
+        """Количество простых <= n."""
+        if n < 2:
+            return 0
+        full, rest = divmod(n, self.span)
+        self._extend(full)
+        total = 1 + sum(self._counts[:full])  # 1 — это двойка
+        # в неполном сегменте — нечётные base + 2*i <= n
+        if rest:
+            total += self._segment(full)[:(rest + 1) // 2].count(1)
+        return total
+
+    def nth_prime(self, k):
+        """k-е простое, nth_prime(1) == 2."""
+        if k < 1:
+            raise ValueError("k должно быть >= 1")
+        if k == 1:
+            return 2
+        need = k - 1  # нечётных простых
+        seg_no = 0
+        while True:
+            if seg_no == len(self._counts):
+                self._extend(seg_no + 1)
+            if need <= self._counts[seg_no]:
+                break
+            need -= self._counts[seg_no]
+            seg_no += 1
+        seg = self._segment(seg_no)
+        i = -1
+        for _ in range(need):
+            i = seg.index(1, i + 1)
+        return seg_no * self.span + 2 * i + 1
+
+
+_default = None
+
+
+def default_sieve():
+    """Общее на процесс решето; PRIME_SIEVE_CACHE — каталог для кэша на диске."""
+    global _default
+    if _default is None:
+        _default = SegmentedSieve(os.environ.get('PRIME_SIEVE_CACHE') or None)
+    return _default
@@ -0,0 +1,36 @@
+import pytest
+from calculator import Calculator
+
+np = pytest.importorskip("numpy")
+
+calc = Calculator()
+
+
+def test_add_many():
+    assert calc.add_many([1, -1, 3.5], [2, 5, 2.5]).tolist() == [3, 4, 6.0]
+    assert calc.add_many(np.arange(3), 10).tolist() == [10, 11, 12]
+
+
+def test_divide_many_masks_zero_division():
+    result = calc.divide_many([10, 5, 1, -10], [2, 0, 4, 2])
+    assert result.mask.tolist() == [False, True, False, False]
+    assert result.compressed().tolist() == [5, 0.25, -5]
+
+
+def test_divide_many_strict_raises():
+    with pytest.raises(ZeroDivisionError, match="Деление на ноль запрещено"):
+        calc.divide_many([1, 2], [1, 0], strict=True)
+    assert calc.divide_many([9, 5], [3, 2], strict=True).tolist() == [3, 2.5]
+
+
+def test_is_prime_many_matches_scalar():
+    values = np.arange(-5, 5000)
+    expected = [calc.is_prime_number(int(n)) for n in values]
+    assert calc.is_prime_many(values).tolist() == expected
+
+
+def test_is_prime_many_large_and_non_int():
+    big = [2 ** 61 - 1, 2 ** 61 + 1, 2 ** 64 - 59]
+    assert calc.is_prime_many(np.array(big[:2], dtype=np.int64)).tolist() == [True, False]
+    assert calc.is_prime_many(big).tolist() == [True, False, True]
+    assert calc.is_prime_many([1.0, 7.0, 2.5]).tolist() == [False, True, True]
@@ -0,0 +1,83 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from calculator import Calculator, arithmetic
+from expressions import ExpressionEngine, ExpressionError, Formula
+
+
+engine = ExpressionEngine()
+
+
+@pytest.mark.parametrize("source, values, expected", [
+    ("a / b + c", dict(a=10, b=4, c=1), 3.5),
+    ("-(x - 2) * 3", dict(x=5), -9),
+    ("a + a * a", dict(a=3), 12),
+    ("1.5 * k / 2", dict(k=4), 3.0),
+    ("(p\n + q)", dict(p=1, q=2), 3),
+])
+def test_evaluate(source, values, expected):
+    assert engine.evaluate(source, **values) == expected
+
+
+def test_variables_in_source_order_and_positional_call():
+    formula = engine.compile("z / (x + y) - x")
+    assert formula.variables == ["z", "x", "y"]
+    assert formula(12, 1, 2) == 3.0
+
+
+@pytest.mark.parametrize("source", ["a / b", "a / (b - c)", "1 / 0"])
+def test_zero_division_message(source):
+    calc = Calculator()
+    for mode in ("float", "fraction", "decimal"):
+        with arithmetic(mode):
+            formula = ExpressionEngine(calc).compile(source)
+            with pytest.raises(ZeroDivisionError, match="Деление на ноль запрещено"):
+                formula(*[1, 0, 0][:len(formula.variables)])
+
+
+def test_exact_modes_match_calculator():
+    frac = ExpressionEngine(Calculator(mode="fraction"))
+    assert frac.evaluate("a / b + 0.1", a=1, b=3) == Fraction(13, 30)
+    assert frac.evaluate("a / b", a=6, b=3) == 2
+    dec = ExpressionEngine(Calculator(mode="decimal"))
+    assert dec.evaluate("price * qty + fee", price="19.99", qty=3, fee=0.03) == Decimal("60.00")
+    assert dec.evaluate("a / b", a=1, b=4) == Decimal("0.25")
+
+
+def test_cache_per_mode_and_bounded():
+    calc = Calculator()
+    eng = ExpressionEngine(calc, cache_size=2)
+    assert eng.compile("a + b") is eng.compile("a + b")
+    calc.mode = "decimal"
+    assert eng.compile("a + b").mode == "decimal"
+    eng.compile("a - b")
+    info = eng.cache_info()
+    assert info.hits == 1 and info.currsize == 2
+
+
+@pytest.mark.parametrize("source", [
+    "a ** 2", "a % b", "f(a)", "a.b", "'x' + a", "_div(a, b)", "a +", "True + a", "[a]",
+])
+def test_rejects_non_arithmetic(source):
+    with pytest.raises(ExpressionError):
+        Formula(source)
+
+
+def test_vectorized():
+    np = pytest.importorskip("numpy")
+    formula = engine.compile("a / b + c")
+    a, b = np.arange(1, 6), np.full(5, 2)
+    assert formula.vectorized(a, b, 1).tolist() == [1.5, 2, 2.5, 3, 3.5]
+    assert formula.vectorized(a=[1, 2], b=[4, 8], c=0).tolist() == [0.25, 0.25]
+    with pytest.raises(ZeroDivisionError, match="Деление на ноль запрещено"):
+        formula.vectorized(a, np.array([1, 2, 0, 4, 5]), 0)
+
+
+@pytest.mark.parametrize("mode, cls", [("fraction", Fraction), ("decimal", Decimal)])
+def test_exact_modes_result_type(mode, cls):
+    eng = ExpressionEngine(Calculator(mode=mode))
+    for source in ("a / b", "a + b", "a * b - 1", "-a"):
+        for a, b in ((6, 2), (7, 2)):
+            assert type(eng.evaluate(source, a=a, b=b) if "b" in source
+                        else eng.evaluate(source, a=a)) is cls
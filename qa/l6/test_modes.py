@@ -0,0 +1,91 @@
+import threading
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+import pytest
+from calculator import Calculator, arithmetic
+
+
+exact = Calculator(mode='fraction')
+money = Calculator(mode='decimal')
+
+
+def test_float_mode_unchanged():
+    calc = Calculator()
+    assert calc.mode == 'float'
+    assert calc.divide(1, 3) == 1 / 3
+    assert calc.add(0.1, 0.2) == 0.1 + 0.2
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    (1, 3, Fraction(1, 3)),
+    (10, 2, 5),
+    (0.1, 3, Fraction(1, 30)),
+    ("1.5", Fraction(1, 2), 3),
+    (Decimal("0.3"), 2, Fraction(3, 20)),
+])
+def test_fraction_divide(a, b, expected):
+    assert exact.divide(a, b) == expected
+
+
+def test_fraction_add():
+    assert exact.add(0.1, 0.2) == Fraction(3, 10)
+    assert exact.add(Fraction(1, 3), 1) == Fraction(4, 3)
+
+
+def test_decimal_mode():
+    assert money.add(0.1, 0.2) == Decimal("0.3")
+    assert money.add("19.99", "0.01") == Decimal("20.00")
+    assert money.divide(Decimal("10.00"), 4) == Decimal("2.5")
+    assert money.divide(1, 3) == Decimal(1) / Decimal(3)
+    with localcontext() as ctx:
+        ctx.prec = 5
+        assert money.divide(2, 3) == Decimal("0.66667")
+
+
+@pytest.mark.parametrize("calc, cls", [(exact, Fraction), (money, Decimal)])
+def test_result_type_per_mode(calc, cls):
+    # тип результата зависит только от режима, а не от значений
+    for value in (calc.add(1, 2), calc.add(0.5, 1), calc.divide(6, 2),
+                  calc.divide(7, 2), calc.divide(-8, 4)):
+        assert type(value) is cls
+    assert calc.divide(6, 2) == 3 and calc.divide(7, 2) == cls(7) / 2
+    assert type(Calculator().divide(6, 2)) is float
+
+
+@pytest.mark.parametrize("b", [0, 0.0, "0", Decimal("0.00"), Fraction(0)])
+def test_zero_division_in_every_mode(b):
+    for calc in (Calculator(), exact, money):
+        if calc.mode == 'float' and isinstance(b, str):
+            continue
+        with pytest.raises(ZeroDivisionError, match="Деление на ноль запрещено"):
+            calc.divide(1, b)
+
+
+def test_context_mode():
+    calc = Calculator()
+    with arithmetic('fraction'):
+        assert calc.divide(1, 3) == Fraction(1, 3)
+        assert money.divide(1, 4) == Decimal("0.25")  # режим экземпляра важнее
+        with arithmetic('decimal'):
+            assert calc.divide(1, 4) == Decimal("0.25")
+        assert calc.mode == 'fraction'
+    assert calc.mode == 'float'
+
+
+def test_context_mode_is_per_thread():
+    calc = Calculator()
+    seen = []
+    with arithmetic('decimal'):
+        t = threading.Thread(target=lambda: seen.append(calc.mode))
+        t.start()
+        t.join()
+    assert seen == ['float']
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        Calculator(mode='money')
+    with pytest.raises(ValueError):
+        with arithmetic('int'):
+            pass
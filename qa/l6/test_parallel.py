@@ -0,0 +1,36 @@
+import pytest
+from calculator import Calculator
+from parallel import ParallelPrimes
+
+
+# маленький порог и куски — чтобы в тестах реально работал пул
+@pytest.fixture(scope="module")
+def calc():
+    with ParallelPrimes(workers=2, threshold=100, min_chunk=50) as parallel:
+        yield Calculator(parallel=parallel)
+
+
+def test_matches_scalar_in_order(calc):
+    values = list(range(-10, 3000))[::-1]
+    assert calc.is_prime_parallel(values) == [calc.is_prime_number(n) for n in values]
+
+
+def test_outliers_checked_in_parent(calc):
+    values = list(range(500)) + [2 ** 64 - 59, 2 ** 64 + 1, 7.0, 2.5, -2 ** 70]
+    result = calc.is_prime_parallel(values)
+    assert result[-5:] == [True, False, True, True, False]
+    assert result[:500] == [calc.is_prime_number(n) for n in range(500)]
+
+
+def test_below_threshold_runs_serially():
+    parallel = ParallelPrimes(workers=2, threshold=100)
+    assert parallel.is_prime([2, 3, 4, 2 ** 61 - 1]) == [True, True, False, True]
+    assert parallel._pool is None
+
+
+def test_chunks_cover_input():
+    parallel = ParallelPrimes(workers=3, min_chunk=10)
+    for n in (1, 10, 11, 119, 1000):
+        chunks = parallel._chunks(n)
+        assert chunks[0][0] == 0 and chunks[-1][1] == n
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
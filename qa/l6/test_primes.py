@@ -0,0 +1,75 @@
+import pytest
+from calculator import Calculator
+from primes import MR_EXACT_LIMIT, PrimeEngine, miller_rabin, strong_lucas
+
+
+def trial_division(n):
+    if n <= 1:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+# маленькое решето, чтобы проверить и его, и переход на Миллера–Рабина
+engine = PrimeEngine(sieve_limit=1001, cache_size=128)
+calc = Calculator(prime_engine=engine)
+
+
+def test_matches_trial_division():
+    for n in range(-10, 20000):
+        assert calc.is_prime_number(n) == trial_division(n), n
+
+
+@pytest.mark.parametrize("n, expected", [
+    (561, False),                   # число Кармайкла
+    (2047, False),                  # сильно псевдопростое по основанию 2
+    (3215031751, False),            # ... по основаниям 2, 3, 5, 7
+    (3825123056546413051, False),   # ... по основаниям до 23
+    (2 ** 61 - 1, True),
+    (2 ** 64 - 59, True),           # наибольшее простое < 2**64
+    ((2 ** 31 - 1) * (2 ** 31 - 1), False),
+    # граница точности MR_BASES: дальше решает сильный тест Люка
+    (MR_EXACT_LIMIT - 2, False),
+    (MR_EXACT_LIMIT, False),        # = 399165290221 * 798330580441
+    (3317044064679887385961981, False),  # psi_13 = 1287836182261 * 2575672364521
+    (2 ** 89 - 1, True),
+    (2 ** 127 - 1, True),
+    ((2 ** 61 - 1) * (2 ** 89 - 1), False),
+])
+def test_large_values(n, expected):
+    assert calc.is_prime_number(n) == expected
+
+
+def test_exact_limit_fools_miller_rabin_alone():
+    assert miller_rabin(MR_EXACT_LIMIT)
+    assert not strong_lucas(MR_EXACT_LIMIT)
+
+
+def test_strong_lucas_agrees_with_sieve():
+    engine = PrimeEngine(sieve_limit=20000)
+    for n in range(39, 20000, 2):
+        if strong_lucas(n) != engine.is_prime(n):
+            # сильно псевдопростые Люка (5459, 5777, 10877, ...) — составные
+            assert strong_lucas(n) and not engine.is_prime(n)
+            assert not miller_rabin(n)
+
+
+@pytest.mark.parametrize("n, expected", [
+    (1.0, False),
+    (-3.5, False),
+    (4.0, False),
+    (7.0, True),
+    (2.5, True),  # поведение старого перебора для нецелых сохраняется
+    (True, False),
+])
+def test_non_int_inputs_keep_old_behaviour(n, expected):
+    assert calc.is_prime_number(n) == expected
+
+
+def test_results_are_cached():
+    engine.is_prime.cache_clear()
+    calc.is_prime_number(1_000_003)
+    calc.is_prime_number(1_000_003)
+    assert engine.cache_info().hits == 1
@@ -0,0 +1,108 @@
+import pytest
+from calculator import Calculator
+from sieve import SegmentedSieve, pack, unpack
+
+
+def trial_division(n):
+    if n <= 1:
+        return False
+    for i in range(2, int(n ** 0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+PRIMES = [n for n in range(20000) if trial_division(n)]
+
+# крошечные сегменты — чтобы запросы пересекали много границ
+sieve = SegmentedSieve(segment=64, bits_limit=5000)
+calc = Calculator(sieve=sieve)
+
+
+def test_pack_roundtrip():
+    seg = bytearray([1, 0, 0, 1, 1, 0, 1, 0] * 4)
+    assert unpack(pack(seg), len(seg)) == seg
+
+
+@pytest.mark.parametrize("lo, hi", [
+    (0, 0), (0, 3), (2, 3), (3, 4), (-10, 30), (100, 101), (127, 130),
+    (128, 260), (4990, 5010), (0, 20000), (19000, 20000),
+])
+def test_primes_in_range(lo, hi):
+    assert calc.primes_in_range(lo, hi) == [p for p in PRIMES if lo <= p < hi]
+
+
+def test_count_primes():
+    for n in list(range(-2, 300)) + [4999, 5000, 12345, 19999]:
+        assert calc.count_primes(n) == sum(1 for p in PRIMES if p <= n), n
+
+
+def test_nth_prime():
+    for k in (1, 2, 3, 10, 31, 32, 33, 1000, len(PRIMES)):
+        assert calc.nth_prime(k) == PRIMES[k - 1]
+    with pytest.raises(ValueError):
+        calc.nth_prime(0)
+
+
+def test_known_values():
+    s = SegmentedSieve()
+    assert s.count_primes(10 ** 6) == 78498
+    assert s.nth_prime(10 ** 5) == 1299709
+    assert s.primes_in_range(10 ** 9, 10 ** 9 + 30) == [1000000007, 1000000009, 1000000021]
+
+
+def test_persisted_cache_starts_warm(tmp_path):
+    cold = SegmentedSieve(tmp_path, segment=64, bits_limit=5000)
+    assert cold.count_primes(19999) == 2262
+    assert cold.sieved > 0
+    cold.close()
+
+    warm = SegmentedSieve(tmp_path, segment=64, bits_limit=5000)
+    # ниже bits_limit сегменты читаются из файла
+    assert warm.count_primes(4000) == 550
+    assert warm.nth_prime(600) == PRIMES[599]
+    assert warm.primes_in_range(0, 4990) == [p for p in PRIMES if p < 4990]
+    assert warm.sieved == 0
+    # выше — сохранены только счётчики: полные сегменты не пересеиваются,
+    # неполный последний — да
+    assert warm.count_primes(19999) == 2262
+    assert warm.sieved == 1
+    warm.close()
+
+
+def test_persisted_cache_other_segment_size(tmp_path):
+    SegmentedSieve(tmp_path, segment=64).count_primes(10000)
+    other = SegmentedSieve(tmp_path, segment=128)
+    assert other.count_primes(10000) == 1229
+    assert other.primes_in_range(0, 30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_persisted_cache_truncated_file(tmp_path):
+    s = SegmentedSieve(tmp_path, segment=64)
+    s.count_primes(10000)
+    s.close()
+    # сбой посреди записи счётчика и сегмента битов
+    with open(tmp_path / 'sieve.counts', 'ab') as f:
+        f.write(b'\x07\x00')
+    with open(tmp_path / 'sieve.bits', 'ab') as f:
+        f.write(b'\xff' * 3)
+    s = SegmentedSieve(tmp_path, segment=64)
+    assert s.sieved == 0
+    assert s.count_primes(20000) == 2262
+    assert s.primes_in_range(9990, 10010) == [10007, 10009]
+    s.close()
+    assert (tmp_path / 'sieve.counts').stat().st_size % 4 == 0
+
+
+def test_persisted_cache_shared_between_instances(tmp_path):
+    # как два процесса с одним каталогом: у каждого свои файлы и свой flock
+    first = SegmentedSieve(tmp_path, segment=64)
+    second = SegmentedSieve(tmp_path, segment=64)
+    assert first.count_primes(3000) == 430
+    assert second.count_primes(5000) == 669
+    assert second.sieved == 40 - 24  # первые 24 сегмента досчитал first
+    assert first.count_primes(5000) == 669
+    assert first.sieved == 24
+    first.close()
+    second.close()
+    assert (tmp_path / 'sieve.counts').stat().st_size == 40 * 4
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: накладные расходы на команду WebDriver у фейкового и настоящего Appium
+
+Фейк (fake_appium.py) поднимается в этом же процессе. Настоящий сервер
+замеряется, только если указан --server (нужны Appium и эмулятор на
+рабочем столе). Для каждой команды — среднее время одного вызова через
+Appium-Python-Client, плюс время создания сессии.
+
+    python bench_backends.py --repeat 50 --server http://127.0.0.1:4723
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+from appium.webdriver.common.appiumby import AppiumBy
+
+from fake_appium import clock_server
+from session_manager import SessionManager
+
+CLOCK_ICON = "//android.widget.TextView[@text='Clock']"
+
+COMMANDS: Dict[str, Callable] = {
+    "status": lambda d: d.get_status(),
+    "current_activity": lambda d: d.current_activity,
+    "find_element": lambda d: d.find_element(AppiumBy.XPATH, CLOCK_ICON),
+    "element.text": lambda d: d.find_element(AppiumBy.XPATH, CLOCK_ICON).text,
+    "find_elements": lambda d: d.find_elements(AppiumBy.XPATH, "//android.widget.TextView"),
+    "page_source": lambda d: d.page_source,
+    "orientation": lambda d: d.orientation,
+}
+
+
+def measure(server_url: str, repeat: int) -> Dict[str, Optional[float]]:
+    """Среднее время команды в мс; None — команда не прошла на этом бэкенде"""
+    sessions = SessionManager(server_url)
+    start = time.perf_counter()
+    driver = sessions.acquire("clock", launch=False)  # рабочий стол, как в test_clock
+    timings: Dict[str, Optional[float]] = {"new session": (time.perf_counter() - start) * 1000}
+    try:
+        for name, command in COMMANDS.items():
+            try:
+                command(driver)  # прогрев
+                start = time.perf_counter()
+                for _ in range(repeat):
+                    command(driver)
+                timings[name] = (time.perf_counter() - start) / repeat * 1000
+            except Exception:
+                timings[name] = None
+    finally:
+        sessions.release(driver)
+        sessions.close()
+    # element.text — это find_element + text: чистое время text
+    if timings.get("element.text") is not None and timings.get("find_element") is not None:
+        timings["element.text"] -= timings["find_element"]
+    return timings
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--server", help="URL настоящего Appium (по умолчанию только фейк)")
+    args = parser.parse_args(argv)
+
+    with clock_server(port=0) as server:
+        columns = {"fake": measure(server.url, args.repeat)}
+    if args.server:
+        try:
+            columns["real"] = measure(args.server, args.repeat)
+        except Exception as e:
+            print(f"Real Appium at {args.server} is not available: {type(e).__name__}")
+
+    print(f"{'command, ms':<18}" + "".join(f"{name:>10}" for name in columns))
+    for command in next(iter(columns.values())):
+        cells = []
+        for timings in columns.values():
+            value = timings.get(command)
+            cells.append(f"{value:>10.2f}" if value is not None else f"{'n/a':>10}")
+        print(f"{command:<18}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
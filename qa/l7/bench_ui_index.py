@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Бенчмарк: тексты экрана по элементам (как было в test_clock.py) против
+одного page_source + локального индекса
+
+Без устройства задержка HTTP-запроса к Appium имитируется (--latency, мс):
+find_elements, каждый element.text и page_source стоят по одному запросу.
+"""
+
+import argparse
+import time
+
+from ui_index import UiIndex
+
+TABS = ["Alarm", "World clock", "Stopwatch", "Timer", "Clock"]
+
+
+class FakeElement:
+    def __init__(self, driver, text):
+        self._driver = driver
+        self._text = text
+
+    @property
+    def text(self):
+        self._driver.round_trip()
+        return self._text
+
+
+class FakeDriver:
+    """Отвечает с заданной задержкой по содержимому дампа"""
+
+    def __init__(self, source: str, latency: float):
+        self.source = source
+        self.latency = latency
+        self.calls = 0
+        self._texts = UiIndex.from_source(source).texts("android.widget.TextView")
+
+    def round_trip(self):
+        self.calls += 1
+        time.sleep(self.latency)
+
+    def find_elements(self, by, value):
+        self.round_trip()
+        return [FakeElement(self, text) for text in self._texts]
+
+    @property
+    def page_source(self):
+        self.round_trip()
+        return self.source
+
+
+def per_element(driver):
+    texts = [tv.text for tv in driver.find_elements("xpath", "//android.widget.TextView")]
+    return [text for text in texts if text in TABS]
+
+
+def indexed(driver):
+    return [text for text in UiIndex.from_driver(driver).texts("android.widget.TextView")
+            if text in TABS]
+
+
+def measure(fn, driver, repeat):
+    driver.calls = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(driver)
+    return (time.perf_counter() - start) / repeat, driver.calls / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dump", default="window_dump.xml")
+    parser.add_argument("--latency", type=float, default=20.0, help="мс на запрос к Appium")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.dump, encoding="utf-8") as f:
+        source = f.read()
+
+    start = time.perf_counter()
+    n = 200
+    for _ in range(n):
+        screen = UiIndex.from_source(source)
+    parse_ms = (time.perf_counter() - start) / n * 1000
+    print(f"{args.dump}: {len(source)} байт, {len(screen)} узлов, разбор {parse_ms:.2f} мс")
+
+    driver = FakeDriver(source, args.latency / 1000)
+    rows = [("по элементам", *measure(per_element, driver, args.repeat)),
+            ("page_source + индекс", *measure(indexed, driver, args.repeat))]
+    assert rows[0][3] == rows[1][3]
+
+    print(f"\nзадержка запроса: {args.latency:g} мс")
+    print(f"{'способ':<22} {'запросов':>9} {'время, мс':>10}")
+    for name, seconds, calls, _ in rows:
+        print(f"{name:<22} {calls:>9.0f} {seconds * 1000:>10.1f}")
+    print(f"ускорение: x{rows[0][1] / rows[1][1]:.1f}")
+
+
+if __name__ == "__main__":
+    main()
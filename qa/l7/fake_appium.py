@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Фейковый Appium-сервер с экранами из иерархий UI
+
+Расширяет MockAppiumServer: каждый экран — дамп в формате uiautomator
+(<node class=...>). С устройства записан только рабочий стол
+(window_dump.xml); экраны часов в hierarchies/*.xml составлены вручную
+по образцу такого дампа, поэтому id, bounds и тексты в них — примерные.
+
+Как и UiAutomator2, сервер отдаёт page_source в формате Appium: тег
+элемента — его класс, корень <hierarchy class="hierarchy">. XPath
+вычисляется lxml по этому же документу, как на настоящем сервере;
+id, accessibility id и class name ищутся по UiIndex. Поддержаны
+click/text/rect/attribute, back, orientation и W3C actions; клик по
+элементу с переходом (on_click) показывает следующий экран. Так
+SimpleClockTester и EnvironmentTester проходят целиком без эмулятора,
+за миллисекунды.
+
+    python fake_appium.py --port 4723     # сервер вместо Appium
+    python fake_appium.py --run-clock     # SimpleClockTester против фейка
+"""
+
+import argparse
+import os
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from lxml import etree
+
+from mock_appium import (LAUNCHER_ACTIVITY, LAUNCHER_PACKAGE, MockAppiumServer, MockSession,
+                         WebDriverError)
+from ui_index import UiIndex, UiNode, parse_bounds
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HIERARCHIES = os.path.join(HERE, "hierarchies")
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"  # W3C: ключ ссылки на элемент
+
+CLOCK_PACKAGE = "com.google.android.deskclock"
+CLOCK_ACTIVITY = ".DeskClock"
+
+# атрибуты get_attribute -> поля UiNode
+_ATTRIBUTES = {
+    "text": "text", "resource-id": "resource_id", "resourceId": "resource_id",
+    "class": "class_name", "className": "class_name",
+    "content-desc": "content_desc", "contentDescription": "content_desc",
+    "package": "package", "clickable": "clickable", "enabled": "enabled",
+    "checked": "checked", "selected": "selected",
+}
+
+
+class Screen(NamedTuple):
+    name: str
+    package: str
+    activity: str
+    source: str  # page_source в формате Appium
+    index: UiIndex
+    tree: Any  # lxml-корень source: по нему вычисляется XPath
+    positions: Dict[Any, int]  # lxml-элемент -> индекс узла в UiIndex
+
+
+def appium_source(dump: str) -> str:
+    """Дамп uiautomator -> page_source UiAutomator2.
+
+    <node class="X"> становится <X class="X" displayed="true">, у корня
+    появляются index, class="hierarchy", width и height экрана. Источник
+    уже в формате Appium возвращается как есть.
+    """
+    root = etree.fromstring(dump.encode("utf-8"))
+    nodes = root.findall(".//node")
+    if not nodes:
+        return dump
+    for node in nodes:
+        node.tag = node.get("class")
+        node.set("displayed", "true")
+    rotation = root.get("rotation", "0")
+    root.attrib.clear()
+    root.set("index", "0")
+    root.set("class", "hierarchy")
+    root.set("rotation", rotation)
+    _, _, width, height = parse_bounds(nodes[0].get("bounds", ""))
+    root.set("width", str(width))
+    root.set("height", str(height))
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8",
+                          standalone=True).decode("utf-8")
+
+
+class FakeSession(MockSession):
+    """Сессия, у которой на «экране» один из экранов сервера"""
+
+    def __init__(self, session_id: str, capabilities: Dict[str, Any], server: "FakeAppiumServer"):
+        self.server = server
+        self.screen = server.screens[server.launcher]
+        self.visit = 0  # номер показа экрана: ссылки со старых показов устарели
+        self.history: List[str] = []
+        self.orientation = "PORTRAIT"
+        super().__init__(session_id, capabilities)
+
+    def show(self, name: str, remember: bool = True):
+        if remember and name != self.screen.name:
+            self.history.append(self.screen.name)
+        self.screen = self.server.screens[name]
+        self.package = self.screen.package
+        self.activity = self.screen.activity
+        self.visit += 1
+
+    def activate(self, package: str):
+        super().activate(package)
+        start = self.server.app_screens.get(package)
+        if start:
+            self.show(start)
+
+    def home(self):
+        super().home()
+        self.history.clear()
+        self.show(self.server.launcher, remember=False)
+
+    def back(self):
+        if self.history:
+            self.show(self.history.pop(), remember=False)
+
+    # --- элементы ---
+
+    def element_id(self, node: UiNode) -> str:
+        return f"{self.screen.name}.{self.visit}.{node.index}"
+
+    def node(self, element_id: str) -> UiNode:
+        screen, visit, index = element_id.rsplit(".", 2)
+        if screen != self.screen.name or int(visit) != self.visit:
+            raise WebDriverError(404, "stale element reference",
+                                 f"Element {element_id} is not on the current screen")
+        return self.screen.index.nodes[int(index)]
+
+
+class FakeAppiumServer(MockAppiumServer):
+    """Appium-подобный сервер, экраны которого — иерархии UI из дампов"""
+
+    def __init__(self, launcher_source: str = os.path.join(HERE, "window_dump.xml"), **kwargs: Any):
+        self.screens: Dict[str, Screen] = {}
+        self.app_screens: Dict[str, str] = {}  # пакет -> стартовый экран
+        self.transitions: Dict[Tuple[str, str], str] = {}
+        self.launcher = "launcher"
+        super().__init__(**kwargs)
+        self.add_screen(self.launcher, launcher_source, LAUNCHER_PACKAGE, LAUNCHER_ACTIVITY)
+
+    # --- сценарий ---
+
+    def add_screen(self, name: str, source: str, package: str, activity: str,
+                   start: bool = False) -> "FakeAppiumServer":
+        """source — путь к дампу или сам XML; start — экран, с которого стартует пакет"""
+        if not source.lstrip().startswith("<"):
+            with open(source, encoding="utf-8") as f:
+                source = f.read()
+        source = appium_source(source)
+        tree = etree.fromstring(source.encode("utf-8"))
+        # все потомки корня — узлы UI, в том же порядке документа, что и в UiIndex
+        positions = {elem: i for i, elem in enumerate(tree.iterdescendants())}
+        self.screens[name] = Screen(name, package, activity, source,
+                                    UiIndex.from_source(source), tree, positions)
+        if start:
+            self.app_screens[package] = name
+        return self
+
+    def on_click(self, screen: str, target: str, next_screen: str) -> "FakeAppiumServer":
+        """Клик по элементу экрана screen с text/content-desc/resource-id == target"""
+        self.transitions[(screen, target)] = next_screen
+        return self
+
+    def make_session(self, session_id: str, caps: Dict[str, Any]) -> FakeSession:
+        return FakeSession(session_id, caps, self)
+
+    # --- маршруты ---
+
+    def _add_routes(self):
+        # раньше маршрутов MockAppiumServer: первый подходящий выигрывает
+        element = "/session/([^/]+)/element/([^/]+)"
+        self.route("POST", "/session/([^/]+)/element", self._find_element)
+        self.route("POST", "/session/([^/]+)/elements", self._find_elements)
+        self.route("POST", f"{element}/click", self._click)
+        self.route("GET", f"{element}/text", lambda s, body, sid, eid: s.node(eid).text)
+        self.route("GET", f"{element}/rect", self._rect)
+        self.route("GET", f"{element}/attribute/([^/]+)", self._attribute)
+        self.route("GET", f"{element}/displayed", lambda s, body, sid, eid: bool(s.node(eid)))
+        self.route("GET", f"{element}/enabled", lambda s, body, sid, eid: s.node(eid).enabled)
+        self.route("GET", f"{element}/selected", lambda s, body, sid, eid: s.node(eid).selected)
+        self.route("GET", "/session/([^/]+)/source", lambda s, body, sid: s.screen.source)
+        self.route("POST", "/session/([^/]+)/back", lambda s, body, sid: s.back())
+        self.route("GET", "/session/([^/]+)/orientation", lambda s, body, sid: s.orientation)
+        self.route("POST", "/session/([^/]+)/orientation", self._set_orientation)
+        self.route("POST", "/session/([^/]+)/actions", lambda s, body, sid: None)
+        self.route("DELETE", "/session/([^/]+)/actions", lambda s, body, sid: None)
+        self.route("POST", "/session/([^/]+)/timeouts", lambda s, body, sid: None)
+        super()._add_routes()
+
+    def _lookup(self, session: FakeSession, body: Dict[str, Any]) -> List[UiNode]:
+        using, value = body.get("using"), body.get("value", "")
+        index = session.screen.index
+        if using == "xpath":
+            return self._xpath(session.screen, value)
+        if using == "id":
+            # как UiAutomator2: id без пакета ищется в пакете приложения
+            if ":id/" not in value:
+                value = f"{session.screen.package}:id/{value}"
+            return index.find(resource_id=value)
+        if using == "accessibility id":
+            return index.find(content_desc=value)
+        if using == "class name":
+            return index.find(class_name=value)
+        raise WebDriverError(400, "invalid selector", f"Locator strategy {using!r} is not supported")
+
+    @staticmethod
+    def _xpath(screen: Screen, xpath: str) -> List[UiNode]:
+        try:
+            found = screen.tree.xpath(xpath)
+        except etree.XPathError as e:
+            raise WebDriverError(400, "invalid selector", f"{xpath!r}: {e}")
+        if not isinstance(found, list) or not all(isinstance(f, etree._Element) for f in found):
+            raise WebDriverError(400, "invalid selector",
+                                 f"{xpath!r} does not select elements")
+        return [screen.index.nodes[screen.positions[elem]] for elem in found
+                if elem in screen.positions]
+
+    def _find_element(self, session, body, session_id):
+        nodes = self._lookup(session, body)
+        if not nodes:
+            raise WebDriverError(404, "no such element",
+                                 f"{body.get('using')}={body.get('value')!r} not found on "
+                                 f"screen {session.screen.name!r}")
+        return {ELEMENT_KEY: session.element_id(nodes[0])}
+
+    def _find_elements(self, session, body, session_id):
+        return [{ELEMENT_KEY: session.element_id(node)} for node in self._lookup(session, body)]
+
+    def _click(self, session, body, session_id, element_id):
+        node = session.node(element_id)
+        screen = session.screen.name
+        for target in (node.text, node.content_desc, node.resource_id):
+            next_screen = target and self.transitions.get((screen, target))
+            if next_screen:
+                session.show(next_screen)
+                break
+        return None
+
+    def _rect(self, session, body, session_id, element_id):
+        left, top, right, bottom = session.node(element_id).bounds
+        return {"x": left, "y": top, "width": right - left, "height": bottom - top}
+
+    def _attribute(self, session, body, session_id, element_id, name):
+        node = session.node(element_id)
+        field = _ATTRIBUTES.get(name)
+        if field is None:
+            return None
+        value = getattr(node, field)
+        # UiAutomator2 отдаёт атрибуты строками
+        return str(value).lower() if isinstance(value, bool) else value
+
+    def _set_orientation(self, session, body, session_id):
+        orientation = str(body.get("orientation", "")).upper()
+        if orientation not in ("PORTRAIT", "LANDSCAPE"):
+            raise WebDriverError(400, "invalid argument", f"Unknown orientation {orientation!r}")
+        session.orientation = orientation
+        return None
+
+
+def clock_server(**kwargs: Any) -> FakeAppiumServer:
+    """Сценарий тестов часов: рабочий стол -> Clock -> Add alarm -> Cancel"""
+    server = FakeAppiumServer(**kwargs)
+    server.add_screen("clock_alarm", os.path.join(HIERARCHIES, "clock_alarm.xml"),
+                      CLOCK_PACKAGE, CLOCK_ACTIVITY, start=True)
+    server.add_screen("clock_add_alarm", os.path.join(HIERARCHIES, "clock_add_alarm.xml"),
+                      CLOCK_PACKAGE, CLOCK_ACTIVITY)
+    server.on_click("launcher", "Clock", "clock_alarm")
+    server.on_click("clock_alarm", "Add alarm", "clock_add_alarm")
+    server.on_click("clock_add_alarm", "Cancel", "clock_alarm")
+    server.on_click("clock_add_alarm", "OK", "clock_alarm")
+    return server
+
+
+def run_clock(server: FakeAppiumServer) -> Dict[str, Any]:
+    from session_manager import SessionManager
+    from test_clock import SimpleClockTester
+
+    tester = SimpleClockTester(SessionManager(server.url))
+    try:
+        return tester.run_all_tests()
+    finally:
+        tester.sessions.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fake Appium server backed by UI hierarchy dumps")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4723)
+    parser.add_argument("--run-clock", action="store_true",
+                        help="run SimpleClockTester against the fake on a free port and exit")
+    args = parser.parse_args(argv)
+
+    if args.run_clock:
+        with clock_server(host=args.host, port=0) as server:
+            start = time.perf_counter()
+            results = run_clock(server)
+            elapsed = time.perf_counter() - start
+        for name, result in results.items():
+            print(f"{name:30} {'PASSED' if result is True else 'FAILED'}")
+        print(f"{'total':30} {elapsed * 1000:.0f} ms, {sum(server.commands.values())} commands")
+        return 0 if all(r is True for r in results.values()) else 1
+
+    server = clock_server(host=args.host, port=args.port)
+    server.start()
+    print(f"Fake Appium server on {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
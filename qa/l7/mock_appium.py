@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Мок Appium-сервера для тестов без эмулятора
+
+Поднимается в фоновом потоке на свободном порту и отвечает по протоколу
+W3C WebDriver на то, что нужно менеджеру сессий: /status, создание и
+удаление сессии (с имитацией времени старта UiAutomator2 — startup_delay)
+и mobile:-расширения activateApp/terminateApp/queryAppState/pressKey/
+getCurrentActivity/getCurrentPackage. Сервер считает созданные сессии и
+команды; kill_session() имитирует упавшую сессию.
+
+    with MockAppiumServer(startup_delay=0.5) as server:
+        driver = webdriver.Remote(server.url, options=options)
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+LAUNCHER_PACKAGE = "com.google.android.apps.nexuslauncher"
+LAUNCHER_ACTIVITY = ".NexusLauncherActivity"
+KEYCODE_HOME = 3
+
+# ApplicationState из Appium-Python-Client
+NOT_INSTALLED, NOT_RUNNING, RUNNING_IN_BACKGROUND, RUNNING_IN_FOREGROUND = 0, 1, 3, 4
+
+
+class WebDriverError(Exception):
+    """Ошибка в формате W3C: status HTTP, код error и сообщение"""
+
+    def __init__(self, status: int, error: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.error = error
+
+
+class MockSession:
+    """Состояние одного «устройства»: приложения и что сейчас на экране"""
+
+    def __init__(self, session_id: str, capabilities: Dict[str, Any]):
+        self.id = session_id
+        self.capabilities = capabilities
+        self.apps: Dict[str, int] = {}
+        self.package = LAUNCHER_PACKAGE
+        self.activity = LAUNCHER_ACTIVITY
+        package = capabilities.get("appPackage")
+        if package:
+            self.apps[package] = NOT_RUNNING
+            if capabilities.get("autoLaunch", True):
+                self.activate(package)
+
+    def activate(self, package: str):
+        if self.package in self.apps and self.package != package:
+            self.apps[self.package] = RUNNING_IN_BACKGROUND
+        self.apps[package] = RUNNING_IN_FOREGROUND
+        self.package = package
+        if package == self.capabilities.get("appPackage"):
+            self.activity = self.capabilities.get("appActivity", ".MainActivity")
+        else:
+            self.activity = ".MainActivity"
+
+    def terminate(self, package: str) -> bool:
+        if self.apps.get(package, NOT_INSTALLED) < RUNNING_IN_BACKGROUND:
+            return False
+        if self.package == package:
+            self.home()
+        self.apps[package] = NOT_RUNNING
+        return True
+
+    def home(self):
+        if self.package in self.apps:
+            self.apps[self.package] = RUNNING_IN_BACKGROUND
+        self.package = LAUNCHER_PACKAGE
+        self.activity = LAUNCHER_ACTIVITY
+
+
+Handler = Callable[..., Any]
+
+
+class MockAppiumServer:
+    """Appium-подобный HTTP-сервер в фоновом потоке"""
+
+    def __init__(self, startup_delay: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.startup_delay = startup_delay
+        self.sessions: Dict[str, MockSession] = {}
+        self.created = 0
+        self.deleted = 0
+        self.started: List[Dict[str, Any]] = []  # capabilities каждой созданной сессии
+        self.commands: Counter = Counter()
+        self._lock = threading.Lock()
+        self._routes: List[Tuple[str, Pattern, Handler]] = []
+        self._mobile: Dict[str, Handler] = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self._add_routes()
+
+    # --- запуск ---
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockAppiumServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        logger.info(f"Mock Appium server listening on {self.url}")
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MockAppiumServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def kill_session(self, session_id: str):
+        """Сессия «упала»: дальше на её команды — invalid session id"""
+        with self._lock:
+            self.sessions.pop(session_id, None)
+
+    # --- маршруты ---
+
+    def route(self, method: str, pattern: str, handler: Handler):
+        """handler(session, body, *группы pattern); session — None для путей без /session/<id>"""
+        self._routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def mobile(self, name: str, handler: Handler):
+        """handler(session, args) для execute_script('mobile: <name>', args)"""
+        self._mobile[name] = handler
+
+    def _add_routes(self):
+        self.route("GET", "/status", lambda s, body: {"ready": True, "message": "mock appium"})
+        self.route("POST", "/session", self._new_session)
+        self.route("DELETE", "/session/([^/]+)", self._delete_session)
+        self.route("GET", "/session/([^/]+)", lambda s, body, sid: s.capabilities)
+        self.route("POST", "/session/([^/]+)/execute/sync", self._execute)
+        self.route("GET", "/session/([^/]+)/orientation", lambda s, body, sid: "PORTRAIT")
+
+        self.mobile("activateApp", lambda s, a: s.activate(a["appId"]))
+        self.mobile("terminateApp", lambda s, a: s.terminate(a["appId"]))
+        self.mobile("queryAppState", lambda s, a: s.apps.get(a["appId"], NOT_INSTALLED))
+        self.mobile("getCurrentActivity", lambda s, a: s.activity)
+        self.mobile("getCurrentPackage", lambda s, a: s.package)
+        self.mobile("pressKey", self._press_key)
+
+    def _new_session(self, session, body):
+        caps = dict(body.get("capabilities", {}).get("alwaysMatch", {}))
+        for first in body.get("capabilities", {}).get("firstMatch", [{}])[:1]:
+            caps.update(first)
+        # appium:appPackage -> appPackage
+        caps = {key.split(":", 1)[-1]: value for key, value in caps.items()}
+        time.sleep(self.startup_delay)
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self.sessions[session_id] = self.make_session(session_id, caps)
+            self.created += 1
+            self.started.append(caps)
+        return {"sessionId": session_id, "capabilities": caps}
+
+    def make_session(self, session_id: str, caps: Dict[str, Any]) -> MockSession:
+        return MockSession(session_id, caps)
+
+    def _delete_session(self, session, body, session_id):
+        with self._lock:
+            self.sessions.pop(session_id, None)
+            self.deleted += 1
+        return None
+
+    def _execute(self, session, body, session_id):
+        script = body.get("script", "")
+        if not script.startswith("mobile:"):
+            raise WebDriverError(500, "unsupported operation", f"Mock cannot execute {script!r}")
+        name = script.split(":", 1)[1].strip()
+        handler = self._mobile.get(name)
+        if handler is None:
+            raise WebDriverError(404, "unknown method", f"Unknown mobile command {name!r}")
+        self.commands[script] += 1
+        args = (body.get("args") or [{}])[0]
+        return handler(session, args)
+
+    def _press_key(self, session, args):
+        if args.get("keycode") == KEYCODE_HOME:
+            session.home()
+
+    # --- обработка запросов ---
+
+    def dispatch(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if route_method != method or not match:
+                continue
+            groups = match.groups()
+            self.commands[f"{method} {pattern.pattern}"] += 1
+            session = None
+            if path.startswith("/session/") and groups:
+                session = self.sessions.get(groups[0])
+                if session is None and method != "DELETE":
+                    return 404, _error("invalid session id", f"Session {groups[0]} does not exist")
+            try:
+                return 200, {"value": handler(session, body, *groups)}
+            except WebDriverError as e:
+                return e.status, _error(e.error, str(e))
+            except Exception as e:
+                # как у Appium: любая ошибка обработчика — 500 unknown error, а не обрыв ответа
+                logger.exception(f"Mock handler failed on {method} {path}")
+                return 500, _error("unknown error", f"{type(e).__name__}: {e}")
+        return 404, _error("unknown command", f"{method} {path} is not supported by the mock")
+
+    def _handler_class(self):
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True  # иначе заголовки и тело ждут delayed ACK (~40 мс)
+
+            def _respond(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else {}
+                status, payload = server.dispatch(self.command, self.path.rstrip("/") or "/", body)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_DELETE = _respond
+
+            def log_message(self, format, *args):
+                logger.debug("mock appium: " + format % args)
+
+        return RequestHandler
+
+
+def _error(error: str, message: str) -> Dict[str, Any]:
+    return {"value": {"error": error, "message": message, "stacktrace": ""}}
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Параллельный прогон тестов часов на нескольких устройствах
+
+Каждое устройство (эмулятор) получает свою сессию Appium со своими udid
+и systemPort (порт UiAutomator2 на стороне сервера не должен совпадать,
+иначе сессии мешают друг другу) и свой SimpleClockTester в отдельном
+потоке. Тесты раскладываются по устройствам:
+
+* split — методы делятся по кругу, порядок внутри устройства сохраняется;
+* all   — полный набор на каждом устройстве (матрица совместимости).
+
+Если список устройства начинается не с launch_clock_app, часы на нём
+запускает сама сессия (autoLaunch), как это сделал бы тест запуска.
+
+Результаты сводятся в один отчёт, как в main() из test_clock.py.
+
+    python parallel_runner.py --device emulator-5554 --device emulator-5556:8205
+"""
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from session_manager import SessionManager
+from test_clock import SimpleClockTester
+from test_config import TestConfig
+
+logger = logging.getLogger(__name__)
+
+BASE_SYSTEM_PORT = 8200
+MODES = ("split", "all")
+
+
+class Device(NamedTuple):
+    name: str
+    udid: str
+    system_port: int
+
+    def capabilities(self) -> Dict[str, Any]:
+        return {"udid": self.udid, "systemPort": self.system_port, "deviceName": self.name}
+
+
+class DeviceResult(NamedTuple):
+    device: Device
+    results: Dict[str, Any]
+    seconds: float
+    waited: float  # суммарно в ожиданиях
+
+
+def parse_device(spec: str, index: int) -> Device:
+    """'udid' или 'udid:systemPort'"""
+    udid, _, port = spec.partition(":")
+    return Device(udid, udid, int(port) if port else BASE_SYSTEM_PORT + index)
+
+
+def configured_devices() -> List[Device]:
+    return [Device(d.get("name", d["udid"]), d["udid"], d.get("systemPort", BASE_SYSTEM_PORT + i))
+            for i, d in enumerate(TestConfig.DEVICES)]
+
+
+def assign(tests: Iterable[str], devices: List[Device], mode: str = "split") -> Dict[Device, List[str]]:
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode} (expected one of {MODES})")
+    if len({d.system_port for d in devices}) != len(devices):
+        raise ValueError("Every device needs its own systemPort")
+    tests = list(tests)
+    if mode == "all":
+        return {device: list(tests) for device in devices}
+    plan: Dict[Device, List[str]] = {device: [] for device in devices}
+    for i, name in enumerate(tests):
+        plan[devices[i % len(devices)]].append(name)
+    return plan
+
+
+def run_on_device(device: Device, tests: List[str], server_url: str) -> DeviceResult:
+    start = time.perf_counter()
+    logger.info(f"[{device.name}] running {len(tests)} tests: {', '.join(tests)}")
+    tester = SimpleClockTester(SessionManager(server_url), capabilities=device.capabilities())
+    try:
+        results = tester.run_tests(tests)
+    except Exception as e:
+        logger.error(f"[{device.name}] runner error: {e}")
+        results = {"error": str(e)}
+    finally:
+        tester.sessions.close()
+    waited = tester.waits.log.waited if tester.waits else 0.0
+    return DeviceResult(device, results, time.perf_counter() - start, waited)
+
+
+def run_parallel(devices: List[Device], tests: Optional[Iterable[str]] = None,
+                 mode: str = "split",
+                 server_url: str = TestConfig.APPIUM_SERVER_URL) -> List[DeviceResult]:
+    plan = assign(SimpleClockTester.TESTS if tests is None else tests, devices, mode)
+    plan = {device: names for device, names in plan.items() if names}
+    with ThreadPoolExecutor(max_workers=len(plan) or 1) as pool:
+        futures = [pool.submit(run_on_device, device, names, server_url)
+                   for device, names in plan.items()]
+        return [future.result() for future in futures]
+
+
+def merge(device_results: List[DeviceResult]) -> Dict[str, Dict[str, Any]]:
+    """test -> {устройство: результат}; ошибка подключения — под ключом error"""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for dr in device_results:
+        for name, result in dr.results.items():
+            merged.setdefault(name, {})[dr.device.name] = result
+    order = list(SimpleClockTester.TESTS)
+    return dict(sorted(merged.items(),
+                       key=lambda kv: order.index(kv[0]) if kv[0] in order else len(order)))
+
+
+def print_report(device_results: List[DeviceResult], wall_seconds: float):
+    merged = merge(device_results)
+
+    print("\n" + "="*60)
+    print("MULTI-DEVICE CLOCK APP TESTING SUMMARY REPORT")
+    print("="*60)
+
+    for test_name, per_device in merged.items():
+        for device, result in per_device.items():
+            if isinstance(result, bool):
+                status = "PASSED" if result else "FAILED"
+            else:
+                status = f"ERROR: {result}"
+            print(f"{test_name:30} {status:8} {device}")
+
+    print("-"*60)
+    for dr in device_results:
+        print(f"{dr.device.name:30} {dr.seconds:6.1f}s (waits {dr.waited:.1f}s)")
+    serial = sum(dr.seconds for dr in device_results)
+    print(f"{'wall clock':30} {wall_seconds:6.1f}s (one after another: {serial:.1f}s)")
+
+    results = [r for per_device in merged.values() for r in per_device.values()]
+    passed = sum(1 for r in results if r is True)
+    print(f"{'passed':30} {passed}/{len(results)}")
+    print("="*60)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run Clock tests on several devices at once")
+    parser.add_argument("--device", action="append", default=[],
+                        help="udid[:systemPort]; by default TestConfig.DEVICES")
+    parser.add_argument("--mode", choices=MODES, default="split")
+    parser.add_argument("--server", default=TestConfig.APPIUM_SERVER_URL)
+    parser.add_argument("--test", action="append", choices=list(SimpleClockTester.TESTS),
+                        help="only these tests (repeatable)")
+    args = parser.parse_args(argv)
+
+    devices = [parse_device(spec, i) for i, spec in enumerate(args.device)] or configured_devices()
+    logger.info(f"Starting Clock tests on {len(devices)} devices ({args.mode})")
+
+    start = time.perf_counter()
+    device_results = run_parallel(devices, args.test, args.mode, args.server)
+    print_report(device_results, time.perf_counter() - start)
+
+    ok = all(r is True for dr in device_results for r in dr.results.values())
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    exit(main())
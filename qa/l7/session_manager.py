@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Менеджер сессий Appium: тёплые сессии вместо webdriver.Remote на каждый тест
+
+Новая сессия — это секунды на запуск UiAutomator2. Здесь сессии
+создаются по конфигурации из TestConfig.get_app_config и после теста
+возвращаются в пул своего набора capabilities. Перед выдачей сессия
+проверяется (жива ли), а состояние приложения сбрасывается через
+terminate_app/activate_app (или кнопку Home для сессий без автозапуска),
+а не пересозданием сессии. Мёртвая сессия выбрасывается, вместо неё
+создаётся новая.
+
+    manager = SessionManager()
+    with manager.session("clock") as driver:
+        ...
+    manager.close()
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from test_config import TestConfig
+
+logger = logging.getLogger(__name__)
+
+KEYCODE_HOME = 3
+
+Factory = Callable[[str, Dict[str, Any]], Any]
+
+
+def remote_factory(server_url: str, capabilities: Dict[str, Any]):
+    """Новая сессия UiAutomator2 на Appium-сервере"""
+    from appium import webdriver
+    from appium.options.android import UiAutomator2Options
+
+    options = UiAutomator2Options().load_capabilities(capabilities)
+    return webdriver.Remote(server_url, options=options)
+
+
+def capabilities_key(capabilities: Dict[str, Any]) -> str:
+    return json.dumps(capabilities, sort_keys=True, default=str)
+
+
+class SessionManager:
+    """Пул тёплых сессий Appium по наборам capabilities"""
+
+    def __init__(self, server_url: str = TestConfig.APPIUM_SERVER_URL,
+                 max_per_config: int = 1, factory: Factory = remote_factory):
+        self.server_url = server_url
+        self.max_per_config = max_per_config
+        self.factory = factory
+        self._idle: Dict[str, List[Any]] = defaultdict(list)
+        self._caps: Dict[int, Dict[str, Any]] = {}  # id(driver) -> capabilities
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "reused": 0, "discarded": 0, "startup_seconds": 0.0}
+
+    @staticmethod
+    def capabilities(app_name: Optional[str] = "clock", launch: bool = True,
+                     **overrides: Any) -> Dict[str, Any]:
+        """Конфигурация приложения; launch=False — сессия стартует на рабочем столе"""
+        caps = TestConfig.get_app_config(app_name) if app_name else TestConfig.ANDROID_CONFIG.copy()
+        caps.pop("description", None)
+        if not launch:
+            caps["autoLaunch"] = False
+        caps.update(overrides)
+        return caps
+
+    # --- выдача и возврат ---
+
+    def acquire(self, app_name: Optional[str] = "clock", launch: bool = True,
+                **overrides: Any):
+        """Сессия с приложением в исходном состоянии: тёплая из пула или новая"""
+        caps = self.capabilities(app_name, launch, **overrides)
+        key = capabilities_key(caps)
+        while True:
+            with self._lock:
+                driver = self._idle[key].pop() if self._idle[key] else None
+            if driver is None:
+                return self._create(caps)
+            if self.is_healthy(driver):
+                try:
+                    self.reset(driver, caps)
+                except Exception as e:
+                    logger.warning(f"Session {driver.session_id} reset failed: {e}")
+                else:
+                    self.stats["reused"] += 1
+                    logger.info(f"Reusing warm session {driver.session_id}")
+                    return driver
+            self._discard(driver)
+
+    def release(self, driver):
+        """Вернуть сессию в пул; лишние сверх max_per_config закрываются"""
+        caps = self._caps.get(id(driver))
+        if caps is None:
+            self._quit(driver)
+            return
+        key = capabilities_key(caps)
+        with self._lock:
+            if len(self._idle[key]) < self.max_per_config:
+                self._idle[key].append(driver)
+                return
+        self._discard(driver)
+
+    @contextmanager
+    def session(self, app_name: Optional[str] = "clock", launch: bool = True,
+                **overrides: Any) -> Iterator[Any]:
+        driver = self.acquire(app_name, launch, **overrides)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        with self._lock:
+            drivers = [d for idle in self._idle.values() for d in idle]
+            self._idle.clear()
+        for driver in drivers:
+            self._caps.pop(id(driver), None)
+            self._quit(driver)
+
+    # --- сессии ---
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """Сессия отвечает: один лёгкий запрос к UiAutomator2"""
+        try:
+            driver.current_package
+            return True
+        except Exception as e:
+            logger.warning(f"Session {getattr(driver, 'session_id', '?')} is dead: {e}")
+            return False
+
+    @staticmethod
+    def reset(driver, caps: Dict[str, Any]):
+        """Приложение под тестом — заново с главного экрана, без новой сессии"""
+        package = caps.get("appPackage")
+        if package:
+            driver.terminate_app(package)
+        if package and caps.get("autoLaunch", True):
+            driver.activate_app(package)
+        else:
+            driver.press_keycode(KEYCODE_HOME)
+
+    def _create(self, caps: Dict[str, Any]):
+        start = time.perf_counter()
+        driver = self.factory(self.server_url, caps)
+        elapsed = time.perf_counter() - start
+        self._caps[id(driver)] = caps
+        self.stats["created"] += 1
+        self.stats["startup_seconds"] += elapsed
+        logger.info(f"Created session {driver.session_id} in {elapsed:.2f}s")
+        return driver
+
+    def _discard(self, driver):
+        self._caps.pop(id(driver), None)
+        self.stats["discarded"] += 1
+        self._quit(driver)
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"sessions created: {s['created']} ({s['startup_seconds']:.1f}s startup), "
+                f"reused: {s['reused']}, discarded: {s['discarded']}")
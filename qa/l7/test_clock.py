@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 
-import time
 import logging
-from typing import Optional
+from typing import Any, Dict, Iterable, Optional
 from appium import webdriver
-from appium.options.android import UiAutomator2Options
 from appium.webdriver.common.appiumby import AppiumBy
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
+from session_manager import SessionManager
+from ui_index import UiIndex
+from waits import Waiter, activity_contains, element_present, orientation_is, ui_settled
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -20,25 +22,32 @@ logger = logging.getLogger(__name__)
 
 
 class SimpleClockTester:
-    def __init__(self):
+    # имя результата -> метод; порядок — порядок прогона
+    TESTS = {
+        "launch_clock_app": "test_launch_clock_app",
+        "interface_elements": "test_clock_interface_elements",
+        "alarm_tab_interaction": "test_alarm_tab_interaction",
+        "gesture_interactions": "test_gesture_interactions",
+        "screen_orientation": "test_screen_orientation",
+    }
+    # остальные тесты ждут открытые часы: без него Clock запускает сама сессия
+    LAUNCH_TEST = "launch_clock_app"
+    
+    def __init__(self, sessions: Optional[SessionManager] = None,
+                 capabilities: Optional[Dict[str, Any]] = None):
         self.driver: Optional[webdriver.Remote] = None
-        self.appium_server_url = "http://127.0.0.1:4723"
+        self.waits: Optional[Waiter] = None
+        # свой менеджер закрывается в cleanup, переданный — остаётся тёплым
+        self.owns_sessions = sessions is None
+        self.sessions = sessions or SessionManager()
+        # поверх конфигурации clock: udid, systemPort конкретного устройства
+        self.capabilities = capabilities or {}
         
-    def setup_driver(self) -> bool:
+    def setup_driver(self, launch: bool = False) -> bool:
         try:
-            desired_caps = {
-                "platformName": "Android",
-                "automationName": "UiAutomator2",
-                "deviceName": "Android Emulator",
-                "noReset": True,
-                "newCommandTimeout": 60,
-                "autoGrantPermissions": True,
-                "unicodeKeyboard": True,
-                "resetKeyboard": True
-            }
-            
-            options = UiAutomator2Options().load_capabilities(desired_caps)
-            self.driver = webdriver.Remote(self.appium_server_url, options=options)
+            # тест 1 запускает Clock с рабочего стола, поэтому по умолчанию без автозапуска
+            self.driver = self.sessions.acquire("clock", launch=launch, **self.capabilities)
+            self.waits = Waiter(self.driver)
             
             logger.info("Successfully connected to Appium server")
             return True
@@ -51,19 +60,20 @@ class SimpleClockTester:
         try:
             logger.info("Test 1: Launch Clock app from launcher")
             
-            time.sleep(3)
-            
             try:
-                clock_app = self.driver.find_element(
-                    AppiumBy.XPATH, 
-                    "//android.widget.TextView[@text='Clock']"
+                clock_app = self.waits.until(
+                    element_present(AppiumBy.XPATH, "//android.widget.TextView[@text='Clock']"),
+                    "Clock icon on launcher", replaced=3
                 )
                 clock_app.click()
                 logger.info("Clicked Clock app icon")
                 
-                time.sleep(5)
-                
-                current_activity = self.driver.current_activity
+                try:
+                    current_activity = self.waits.until(
+                        activity_contains("deskclock"), "Clock activity started", replaced=5
+                    )
+                except TimeoutException:
+                    current_activity = self.driver.current_activity
                 logger.info(f"Current activity after launch: {current_activity}")
                 
                 if "deskclock" in current_activity.lower():
@@ -73,7 +83,7 @@ class SimpleClockTester:
                     logger.warning("Clock app may not have launched properly")
                     return True
                     
-            except NoSuchElementException:
+            except (NoSuchElementException, TimeoutException):
                 logger.warning("Could not find Clock app icon")
                 return False
                 
@@ -85,19 +95,15 @@ class SimpleClockTester:
         try:
             logger.info("Test 2: Check Clock interface elements")
             
-            time.sleep(3)
-            
             try:
-                all_text_views = self.driver.find_elements(
-                    AppiumBy.XPATH, 
-                    "//android.widget.TextView"
-                )
+                # экран перестал меняться; снимок page_source вместо .text на каждом TextView
+                screen = self.waits.until(ui_settled(), "Clock screen settled", replaced=3)
+                all_texts = screen.texts("android.widget.TextView")
                 
-                logger.info(f"Found {len(all_text_views)} text views")
+                logger.info(f"Found {len(all_texts)} text views")
                 
                 clock_tabs = []
-                for tv in all_text_views:
-                    text = tv.text
+                for text in all_texts:
                     if text in ["Alarm", "World clock", "Stopwatch", "Timer", "Clock"]:
                         clock_tabs.append(text)
                         logger.info(f"Found clock tab: {text}")
@@ -129,24 +135,22 @@ class SimpleClockTester:
                 alarm_tab.click()
                 logger.info("Clicked Alarm tab")
                 
-                time.sleep(2)
-                
                 try:
-                    add_alarm_button = self.driver.find_element(
-                        AppiumBy.XPATH, 
-                        "//android.widget.ImageButton[@content-desc='Add alarm']"
+                    # кнопки может и не быть: ждём не дольше прежнего sleep
+                    add_alarm_button = self.waits.until(
+                        element_present(AppiumBy.XPATH,
+                                        "//android.widget.ImageButton[@content-desc='Add alarm']"),
+                        "Add alarm button", timeout=2, replaced=2
                     )
                     logger.info("Found Add alarm button")
                     
                     add_alarm_button.click()
                     logger.info("Clicked Add alarm button")
                     
-                    time.sleep(2)
-                    
                     try:
-                        cancel_button = self.driver.find_element(
-                            AppiumBy.XPATH, 
-                            "//android.widget.Button[@text='Cancel']"
+                        cancel_button = self.waits.until(
+                            element_present(AppiumBy.XPATH, "//android.widget.Button[@text='Cancel']"),
+                            "Cancel button in alarm dialog", timeout=2, replaced=2
                         )
                         cancel_button.click()
                         logger.info("Clicked Cancel button")
@@ -154,12 +158,12 @@ class SimpleClockTester:
                         logger.info("Alarm tab interaction successful")
                         return True
                         
-                    except NoSuchElementException:
+                    except (NoSuchElementException, TimeoutException):
                         logger.warning("Could not find Cancel button")
                         self.driver.back()
                         return True
                         
-                except NoSuchElementException:
+                except (NoSuchElementException, TimeoutException):
                     logger.warning("Could not find Add alarm button")
                     return True
                     
@@ -176,23 +180,18 @@ class SimpleClockTester:
             logger.info("Test 4: Gesture interactions")
             
             try:
-                clickable_elements = self.driver.find_elements(
-                    AppiumBy.XPATH, 
-                    "//android.widget.TextView[@clickable='true']"
-                )
+                # координаты берём из снимка экрана, без location/size
+                screen = UiIndex.from_driver(self.driver)
+                clickable_elements = screen.select("//android.widget.TextView[@clickable='true']")
                 
                 if clickable_elements:
-                    element = clickable_elements[0]
-                    location = element.location
-                    size = element.size
-                    
-                    center_x = location['x'] + size['width'] // 2
-                    center_y = location['y'] + size['height'] // 2
-                    
-                    self.driver.tap([(center_x, center_y)], 1000)
+                    self.driver.tap([clickable_elements[0].center], 1000)
                     logger.info("Performed long press on element")
                     
-                    time.sleep(1)
+                    try:
+                        self.waits.until(ui_settled(), "UI settled after long press", replaced=1)
+                    except TimeoutException:
+                        logger.warning("UI kept changing after long press")
                     
                     logger.info("Gesture interactions successful")
                     return True
@@ -220,7 +219,8 @@ class SimpleClockTester:
                 self.driver.orientation = new_orientation
                 logger.info(f"Rotated to {new_orientation}")
                 
-                time.sleep(3)
+                self.waits.until(orientation_is(new_orientation), f"Rotated to {new_orientation}",
+                                 replaced=3)
                 
                 self.driver.orientation = current_orientation
                 logger.info(f"Rotated back to {current_orientation}")
@@ -237,23 +237,25 @@ class SimpleClockTester:
             return False
     
     def run_all_tests(self) -> dict:
+        return self.run_tests(self.TESTS)
+    
+    def run_tests(self, names: Iterable[str]) -> dict:
         results = {}
+        names = list(names)
         
-        if not self.setup_driver():
+        if not self.setup_driver(launch=names[:1] != [self.LAUNCH_TEST]):
             logger.error("Failed to setup driver")
             return {"error": "Failed to setup driver"}
         
         try:
-            results["launch_clock_app"] = self.test_launch_clock_app()
-            results["interface_elements"] = self.test_clock_interface_elements()
-            results["alarm_tab_interaction"] = self.test_alarm_tab_interaction()
-            results["gesture_interactions"] = self.test_gesture_interactions()
-            results["screen_orientation"] = self.test_screen_orientation()
+            for name in names:
+                results[name] = getattr(self, self.TESTS[name])()
             
             passed = sum(results.values())
             total = len(results)
             
             logger.info(f"Simple Clock test results: {passed}/{total} tests passed")
+            logger.info("Waits (real time vs replaced sleep):\n" + self.waits.log.report())
             
             if passed == total:
                 logger.info("All Simple Clock tests passed successfully!")
@@ -267,11 +269,12 @@ class SimpleClockTester:
     
     def cleanup(self):
         if self.driver:
-            try:
-                self.driver.quit()
-                logger.info("Driver closed")
-            except Exception as e:
-                logger.error(f"Error closing driver: {e}")
+            self.sessions.release(self.driver)
+            self.driver = None
+            logger.info("Session released")
+        if self.owns_sessions:
+            self.sessions.close()
+            logger.info(self.sessions.summary())
 
 
 def main():
@@ -290,6 +293,10 @@ def main():
             print(f"{test_name:30} {status}")
     
     print("="*60)
+    
+    if tester.waits and tester.waits.log.records:
+        print("\nWAITS: REAL DURATION VS REPLACED SLEEP")
+        print(tester.waits.log.report())
 
 
 if __name__ == "__main__":
@@ -32,6 +32,16 @@ class TestConfig:
             "appPackage": "com.google.android.deskclock",
             "appActivity": ".DeskClock",
             "description": "Clock - приложение часов"
+        },
+        "google_keep": {
+            "appPackage": "com.google.android.keep",
+            "appActivity": ".activities.BrowseActivity",
+            "description": "Google Keep - заметки"
+        },
+        "calculator": {
+            "appPackage": "com.google.android.calculator",
+            "appActivity": "com.android.calculator2.Calculator",
+            "description": "Calculator - калькулятор"
         }
     }
     
@@ -42,6 +52,13 @@ class TestConfig:
         "startup_timeout": 60
     }
     
+    # Устройства для параллельного прогона (parallel_runner.py):
+    # у каждого свой udid и свой systemPort UiAutomator2
+    DEVICES = [
+        {"name": "emulator-5554", "udid": "emulator-5554", "systemPort": 8200},
+        {"name": "emulator-5556", "udid": "emulator-5556", "systemPort": 8201},
+    ]
+    
     # Настройки логирования
     LOGGING_CONFIG = {
         "level": "INFO",
@@ -6,8 +6,9 @@
 import time
 import logging
 from typing import Optional
-from appium import webdriver
-from appium.options.android import UiAutomator2Options
+
+from session_manager import SessionManager
+from test_config import TestConfig
 
 # Настройка логирования
 logging.basicConfig(
@@ -20,25 +21,13 @@ logger = logging.getLogger(__name__)
 def test_driver_creation():
     """Тест создания драйвера Appium"""
     driver = None
+    sessions = SessionManager()
     
     try:
         logger.info("🔍 Тест создания драйвера Appium")
         
         # Настройки для подключения
-        desired_caps = {
-            "platformName": "Android",
-            "automationName": "UiAutomator2",
-            "deviceName": "Android Emulator",
-            "appPackage": "com.google.android.keep",
-            "appActivity": ".activities.BrowseActivity",
-            "noReset": True,
-            "newCommandTimeout": 60,
-            "autoGrantPermissions": True,
-            "unicodeKeyboard": True,
-            "resetKeyboard": True
-        }
-        
-        options = UiAutomator2Options().load_capabilities(desired_caps)
+        desired_caps = SessionManager.capabilities("google_keep")
         
         logger.info("✅ Конфигурация драйвера создана успешно")
         logger.info(f"Platform: {desired_caps['platformName']}")
@@ -49,7 +38,7 @@ def test_driver_creation():
         logger.info("🔗 Попытка подключения к Appium серверу...")
         
         try:
-            driver = webdriver.Remote("http://127.0.0.1:4723", options=options)
+            driver = sessions.acquire("google_keep")
             logger.info("✅ Драйвер создан успешно!")
             
             # Если дошли до сюда, значит устройство подключено
@@ -73,11 +62,10 @@ def test_driver_creation():
         
     finally:
         if driver:
-            try:
-                driver.quit()
-                logger.info("✅ Драйвер закрыт")
-            except:
-                pass
+            sessions.release(driver)
+        sessions.close()
+        if driver:
+            logger.info("✅ Драйвер закрыт")
 
 
 def test_appium_server_connection():
@@ -87,7 +75,7 @@ def test_appium_server_connection():
         
         import requests
         
-        response = requests.get("http://127.0.0.1:4723/status", timeout=5)
+        response = requests.get(f"{TestConfig.APPIUM_SERVER_URL}/status", timeout=5)
         
         if response.status_code == 200:
             data = response.json()
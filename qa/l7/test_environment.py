@@ -90,7 +90,8 @@ class EnvironmentTester:
             import requests
             
             # Проверяем доступность сервера
-            response = requests.get("http://127.0.0.1:4723/status", timeout=5)
+            from test_config import TestConfig
+            response = requests.get(f"{TestConfig.APPIUM_SERVER_URL}/status", timeout=5)
             
             if response.status_code == 200:
                 data = response.json()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Тесты фейкового Appium-сервера: сценарий часов целиком, без эмулятора
+"""
+
+import pytest
+from appium.webdriver.common.appiumby import AppiumBy
+from selenium.common.exceptions import (InvalidSelectorException, NoSuchElementException,
+                                        StaleElementReferenceException)
+
+import test_driver_creation
+from fake_appium import CLOCK_PACKAGE, clock_server, run_clock
+from session_manager import SessionManager
+from test_config import TestConfig
+from test_environment import EnvironmentTester
+from ui_index import UiIndex
+
+
+@pytest.fixture
+def server():
+    with clock_server() as server:
+        yield server
+
+
+@pytest.fixture
+def driver(server):
+    sessions = SessionManager(server.url)
+    driver = sessions.acquire("clock", launch=False)
+    yield driver
+    sessions.release(driver)
+    sessions.close()
+
+
+def test_clock_suite_passes_against_fake(server):
+    results = run_clock(server)
+    assert results == {name: True for name in results} and len(results) == 5
+    assert server.commands["mobile: terminateApp"] == 0  # одна свежая сессия
+
+
+def test_page_source_is_appium_format(driver):
+    source = driver.page_source
+    assert '<hierarchy index="0" class="hierarchy" rotation="0" width="1080" height="2400">' in source
+    assert "<node" not in source
+    # те же узлы, что в записанном дампе, только теги — классы
+    dump = UiIndex.from_file("window_dump.xml")
+    assert [n._replace(index=0) for n in UiIndex.from_source(source)] == \
+        [n._replace(index=0) for n in dump]
+
+
+def test_locator_strategies(driver):
+    assert driver.find_element(AppiumBy.XPATH, "//android.widget.TextView[@text='Gmail']").text == "Gmail"
+    lens = driver.find_element(AppiumBy.ACCESSIBILITY_ID, "Google Lens")
+    assert lens.get_attribute("resource-id").endswith(":id/lens_icon")
+    assert lens.get_attribute("clickable") == "true"
+    assert driver.find_element(AppiumBy.ID, "hotseat").rect == {
+        "x": 0, "y": 1873, "width": 1080, "height": 527}
+    assert len(driver.find_elements(AppiumBy.CLASS_NAME, "android.widget.TextView")) == 9
+    with pytest.raises(NoSuchElementException):
+        driver.find_element(AppiumBy.XPATH, "//android.widget.Button[@text='Cancel']")
+    # XPath вычисляется целиком, как на сервере, а не только //class[@attr='v']
+    assert driver.find_element(AppiumBy.XPATH, "//*[contains(@text, 'Cl')]").text == "Clock"
+    assert driver.find_element(AppiumBy.XPATH, "//*[@text='Gmail']/..").rect == {
+        "x": 67, "y": 94, "width": 946, "height": 1598}
+    assert len(driver.find_elements(AppiumBy.XPATH, "//node")) == 0
+    with pytest.raises(InvalidSelectorException):
+        driver.find_element(AppiumBy.XPATH, "//*[@text=")
+    with pytest.raises(InvalidSelectorException):
+        driver.find_element(AppiumBy.XPATH, "count(//*)")
+
+
+def test_click_navigates_and_old_elements_go_stale(driver):
+    icon = driver.find_element(AppiumBy.XPATH, "//android.widget.TextView[@text='Clock']")
+    icon.click()
+    assert driver.current_package == CLOCK_PACKAGE
+    assert driver.current_activity == ".DeskClock"
+    with pytest.raises(StaleElementReferenceException):
+        icon.text
+    driver.find_element(AppiumBy.ACCESSIBILITY_ID, "Add alarm").click()
+    assert driver.find_element(AppiumBy.XPATH, "//android.widget.Button[@text='OK']")
+    driver.back()
+    assert driver.find_elements(AppiumBy.ACCESSIBILITY_ID, "Add alarm")
+
+
+def test_orientation_is_remembered(driver):
+    assert driver.orientation == "PORTRAIT"
+    driver.orientation = "LANDSCAPE"
+    assert driver.orientation == "LANDSCAPE"
+
+
+def test_connection_checks_use_fake(server, monkeypatch):
+    tester = EnvironmentTester()
+    assert tester.test_config_loading()
+    monkeypatch.setattr(TestConfig, "APPIUM_SERVER_URL", server.url)
+    assert test_driver_creation.test_appium_server_connection()
+    assert tester.test_appium_server_connection()
+
+
+def test_parallel_devices_against_fake(server):
+    from parallel_runner import Device, merge, run_parallel
+
+    devices = [Device("emulator-5554", "emulator-5554", 8200),
+               Device("emulator-5556", "emulator-5556", 8201)]
+    merged = merge(run_parallel(devices, mode="split", server_url=server.url))
+    assert len(merged) == 5
+    assert all(result is True for per_device in merged.values() for result in per_device.values())
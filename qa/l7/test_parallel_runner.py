@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Тесты параллельного прогона на мок-сервере Appium (без устройств)
+"""
+
+import time
+
+import pytest
+
+from mock_appium import MockAppiumServer
+from parallel_runner import (Device, assign, configured_devices, merge, parse_device,
+                             print_report, run_parallel)
+from test_clock import SimpleClockTester
+
+DEVICES = [Device("emulator-5554", "emulator-5554", 8200),
+           Device("emulator-5556", "emulator-5556", 8201)]
+
+
+def test_split_keeps_order_per_device():
+    plan = assign(SimpleClockTester.TESTS, DEVICES, "split")
+    assert plan[DEVICES[0]] == ["launch_clock_app", "alarm_tab_interaction", "screen_orientation"]
+    assert plan[DEVICES[1]] == ["interface_elements", "gesture_interactions"]
+
+
+def test_all_runs_everything_everywhere():
+    plan = assign(["a", "b"], DEVICES, "all")
+    assert plan == {DEVICES[0]: ["a", "b"], DEVICES[1]: ["a", "b"]}
+
+
+def test_system_ports_must_differ():
+    with pytest.raises(ValueError):
+        assign(["a"], [DEVICES[0], DEVICES[0]._replace(udid="other")])
+
+
+def test_device_specs():
+    assert parse_device("emulator-5556:8205", 1) == Device("emulator-5556", "emulator-5556", 8205)
+    assert parse_device("emulator-5558", 2).system_port == 8202
+    assert len({d.system_port for d in configured_devices()}) == len(configured_devices())
+
+
+def test_devices_run_concurrently_with_own_sessions(capsys):
+    with MockAppiumServer(startup_delay=0.3) as server:
+        start = time.perf_counter()
+        results = run_parallel(DEVICES, ["screen_orientation", "launch_clock_app"], "all",
+                               server.url)
+        elapsed = time.perf_counter() - start
+        created = server.created
+    assert created == 2
+    assert elapsed < 0.3 * 2  # старт сессий перекрывается
+    assert [r.device for r in results] == DEVICES
+
+    merged = merge(results)
+    assert set(merged) == {"screen_orientation", "launch_clock_app"}
+    assert set(merged["screen_orientation"]) == {d.name for d in DEVICES}
+
+    print_report(results, elapsed)
+    out = capsys.readouterr().out
+    assert "MULTI-DEVICE CLOCK APP TESTING SUMMARY REPORT" in out
+    assert out.count("emulator-5556") >= 2
+
+
+def test_sessions_get_device_capabilities():
+    with MockAppiumServer() as server:
+        run_parallel(DEVICES, ["screen_orientation"], "all", server.url)
+    assert sorted((c["udid"], c["systemPort"]) for c in server.started) == [
+        ("emulator-5554", 8200), ("emulator-5556", 8201)]
+
+
+def test_every_device_starts_in_clock():
+    from fake_appium import clock_server
+
+    with clock_server() as server:
+        results = run_parallel(DEVICES, mode="split", server_url=server.url)
+    plan = assign(SimpleClockTester.TESTS, DEVICES, "split")
+    assert plan[DEVICES[1]][0] != SimpleClockTester.LAUNCH_TEST
+    # первое устройство открывает часы тестом запуска, второе — автозапуском сессии
+    launched = {c["udid"]: c.get("autoLaunch", True) for c in server.started}
+    assert launched == {"emulator-5554": False, "emulator-5556": True}
+    assert all(result is True for r in results for result in r.results.values())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Тесты пула сессий Appium на мок-сервере (настоящий Appium-Python-Client, без устройства)
+"""
+
+import time
+
+import pytest
+
+from mock_appium import (LAUNCHER_PACKAGE, NOT_RUNNING, RUNNING_IN_FOREGROUND,
+                         MockAppiumServer)
+from session_manager import SessionManager
+
+CLOCK = "com.google.android.deskclock"
+
+
+@pytest.fixture
+def server():
+    with MockAppiumServer() as server:
+        yield server
+
+
+@pytest.fixture
+def sessions(server):
+    manager = SessionManager(server.url)
+    yield manager
+    manager.close()
+
+
+def test_capabilities_come_from_test_config():
+    caps = SessionManager.capabilities("clock")
+    assert caps["appPackage"] == CLOCK and caps["automationName"] == "UiAutomator2"
+    assert "description" not in caps
+    assert SessionManager.capabilities("clock", launch=False)["autoLaunch"] is False
+    assert "appPackage" not in SessionManager.capabilities(None)
+
+
+def test_session_is_reused_and_app_reset(server, sessions):
+    with sessions.session("clock") as driver:
+        first_id = driver.session_id
+        assert driver.current_package == CLOCK
+        driver.press_keycode(3)  # тест ушёл на рабочий стол
+    with sessions.session("clock") as driver:
+        assert driver.session_id == first_id
+        assert driver.current_package == CLOCK
+        assert driver.query_app_state(CLOCK) == RUNNING_IN_FOREGROUND
+    assert server.created == 1
+    assert server.commands["mobile: terminateApp"] == 1
+    assert server.commands["mobile: activateApp"] == 1
+    assert sessions.stats["reused"] == 1
+
+
+def test_no_launch_session_is_reset_to_launcher(server, sessions):
+    with sessions.session("clock", launch=False) as driver:
+        assert driver.current_package == LAUNCHER_PACKAGE
+        driver.activate_app(CLOCK)
+    with sessions.session("clock", launch=False) as driver:
+        assert driver.current_package == LAUNCHER_PACKAGE
+        assert driver.query_app_state(CLOCK) == NOT_RUNNING
+    assert server.created == 1
+
+
+def test_pool_is_per_capability_set(server, sessions):
+    with sessions.session("clock") as clock, sessions.session("google_keep") as keep:
+        assert clock.session_id != keep.session_id
+    with sessions.session("google_keep") as keep_again:
+        assert keep_again.session_id == keep.session_id
+    assert server.created == 2
+
+
+def test_dead_session_is_replaced(server, sessions):
+    with sessions.session("clock") as driver:
+        dead_id = driver.session_id
+    server.kill_session(dead_id)
+    with sessions.session("clock") as driver:
+        assert driver.session_id != dead_id
+        assert driver.current_package == CLOCK
+    assert sessions.stats["discarded"] == 1 and server.created == 2
+
+
+def test_extra_sessions_are_closed(server):
+    manager = SessionManager(server.url, max_per_config=1)
+    first = manager.acquire("clock")
+    second = manager.acquire("clock")
+    manager.release(first)
+    manager.release(second)
+    assert server.deleted == 1
+    manager.close()
+    assert server.deleted == 2 and not server.sessions
+
+
+def test_warm_session_skips_startup():
+    with MockAppiumServer(startup_delay=0.3) as server:
+        manager = SessionManager(server.url)
+        start = time.perf_counter()
+        for _ in range(3):
+            with manager.session("clock"):
+                pass
+        elapsed = time.perf_counter() - start
+        manager.close()
+    assert server.created == 1
+    assert elapsed < 0.3 * 2
+
+
+def test_handler_error_is_w3c_unknown_error(server, sessions):
+    from selenium.common.exceptions import WebDriverException
+
+    server.mobile("queryAppState", lambda s, a: a["missing"])  # KeyError в обработчике
+    with sessions.session("clock") as driver:
+        with pytest.raises(WebDriverException, match="KeyError"):
+            driver.query_app_state(CLOCK)
+        assert driver.current_package == CLOCK  # сервер отвечает дальше
+    status, payload = server.dispatch("POST", "/session", {"capabilities": None})
+    assert status == 500 and payload["value"]["error"] == "unknown error"
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Тесты индекса иерархии UI на сохранённом дампе window_dump.xml (без устройства)
+"""
+
+import os
+
+import pytest
+
+from ui_index import UiIndex, parse_bounds
+
+DUMP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "window_dump.xml")
+
+
+@pytest.fixture(scope="module")
+def screen():
+    return UiIndex.from_file(DUMP)
+
+
+def test_all_nodes_indexed(screen):
+    assert len(screen) == 33
+    assert screen.nodes[0].parent == -1
+    assert all(screen.nodes[n.parent].depth == n.depth - 1 for n in screen if n.parent >= 0)
+
+
+def test_find_by_text_and_class(screen):
+    clock = screen.find_one(text="Clock", class_name="android.widget.TextView")
+    assert clock.content_desc == "Predicted app: Clock"
+    assert clock.clickable
+    assert clock.center == (910, 1970)
+
+
+def test_find_by_resource_id_and_desc(screen):
+    lens = screen.find(resource_id="com.google.android.apps.nexuslauncher:id/lens_icon")
+    assert [n.content_desc for n in lens] == ["Google Lens"]
+    assert screen.find(content_desc="Google Lens", clickable=False) == []
+
+
+def test_texts_in_document_order(screen):
+    assert screen.texts("android.widget.TextView") == [
+        "Sun, Oct 5", "Play Store", "Gmail", "Photos", "YouTube",
+        "Phone", "Messages", "Chrome", "Clock"]
+    assert screen.texts("android.widget.Button") == []
+
+
+def test_select_matches_find(screen):
+    assert screen.select("//android.widget.TextView[@text='Clock']") == screen.find(
+        class_name="android.widget.TextView", text="Clock")
+    assert len(screen.select("//android.widget.TextView[@clickable='true']")) == 9
+    assert screen.select("//android.widget.ImageButton[@content-desc='Add alarm']") == []
+
+
+def test_select_rejects_complex_xpath(screen):
+    with pytest.raises(ValueError):
+        screen.select("//android.widget.TextView[contains(@text, 'Cl')]")
+
+
+def test_from_source_matches_file(screen):
+    with open(DUMP, encoding="utf-8") as f:
+        assert UiIndex.from_source(f.read()).nodes == screen.nodes
+
+
+def test_tree_navigation(screen):
+    clock = screen.find_one(text="Clock")
+    hotseat = screen.find_one(resource_id="com.google.android.apps.nexuslauncher:id/hotseat")
+    assert hotseat in screen.ancestors(clock)
+    assert clock in screen.children(screen.nodes[clock.parent])
+
+
+def test_parse_bounds():
+    assert parse_bounds("[0,63][1080,2337]") == (0, 63, 1080, 2337)
+    assert parse_bounds("") == (0, 0, 0, 0)
+
+
+# page_source Appium UiAutomator2 (Clock, вкладка Alarm): теги — классы, у корня class="hierarchy"
+APPIUM_SOURCE = """<?xml version='1.0' encoding='UTF-8' standalone='yes' ?>
+<hierarchy index="0" class="hierarchy" rotatable="true" width="1080" height="2337" rotation="0">
+  <android.widget.FrameLayout index="0" package="com.google.android.deskclock" class="android.widget.FrameLayout" text="" checkable="false" checked="false" clickable="false" enabled="true" focusable="false" focused="false" long-clickable="false" password="false" scrollable="false" selected="false" bounds="[0,0][1080,2337]" displayed="true" a11y-important="false" screen-reader-focusable="false" drawing-order="0" showing-hint="false" text-entry-key="false" dismissable="false" a11y-focused="false" heading="false" live-region="0" context-clickable="false" content-invalid="false">
+    <android.widget.LinearLayout index="0" package="com.google.android.deskclock" class="android.widget.LinearLayout" text="" resource-id="com.google.android.deskclock:id/desk_clock_pager_container" checkable="false" checked="false" clickable="false" enabled="true" focusable="false" focused="false" long-clickable="false" password="false" scrollable="false" selected="false" bounds="[0,63][1080,2337]" displayed="true" a11y-important="true" drawing-order="1">
+      <android.widget.ImageButton index="0" package="com.google.android.deskclock" class="android.widget.ImageButton" text="" content-desc="Add alarm" resource-id="com.google.android.deskclock:id/fab" checkable="false" checked="false" clickable="true" enabled="true" focusable="true" focused="false" long-clickable="false" password="false" scrollable="false" selected="false" bounds="[414,1967][666,2156]" displayed="true" a11y-important="true" drawing-order="3" />
+      <android.widget.FrameLayout index="1" package="com.google.android.deskclock" class="android.widget.FrameLayout" text="" content-desc="Alarm" checkable="false" checked="false" clickable="true" enabled="true" focusable="true" focused="false" long-clickable="false" password="false" scrollable="false" selected="true" bounds="[0,2211][216,2337]" displayed="true" a11y-important="true" drawing-order="4">
+        <android.widget.TextView index="0" package="com.google.android.deskclock" class="android.widget.TextView" text="Alarm" resource-id="com.google.android.deskclock:id/navigation_bar_item_large_label_view" checkable="false" checked="false" clickable="false" enabled="true" focusable="false" focused="false" long-clickable="false" password="false" scrollable="false" selected="true" bounds="[62,2288][154,2330]" displayed="true" a11y-important="true" drawing-order="2" />
+      </android.widget.FrameLayout>
+      <android.widget.FrameLayout index="2" package="com.google.android.deskclock" class="android.widget.FrameLayout" text="" content-desc="Clock" checkable="false" checked="false" clickable="true" enabled="true" focusable="true" focused="false" long-clickable="false" password="false" scrollable="false" selected="false" bounds="[216,2211][432,2337]" displayed="true" a11y-important="true" drawing-order="5">
+        <android.widget.TextView index="0" package="com.google.android.deskclock" class="android.widget.TextView" text="Clock" resource-id="com.google.android.deskclock:id/navigation_bar_item_large_label_view" checkable="false" checked="false" clickable="false" enabled="true" focusable="false" focused="false" long-clickable="false" password="false" scrollable="false" selected="false" bounds="[278,2288][370,2330]" displayed="true" a11y-important="true" drawing-order="2" />
+      </android.widget.FrameLayout>
+    </android.widget.LinearLayout>
+  </android.widget.FrameLayout>
+</hierarchy>"""
+
+
+def test_appium_page_source():
+    screen = UiIndex.from_source(APPIUM_SOURCE)
+    assert len(screen) == 7  # корень <hierarchy> не узел
+    assert screen.nodes[0].class_name == "android.widget.FrameLayout"
+    assert screen.nodes[0].parent == -1
+    assert screen.texts("android.widget.TextView") == ["Alarm", "Clock"]
+    fab, = screen.select("//android.widget.ImageButton[@content-desc='Add alarm']")
+    assert fab.clickable and fab.center == (540, 2061)
+    alarm = screen.find_one(text="Alarm")
+    assert screen.nodes[alarm.parent].content_desc == "Alarm"
+    assert screen.find_one(content_desc="Clock", selected=False).bounds == (216, 2211, 432, 2337)
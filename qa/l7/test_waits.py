@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Тесты ожиданий по условию на фейковом драйвере (без устройства)
+"""
+
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+
+from waits import Waiter, WaitLog, activity_contains, element_present, orientation_is, ui_settled
+
+
+class FakeDriver:
+    """Состояние экрана меняется через заданное число опросов"""
+
+    def __init__(self, ready_after=3):
+        self.ready_after = ready_after
+        self.polls = 0
+        self.orientation = "PORTRAIT"
+
+    def _tick(self):
+        self.polls += 1
+        return self.polls >= self.ready_after
+
+    @property
+    def current_activity(self):
+        return ".DeskClock" if self._tick() else ".NexusLauncherActivity"
+
+    def find_elements(self, by, value):
+        return ["element"] if self._tick() else []
+
+    def find_element(self, by, value):
+        if not self._tick():
+            raise NoSuchElementException(value)
+        return "element"
+
+    @property
+    def page_source(self):
+        done = self._tick()
+        return ('<hierarchy><node class="android.widget.TextView" text="%s"/></hierarchy>'
+                % ("Alarm" if done else "loading %d" % self.polls))
+
+
+def fast_waiter(driver, **kwargs):
+    return Waiter(driver, timeout=kwargs.pop("timeout", 1.0), poll=0.001, max_poll=0.01, **kwargs)
+
+
+def test_activity_wait_returns_activity():
+    waits = fast_waiter(FakeDriver(ready_after=3))
+    assert waits.until(activity_contains("deskclock"), "clock") == ".DeskClock"
+    record, = waits.log.records
+    assert record.ok and record.attempts == 3
+
+
+def test_element_present_and_ignored_exceptions():
+    driver = FakeDriver(ready_after=2)
+    waits = fast_waiter(driver)
+    assert waits.until(element_present("xpath", "//x"), "element") == "element"
+    # NoSuchElementException из условия считается «ещё нет»
+    assert waits.until(lambda d: d.find_element("xpath", "//x"), "find_element") == "element"
+
+
+def test_ui_settled_needs_identical_snapshots():
+    driver = FakeDriver(ready_after=3)
+    waits = fast_waiter(driver)
+    screen = waits.until(ui_settled(), "settled")
+    assert screen.texts() == ["Alarm"]
+    assert driver.polls == 4  # loading 1, loading 2, Alarm, Alarm
+
+
+def test_timeout_is_logged_and_raised():
+    driver = FakeDriver()
+    waits = fast_waiter(driver, timeout=0.05)
+    start = time.monotonic()
+    with pytest.raises(TimeoutException):
+        waits.until(orientation_is("LANDSCAPE"), "rotate", replaced=3)
+    assert time.monotonic() - start < 0.5
+    record, = waits.log.records
+    assert not record.ok and record.replaced == 3 and record.attempts > 1
+
+
+def test_backoff_grows_poll_interval(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("waits.time.sleep", sleeps.append)
+    waits = Waiter(FakeDriver(ready_after=6), timeout=100, poll=0.1, max_poll=0.3, backoff=2)
+    waits.until(activity_contains("deskclock"), "clock")
+    assert sleeps == [0.1, 0.2, 0.3, 0.3, 0.3]
+
+
+def test_report_lists_real_time_next_to_sleep():
+    log = WaitLog()
+    waits = fast_waiter(FakeDriver(ready_after=1), log=log)
+    waits.until(activity_contains("deskclock"), "Clock activity started", replaced=5)
+    waits.until(activity_contains("deskclock"), "no sleep before")
+    report = log.report().splitlines()
+    assert report[1].startswith("Clock activity started") and " 5.0 " in report[1]
+    assert " - " in report[2]
+    assert report[-1].startswith("total") and log.replaced == 5
+
+
+def appium_source(texts):
+    """page_source в формате Appium UiAutomator2: теги — классы элементов"""
+    views = "".join(
+        f'<android.widget.TextView index="{i}" class="android.widget.TextView" text="{t}" '
+        f'clickable="false" bounds="[0,{i * 100}][1080,{i * 100 + 100}]" displayed="true" />'
+        for i, t in enumerate(texts))
+    return ('<?xml version="1.0" encoding="UTF-8"?><hierarchy index="0" class="hierarchy" rotation="0">'
+            '<android.widget.FrameLayout index="0" class="android.widget.FrameLayout" '
+            f'bounds="[0,0][1080,2337]">{views}</android.widget.FrameLayout></hierarchy>')
+
+
+class ChangingScreenDriver:
+    """Экран Clock дорисовывается по кадрам, потом замирает"""
+
+    def __init__(self, frames):
+        self.frames = frames
+        self.polls = 0
+
+    @property
+    def page_source(self):
+        frame = self.frames[min(self.polls, len(self.frames) - 1)]
+        self.polls += 1
+        return frame
+
+
+def test_ui_settled_on_appium_source():
+    empty = '<hierarchy index="0" class="hierarchy" rotation="0"></hierarchy>'
+    driver = ChangingScreenDriver([empty, empty, appium_source(["Alarm"]),
+                                   appium_source(["Alarm", "Clock", "Timer"])])
+    screen = fast_waiter(driver).until(ui_settled(), "settled")
+    # два пустых снимка подряд — ещё не экран; ждём, пока перестанут меняться элементы
+    assert driver.polls == 5
+    assert screen.texts("android.widget.TextView") == ["Alarm", "Clock", "Timer"]
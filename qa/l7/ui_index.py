@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Индекс иерархии UI: снимок экрана разбирается локально
+
+driver.find_element / element.text — по HTTP-запросу к Appium на каждый
+элемент. Здесь экран забирается одним запросом (driver.page_source) или
+читается из сохранённого дампа (adb shell uiautomator dump ->
+window_dump.xml). Понимаются оба формата: у дампа все теги <node>, у
+page_source Appium тег называется по классу элемента. Снимок разбирается
+потоковым парсером (iterparse) в плоский список узлов и индексируется по
+text, resource-id, class и content-desc.
+Поиск и сбор текстов дальше идут без обращений к устройству.
+
+Снимок отражает экран на момент съёмки: после клика или перехода его
+нужно снять заново.
+"""
+
+import io
+import re
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+Bounds = Tuple[int, int, int, int]
+
+_BOUNDS_RE = re.compile(r"\[(-?\d+),(-?\d+)\]\[(-?\d+),(-?\d+)\]")
+
+# //android.widget.TextView[@text='Clock' and @clickable='true']
+_XPATH_RE = re.compile(r"^//([\w.*]+)(?:\[(.+)\])?$")
+_XPATH_COND_RE = re.compile(r"^@([\w-]+)\s*=\s*(?:'([^']*)'|\"([^\"]*)\")$")
+
+# атрибуты дампа -> поля UiNode
+_FIELDS = {
+    "class": "class_name",
+    "text": "text",
+    "resource-id": "resource_id",
+    "content-desc": "content_desc",
+    "package": "package",
+    "bounds": "bounds",
+    "clickable": "clickable",
+    "enabled": "enabled",
+    "checked": "checked",
+    "selected": "selected",
+}
+_FLAGS = ("clickable", "enabled", "checked", "selected")
+_INDEXED = ("text", "resource_id", "class_name", "content_desc")
+
+
+class UiNode(NamedTuple):
+    """Узел иерархии; parent — номер родителя в UiIndex.nodes (-1 у корня)"""
+    index: int
+    parent: int
+    depth: int
+    class_name: str
+    text: str
+    resource_id: str
+    content_desc: str
+    package: str
+    bounds: Bounds
+    clickable: bool
+    enabled: bool
+    checked: bool
+    selected: bool
+
+    @property
+    def center(self) -> Tuple[int, int]:
+        """Точка для driver.tap"""
+        left, top, right, bottom = self.bounds
+        return (left + right) // 2, (top + bottom) // 2
+
+
+def _is_ui_node(elem) -> bool:
+    """Узел UI в обоих форматах: <node class=...> из uiautomator dump и
+    <android.widget.TextView class=...> из page_source Appium (UiAutomator2).
+    Корень <hierarchy> (у Appium с class="hierarchy") узлом не считается."""
+    if elem.tag == "hierarchy":
+        return False
+    return elem.tag == "node" or "class" in elem.attrib
+
+
+def parse_bounds(value: str) -> Bounds:
+    match = _BOUNDS_RE.match(value or "")
+    if not match:
+        return (0, 0, 0, 0)
+    return tuple(int(v) for v in match.groups())
+
+
+class UiIndex:
+    """Плоский список узлов в порядке документа и индексы по атрибутам"""
+
+    def __init__(self, nodes: List[UiNode]):
+        self.nodes = nodes
+        self._index: Dict[str, Dict[str, List[int]]] = {name: defaultdict(list) for name in _INDEXED}
+        for node in nodes:
+            for name in _INDEXED:
+                value = getattr(node, name)
+                if value:
+                    self._index[name][value].append(node.index)
+
+    # --- загрузка ---
+
+    @classmethod
+    def parse(cls, stream) -> "UiIndex":
+        """Потоковый разбор дампа: stream — файл или путь"""
+        nodes: List[UiNode] = []
+        stack: List[int] = []
+        strings: Dict[str, str] = {}  # одинаковые class/package хранятся один раз
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if not _is_ui_node(elem):
+                continue
+            if event == "end":
+                stack.pop()
+                elem.clear()
+                continue
+            attrs = elem.attrib
+            values = {}
+            for attr, field in _FIELDS.items():
+                value = attrs.get(attr, "")
+                if field == "class_name" and not value:
+                    value = elem.tag  # в page_source Appium тег — это класс
+                if field in _FLAGS:
+                    values[field] = value == "true"
+                elif field == "bounds":
+                    values[field] = parse_bounds(value)
+                else:
+                    values[field] = strings.setdefault(value, value)
+            index = len(nodes)
+            nodes.append(UiNode(index=index, parent=stack[-1] if stack else -1,
+                                depth=len(stack), **values))
+            stack.append(index)
+        return cls(nodes)
+
+    @classmethod
+    def from_file(cls, path: str) -> "UiIndex":
+        with open(path, "rb") as f:
+            return cls.parse(f)
+
+    @classmethod
+    def from_source(cls, source) -> "UiIndex":
+        """Из строки page_source (str или bytes)"""
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        return cls.parse(io.BytesIO(source))
+
+    @classmethod
+    def from_driver(cls, driver) -> "UiIndex":
+        """Снимок текущего экрана: один запрос page_source"""
+        return cls.from_source(driver.page_source)
+
+    # --- поиск ---
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[UiNode]:
+        return iter(self.nodes)
+
+    def find(self, text: Optional[str] = None, resource_id: Optional[str] = None,
+             class_name: Optional[str] = None, content_desc: Optional[str] = None,
+             **flags: bool) -> List[UiNode]:
+        """Узлы, у которых совпадают все заданные атрибуты, в порядке документа.
+
+        flags — clickable/enabled/checked/selected=True|False.
+        """
+        unknown = set(flags) - set(_FLAGS)
+        if unknown:
+            raise ValueError(f"Unknown node flags: {sorted(unknown)}")
+        wanted = {"text": text, "resource_id": resource_id,
+                  "class_name": class_name, "content_desc": content_desc}
+        candidates = None
+        # начинаем с самого короткого списка из индексов
+        for name, value in sorted(((n, v) for n, v in wanted.items() if v is not None),
+                                  key=lambda nv: len(self._index[nv[0]].get(nv[1], ()))):
+            hits = self._index[name].get(value, ())
+            if candidates is None:
+                candidates = list(hits)
+            else:
+                hits = set(hits)
+                candidates = [i for i in candidates if i in hits]
+            if not candidates:
+                return []
+        nodes = self.nodes if candidates is None else [self.nodes[i] for i in candidates]
+        return [node for node in nodes
+                if all(getattr(node, flag) == expected for flag, expected in flags.items())]
+
+    def find_one(self, **criteria) -> Optional[UiNode]:
+        found = self.find(**criteria)
+        return found[0] if found else None
+
+    def select(self, xpath: str) -> List[UiNode]:
+        """Простые XPath вида //class[@attr='value' and ...] (как в test_clock.py)"""
+        match = _XPATH_RE.match(xpath.strip())
+        if not match:
+            raise ValueError(f"Unsupported XPath: {xpath}")
+        class_name, predicate = match.groups()
+        criteria = {} if class_name in ("*", "node") else {"class_name": class_name}
+        for condition in (predicate.split(" and ") if predicate else ()):
+            cond = _XPATH_COND_RE.match(condition.strip())
+            if not cond:
+                raise ValueError(f"Unsupported XPath condition: {condition}")
+            attr, single, double = cond.groups()
+            field = _FIELDS.get(attr)
+            if field is None or field == "bounds":
+                raise ValueError(f"Unsupported XPath attribute: @{attr}")
+            value = single if single is not None else double
+            criteria[field] = value == "true" if field in _FLAGS else value
+        return self.find(**criteria)
+
+    def texts(self, class_name: Optional[str] = None) -> List[str]:
+        """Все непустые тексты экрана (или узлов одного класса) одним проходом"""
+        if class_name is None:
+            return [node.text for node in self.nodes if node.text]
+        return [self.nodes[i].text for i in self._index["class_name"].get(class_name, ())
+                if self.nodes[i].text]
+
+    def children(self, node: UiNode) -> List[UiNode]:
+        return [n for n in self.nodes[node.index + 1:] if n.parent == node.index]
+
+    def ancestors(self, node: UiNode) -> List[UiNode]:
+        result = []
+        while node.parent >= 0:
+            node = self.nodes[node.parent]
+            result.append(node)
+        return result
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Ожидания по условию вместо фиксированных time.sleep
+
+Waiter.until(condition) опрашивает условие, увеличивая паузу между
+опросами (poll * backoff, не больше max_poll), пока оно не вернёт
+истинное значение или не истечёт timeout (TimeoutException). Каждое
+ожидание записывается в журнал: сколько оно заняло на самом деле и какой
+sleep заменило — WaitLog.report() выводит их рядом.
+
+Условия — функции от драйвера: activity_contains, element_present,
+orientation_is, ui_settled.
+"""
+
+import hashlib
+import logging
+import time
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from test_config import TestConfig
+from ui_index import UiIndex
+
+logger = logging.getLogger(__name__)
+
+Condition = Callable[[Any], Any]
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+DEFAULT_POLL = 0.1      # первая пауза между опросами, с
+DEFAULT_MAX_POLL = 1.0  # пауза растёт до этого значения, с
+DEFAULT_BACKOFF = 1.5
+
+
+class WaitRecord(NamedTuple):
+    name: str
+    seconds: float
+    attempts: int
+    replaced: Optional[float]  # заменённый sleep, с
+    ok: bool
+
+
+class WaitLog:
+    """Журнал ожиданий одного прогона"""
+
+    def __init__(self):
+        self.records: List[WaitRecord] = []
+
+    def add(self, record: WaitRecord):
+        self.records.append(record)
+
+    @property
+    def waited(self) -> float:
+        return sum(r.seconds for r in self.records)
+
+    @property
+    def replaced(self) -> float:
+        return sum(r.replaced for r in self.records if r.replaced is not None)
+
+    def report(self) -> str:
+        """Таблица: реальная длительность каждого ожидания и заменённый sleep"""
+        lines = [f"{'wait':<40} {'real s':>7} {'sleep s':>8} {'polls':>6}  result"]
+        for r in self.records:
+            sleep = f"{r.replaced:.1f}" if r.replaced is not None else "-"
+            lines.append(f"{r.name:<40} {r.seconds:>7.2f} {sleep:>8} {r.attempts:>6}  "
+                         f"{'ok' if r.ok else 'timeout'}")
+        lines.append(f"{'total':<40} {self.waited:>7.2f} {self.replaced:>8.1f}")
+        return "\n".join(lines)
+
+
+class Waiter:
+    """Опрос условия с нарастающей паузой и общим дедлайном"""
+
+    def __init__(self, driver, timeout: Optional[float] = None, poll: float = DEFAULT_POLL,
+                 max_poll: float = DEFAULT_MAX_POLL, backoff: float = DEFAULT_BACKOFF,
+                 log: Optional[WaitLog] = None):
+        self.driver = driver
+        self.timeout = TestConfig.TEST_CONFIG["wait_timeout"] if timeout is None else timeout
+        self.poll = poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.log = WaitLog() if log is None else log
+
+    def until(self, condition: Condition, name: str, timeout: Optional[float] = None,
+              replaced: Optional[float] = None) -> Any:
+        """Значение condition(driver), как только оно истинно.
+
+        replaced — сколько секунд спал код до замены (для отчёта).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        delay = self.poll
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                value = condition(self.driver)
+            except IGNORED_EXCEPTIONS:
+                value = None
+            now = time.monotonic()
+            if value or now >= deadline:
+                ok = bool(value)
+                self.log.add(WaitRecord(name, now - start, attempts, replaced, ok))
+                logger.info(f"Wait '{name}': {'ok' if ok else 'timeout'} after {now - start:.2f}s "
+                            f"({attempts} polls)")
+                if not ok:
+                    raise TimeoutException(f"Wait '{name}' timed out after {timeout}s")
+                return value
+            time.sleep(min(delay, deadline - now))
+            delay = min(delay * self.backoff, self.max_poll)
+
+
+# --- условия ---
+
+def activity_contains(fragment: str) -> Condition:
+    """Текущая activity содержит fragment (без учёта регистра)"""
+    def condition(driver):
+        activity = driver.current_activity or ""
+        return activity if fragment.lower() in activity.lower() else None
+    return condition
+
+
+def element_present(by: str, value: str) -> Condition:
+    """Первый найденный элемент; find_elements не ждёт implicit wait впустую"""
+    def condition(driver):
+        elements = driver.find_elements(by, value)
+        return elements[0] if elements else None
+    return condition
+
+
+def orientation_is(orientation: str) -> Condition:
+    def condition(driver):
+        return driver.orientation == orientation
+    return condition
+
+
+def ui_settled(stable: int = 2) -> Condition:
+    """Экран перестал меняться: stable одинаковых page_source подряд.
+
+    Возвращает UiIndex последнего снимка — его можно сразу использовать.
+    Снимок без единого элемента (экран ещё не отрисован) не считается.
+    """
+    state = {"digest": None, "same": 0}
+
+    def condition(driver):
+        source = driver.page_source
+        digest = hashlib.sha1(source.encode("utf-8")).digest()
+        state["same"] = state["same"] + 1 if digest == state["digest"] else 1
+        state["digest"] = digest
+        if state["same"] < stable:
+            return None
+        screen = UiIndex.from_source(source)
+        return screen if len(screen) else None
+    return condition
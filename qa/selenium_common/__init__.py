@@ -0,0 +1,7 @@
+# selenium_common/__init__.py
+"""Общее для Selenium-лаб (l3, l4): пул браузеров, раскладка тестов по
+воркерам xdist, кэш найденных элементов и pytest-плагин с фикстурами
+driver_pool/driver (selenium_common.plugin).
+
+Лабы подключают пакет через pythonpath в pytest.ini (каталог qa/).
+"""
@@ -0,0 +1,151 @@
+# selenium_common/driver_pool.py
+"""Пул браузеров на всю сессию pytest.
+
+Запуск Chrome + chromedriver стоит секунды, а сам тест часто меньше.
+Поэтому браузеры создаются один раз и переиспользуются: между тестами
+у браузера закрываются лишние окна, чистятся cookies, localStorage и
+sessionStorage, открывается about:blank. Упавший браузер (сессия не
+отвечает) выбрасывается и при следующей выдаче запускается новый.
+"""
+import functools
+import os
+import queue
+import threading
+import time
+
+from selenium.common.exceptions import NoAlertPresentException
+from webdriver_manager.chrome import ChromeDriverManager
+
+CLEAR_STORAGE_JS = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def chromedriver_path():
+    """Путь к chromedriver: webdriver-manager опрашивается один раз за процесс.
+
+    CHROMEDRIVER_PATH позволяет вообще обойтись без webdriver-manager.
+    """
+    return os.getenv("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+
+
+def reset(driver):
+    """Вернуть браузер в чистое состояние между тестами."""
+    try:
+        driver.switch_to.alert.dismiss()  # тест мог упасть с открытым alert
+    except NoAlertPresentException:
+        pass
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    # storage чистится только у текущего origin, поэтому до about:blank
+    driver.execute_script(CLEAR_STORAGE_JS)
+    driver.delete_all_cookies()
+    if hasattr(driver, "execute_cdp_cmd"):
+        # delete_all_cookies видит только текущий домен, CDP — все
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.get("about:blank")
+
+
+def is_alive(driver):
+    try:
+        driver.current_window_handle
+        return True
+    except Exception:
+        # упавший chromedriver даёт не только WebDriverException,
+        # но и ошибки соединения urllib3
+        return False
+
+
+def quit_quietly(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class DriverPool:
+    """До size браузеров, создаваемых по требованию через factory().
+
+    reuse=False — старое поведение (новый браузер на каждый тест),
+    оставлено для сравнения времени прогона.
+    """
+
+    def __init__(self, factory, size=1, reuse=True):
+        self.factory = factory
+        self.size = size
+        self.reuse = reuse
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._drivers = []
+        self.stats = {"started": 0, "restarted": 0, "reused": 0, "startup_seconds": 0.0}
+
+    def _start(self):
+        start = time.perf_counter()
+        try:
+            driver = self.factory()
+        except BaseException:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+            self.stats["started"] += 1
+            self.stats["startup_seconds"] += time.perf_counter() - start
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._drivers.remove(driver)
+        quit_quietly(driver)
+
+    def acquire(self, timeout=None):
+        """Свободный браузер из пула; если все заняты и пул полон — ждём."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    room = len(self._drivers) < self.size
+                    if room:
+                        self._drivers.append(None)  # место занято, браузер запускается
+                if room:
+                    return self._start()
+                driver = self._idle.get(timeout=timeout)
+            if is_alive(driver):
+                self.stats["reused"] += 1
+                return driver
+            self.stats["restarted"] += 1
+            self._discard(driver)
+
+    def release(self, driver):
+        if not self.reuse:
+            self._discard(driver)
+            return
+        try:
+            reset(driver)
+        except Exception:
+            self._discard(driver)  # не отвечает — при следующей выдаче запустим новый
+            return
+        self._idle.put(driver)
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            if driver is not None:
+                quit_quietly(driver)
+        self._idle = queue.LifoQueue()
+
+    def summary(self):
+        return summarize(self.stats)
+
+
+def summarize(stats):
+    """Строка для отчёта; stats — DriverPool.stats или их сумма по воркерам."""
+    return (f"браузеров запущено: {stats['started']} (из них перезапусков: {stats['restarted']}), "
+            f"переиспользований: {stats['reused']}, на запуск ушло {stats['startup_seconds']:.1f} с")
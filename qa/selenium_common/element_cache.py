@@ -0,0 +1,61 @@
+from collections import Counter
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+# Сумма счётчиков всех кэшей процесса — для сводки в конце прогона
+TOTALS = Counter()
+
+
+class ElementCache:
+    """Найденные элементы страницы по локатору.
+
+    Повторный поиск того же локатора не идёт в браузер. Если элемент
+    устарел (перерисовка, переход), действие получает
+    StaleElementReferenceException — тогда элемент ищется заново и
+    действие повторяется один раз. После перехода на другую страницу
+    кэш нужно сбросить (clear), это делают open()/open_page().
+
+    stats: hits — найдено в кэше (сэкономлен round trip), misses — искали
+    в браузере, reresolves — кэшированный элемент оказался устаревшим.
+    """
+
+    def __init__(self):
+        self._elements = {}
+        self.stats = Counter(hits=0, misses=0, reresolves=0)
+
+    def _count(self, key):
+        self.stats[key] += 1
+        TOTALS[key] += 1
+
+    def get(self, locator, resolve):
+        """Элемент по локатору: из кэша или resolve(locator)."""
+        element = self._elements.get(locator)
+        if element is not None:
+            self._count("hits")
+            return element
+        self._count("misses")
+        element = self._elements[locator] = resolve(locator)
+        return element
+
+    def use(self, locator, resolve, action):
+        """action(элемент); устаревший элемент ищется заново."""
+        try:
+            return action(self.get(locator, resolve))
+        except StaleElementReferenceException:
+            self._count("reresolves")
+            element = self._elements[locator] = resolve(locator)
+            return action(element)
+
+    def forget(self, locator):
+        self._elements.pop(locator, None)
+
+    def clear(self):
+        self._elements.clear()
+
+
+def summary(stats=None):
+    """Строка для отчёта по счётчикам одного кэша или TOTALS."""
+    stats = TOTALS if stats is None else stats
+    saved = stats["hits"] - stats["reresolves"]
+    return (f"элементы: из кэша {stats['hits']}, поиском {stats['misses']}, "
+            f"устарели {stats['reresolves']}; сэкономлено round trips: {saved}")
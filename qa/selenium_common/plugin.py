@@ -0,0 +1,104 @@
+# selenium_common/plugin.py
+"""pytest-плагин Selenium-лаб: опции --drivers/--headless, фикстуры
+driver_pool (браузеры на всю сессию) и driver (браузер на тест),
+раскладка тестов по воркерам xdist (sharding.py) и сводка пула и кэша
+элементов в конце прогона, собранная со всех воркеров.
+
+Лаба подключает его в своём conftest.py:
+
+    pytest_plugins = ["selenium_common.plugin"]
+
+и объявляет фикстуру driver_factory — функцию make_driver(headless)
+со своими опциями Chrome.
+"""
+import os
+from collections import Counter
+
+import pytest
+
+from selenium_common import element_cache
+from selenium_common.driver_pool import DriverPool, summarize
+from selenium_common.sharding import ShardingPlugin, is_xdist_worker
+
+POOL_KEY = pytest.StashKey[DriverPool]()
+WORKER_STATS_KEY = pytest.StashKey[list]()
+WORKER_CACHE_KEY = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--drivers", type=int, default=int(os.getenv("DRIVER_POOL_SIZE", "1")),
+        help="сколько браузеров держать открытыми всю сессию "
+             "(0 — новый браузер на каждый тест, как раньше)",
+    )
+    parser.addoption(
+        "--headless", action="store_true",
+        help="браузер без окна (под pytest-xdist включается сам)",
+    )
+
+
+def pytest_configure(config):
+    # -n N --dist loadgroup: раскладка тестов по воркерам, см. sharding.py
+    config.pluginmanager.register(ShardingPlugin(config), "sharding")
+
+
+@pytest.fixture(scope="session")
+def driver_factory():
+    """make_driver(headless) лабы: переопределяется в её conftest.py."""
+    raise pytest.UsageError(
+        "conftest.py лабы должен объявить фикстуру driver_factory (scope=session)")
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_factory):
+    config = request.config
+    size = config.getoption("--drivers")
+    headless = config.getoption("--headless") or is_xdist_worker(config)
+    pool = DriverPool(lambda: driver_factory(headless), size=max(size, 1), reuse=size > 0)
+    config.stash[POOL_KEY] = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(driver_pool):
+    driver = driver_pool.acquire()
+    yield driver
+    driver_pool.release(driver)
+
+
+# --- сводка: под xdist воркеры отдают статистику главному процессу ---
+
+def pytest_sessionfinish(session):
+    config = session.config
+    if is_xdist_worker(config):
+        pool = config.stash.get(POOL_KEY, None)
+        config.workeroutput["driver_pool"] = pool.stats if pool is not None else None
+        config.workeroutput["element_cache"] = dict(element_cache.TOTALS)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    if output.get("driver_pool"):
+        node.config.stash.setdefault(WORKER_STATS_KEY, []).append(output["driver_pool"])
+    if output.get("element_cache"):
+        node.config.stash.setdefault(WORKER_CACHE_KEY, []).append(output["element_cache"])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    stats = list(config.stash.get(WORKER_STATS_KEY, []))
+    pool = config.stash.get(POOL_KEY, None)
+    if pool is not None:
+        stats.append(pool.stats)
+    if stats:
+        total = {key: sum(s[key] for s in stats) for key in stats[0]}
+        terminalreporter.write_sep("-", "driver pool")
+        workers = f"{len(stats)} процесс(а/ов): " if len(stats) > 1 else ""
+        terminalreporter.write_line(workers + summarize(total))
+    cache = Counter(element_cache.TOTALS)
+    for worker in config.stash.get(WORKER_CACHE_KEY, []):
+        cache.update(worker)
+    if sum(cache.values()):
+        terminalreporter.write_sep("-", "element cache")
+        terminalreporter.write_line(element_cache.summary(cache))
@@ -0,0 +1,109 @@
+# selenium_common/sharding.py
+"""Распределение тестов по воркерам pytest-xdist по прошлым длительностям.
+
+    pytest -n 4 --dist loadgroup
+
+Каждый прогон (и обычный, и параллельный) записывает длительность фазы
+call каждого прошедшего теста в кэш pytest (.pytest_cache, ключ
+sharding/durations): setup с запуском браузера зависит от пула, а упавший
+тест мог оборваться на полпути. При
+параллельном запуске тесты раскладываются на столько шардов, сколько
+воркеров: самые долгие первыми, каждый — в наименее загруженный шард.
+Шард становится группой xdist_group, а --dist loadgroup отдаёт каждую
+группу целиком одному воркеру. Тесты без истории считаются длящимися
+столько же, сколько медианный известный тест.
+
+Изоляция воркеров:
+* воркер — отдельный процесс pytest со своим пулом браузеров
+  (driver_pool); браузеры воркеров — разные процессы Chrome с разными
+  временными профилями, поэтому cookies, localStorage и sessionStorage
+  у них не общие;
+* внутри воркера браузер переиспользуется, но между тестами очищается
+  (driver_pool.reset);
+* при параллельном запуске браузеры стартуют headless.
+Проверяется в l4/lab4-selenium/tests/test_isolation.py.
+"""
+import heapq
+import statistics
+
+import pytest
+
+CACHE_KEY = "sharding/durations"
+DEFAULT_DURATION = 5.0  # с, пока истории нет совсем
+
+
+def is_xdist_worker(config):
+    return hasattr(config, "workerinput")
+
+
+def base_nodeid(nodeid):
+    # --dist loadgroup дописывает к nodeid "@<группа>"
+    return nodeid.split("@")[0]
+
+
+def load_durations(cache):
+    if cache is None:  # -p no:cacheprovider
+        return {}
+    durations = cache.get(CACHE_KEY, {})
+    return durations if isinstance(durations, dict) else {}
+
+
+def assign_shards(nodeids, durations, shards):
+    """nodeid -> номер шарда; суммарные длительности шардов выравниваются
+    жадно (LPT: самые долгие тесты раскладываются первыми)."""
+    known = [durations[n] for n in nodeids if n in durations]
+    default = statistics.median(known) if known else DEFAULT_DURATION
+    order = sorted(nodeids, key=lambda n: (-durations.get(n, default), n))
+    loads = [(0.0, shard) for shard in range(shards)]
+    result = {}
+    for nodeid in order:
+        load, shard = heapq.heappop(loads)
+        result[nodeid] = shard
+        heapq.heappush(loads, (load + durations.get(nodeid, default), shard))
+    return result
+
+
+class DurationRecorder:
+    """Копит длительности прошедших тестов и сливает их с сохранёнными."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.measured = {}
+
+    def add(self, report):
+        # пропущенные и упавшие ничего не говорят о длительности теста
+        if report.when == "call" and report.passed:
+            self.measured[base_nodeid(report.nodeid)] = report.duration
+
+    def save(self):
+        if not self.measured:
+            return
+        durations = load_durations(self.cache)
+        durations.update({n: round(d, 3) for n, d in self.measured.items()})
+        self.cache.set(CACHE_KEY, durations)
+
+
+class ShardingPlugin:
+    def __init__(self, config):
+        self.cache = getattr(config, "cache", None)
+        # отчёты воркеров xdist приходят в главный процесс, пишет только он
+        self.recorder = None
+        if self.cache is not None and not is_xdist_worker(config):
+            self.recorder = DurationRecorder(self.cache)
+
+    def pytest_runtest_logreport(self, report):
+        if self.recorder is not None:
+            self.recorder.add(report)
+
+    def pytest_sessionfinish(self):
+        if self.recorder is not None:
+            self.recorder.save()
+
+    @pytest.hookimpl(tryfirst=True)  # раньше xdist, который читает xdist_group
+    def pytest_collection_modifyitems(self, config, items):
+        if not is_xdist_worker(config) or config.getoption("dist", None) != "loadgroup":
+            return
+        shards = assign_shards([item.nodeid for item in items], load_durations(self.cache),
+                               config.workerinput["workercount"])
+        for item in items:
+            item.add_marker(pytest.mark.xdist_group(f"shard{shards[item.nodeid]}"))